@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+"""Benchmarks de Genesis Core (no forman parte del paquete distribuido)"""
@@ -0,0 +1,75 @@
+# benchmarks/blob_handles.py
+"""
+Micro-benchmark: coste por workflow de pasar la arquitectura a las tareas
+
+Enlaza el workflow con la arquitectura ya conocida (hit de la cache) y
+serializa los params de cada tarea, como haría el transporte hacia los
+agentes. Compara el documento como literal en cada tarea con handles del
+BlobStore: bytes enviados por workflow y tiempo de enlace + serialización.
+
+    python -m benchmarks.blob_handles [--workflows N] [--size-kb N]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from genesis_core.config.project_config import ProjectConfig, StackConfig
+from genesis_core.orchestrator.blob_store import BlobStore
+from genesis_core.orchestrator.workflow_builder import compile_workflow, workflow_key
+
+
+def architecture_document(size_kb: int) -> dict:
+    """Documento de arquitectura sintético de ~size_kb KB"""
+    modules = [
+        {"name": f"module_{n}", "description": "d" * 200, "endpoints": [f"/api/m{n}/{k}" for k in range(8)]}
+        for n in range(max(1, size_kb * 1024 // 400))
+    ]
+    return {"layers": ["api", "web", "worker"], "modules": modules}
+
+
+async def run(config: ProjectConfig, seeded: dict, workflows: int, store) -> tuple:
+    compiled = compile_workflow(*workflow_key(config))
+    config_dict = config.to_dict()
+    sent = 0
+    started = time.perf_counter()
+    for index in range(workflows):
+        workflow_id = f"wf-{index}"
+        params = seeded if store is None else await store.reference_all(workflow_id, seeded)
+        definition = compiled.bind(config_dict, "/tmp/bench", workflow_id, seeded_results=params)
+        sent += sum(len(json.dumps(task.params, default=str)) for task in definition.tasks)
+        if store is not None:
+            await store.release(workflow_id)
+    return time.perf_counter() - started, sent
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workflows", type=int, default=200)
+    parser.add_argument("--size-kb", type=int, default=300)
+    args = parser.parse_args()
+
+    config = ProjectConfig(
+        name="bench-project",
+        components=["backend", "frontend"],
+        features=["authentication", "billing"],
+        stack=StackConfig(backend="fastapi", frontend="nextjs"),
+    )
+    design = architecture_document(args.size_kb)
+    seeded = {"analyze_architecture": {"requirements": []}, "design_architecture": design}
+
+    literal_time, literal_bytes = asyncio.run(run(config, seeded, args.workflows, None))
+    handle_time, handle_bytes = asyncio.run(run(config, seeded, args.workflows, BlobStore()))
+
+    per_workflow = lambda total: total / args.workflows
+    print(f"workflows:          {args.workflows}")
+    print(f"architecture:       {len(json.dumps(design)) / 1024:8.1f} KB")
+    print(f"literal params:     {per_workflow(literal_bytes) / 1024:8.1f} KB/workflow"
+          f"  {per_workflow(literal_time) * 1e3:8.2f} ms/workflow")
+    print(f"blob handles:       {per_workflow(handle_bytes) / 1024:8.1f} KB/workflow"
+          f"  {per_workflow(handle_time) * 1e3:8.2f} ms/workflow")
+
+
+if __name__ == "__main__":
+    main()
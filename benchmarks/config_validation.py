@@ -0,0 +1,93 @@
+# benchmarks/config_validation.py
+"""
+Benchmark: validación masiva de ProjectConfig desde JSONL
+
+Compara el camino del modelo (json.loads + ProjectConfig.from_dict por
+línea) con ConfigValidator: model_validate_json directo sobre la línea,
+sin y con cache de configuraciones ya validadas.
+
+    python -m benchmarks.config_validation [--configs N] [--distinct N] [--invalid R]
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import Callable, List
+
+from pydantic import ValidationError
+
+from genesis_core.config.project_config import ProjectConfig
+from genesis_core.config.validation import ConfigValidator
+
+FEATURES = ["authentication", "billing", "notifications", "search", "analytics"]
+TEMPLATES = ["saas-basic", "microservices", "ai-ready", "e-commerce"]
+
+
+def make_lines(configs: int, distinct: int, invalid: float, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    pool = []
+    for index in range(distinct):
+        config = {
+            "name": f"project-{index}",
+            "template": rng.choice(TEMPLATES),
+            "components": rng.sample(["backend", "frontend", "database"], rng.randint(1, 3)),
+            "features": rng.sample(FEATURES, rng.randint(0, 3)),
+            "stack": {"backend": "fastapi", "frontend": "nextjs"},
+            "metadata": {"owner": f"team-{index % 17}"},
+        }
+        if rng.random() < invalid:
+            config["name"] = f"bad name {index}!"
+        pool.append(json.dumps(config))
+    return [rng.choice(pool) for _ in range(configs)]
+
+
+def via_model(lines: List[str]) -> int:
+    """Referencia: decodificar y construir el modelo en cada línea"""
+    valid = 0
+    for line in lines:
+        try:
+            ProjectConfig.from_dict(json.loads(line))
+            valid += 1
+        except ValidationError:
+            pass
+    return valid
+
+
+def via_validator(max_entries: int) -> Callable[[List[str]], int]:
+    def run(lines: List[str]) -> int:
+        validator = ConfigValidator(max_entries=max_entries)
+        return sum(outcome.valid for outcome in validator.validate_jsonl(lines))
+    return run
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--configs", type=int, default=50_000)
+    parser.add_argument("--distinct", type=int, default=5_000)
+    parser.add_argument("--invalid", type=float, default=0.05, help="fracción de inválidas")
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+
+    lines = make_lines(args.configs, args.distinct, args.invalid, args.seed)
+    print(f"configs: {args.configs}   distinct: {args.distinct}   invalid: {args.invalid:.0%}")
+
+    baseline = None
+    for label, run in (
+        ("model (loads+from_dict)", via_model),
+        ("validate_json, no cache", via_validator(0)),
+        ("validate_json, cached", via_validator(args.distinct)),
+    ):
+        started = time.perf_counter()
+        valid = run(lines)
+        elapsed = time.perf_counter() - started
+        baseline = baseline or elapsed
+        print(
+            f"{label:24} {len(lines) / elapsed:10.0f} configs/s   "
+            f"{elapsed / len(lines) * 1e6:7.2f} us/config   "
+            f"valid {valid}   speedup {baseline / elapsed:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
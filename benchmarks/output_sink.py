@@ -0,0 +1,75 @@
+# benchmarks/output_sink.py
+"""
+Benchmark: escritura de árboles de proyecto con y sin el sink de salida
+
+Genera N proyectos del mismo template: una parte de los archivos es
+común a todos (Dockerfiles, CI, lockfiles) y el resto es propio de cada
+proyecto. Compara escribir cada archivo con fsync propio con
+OutputSink.write (blobs por contenido, enlaces y fsync por lote):
+throughput, ratio de deduplicación y bytes nuevos en disco.
+
+    python -m benchmarks.output_sink [--projects N] [--shared N] [--unique N] [--size-kb N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from genesis_core.orchestrator.output_sink import OutputSink
+
+
+def project_files(index: int, shared: int, unique: int, size: int) -> dict:
+    files = {f"devops/shared_{n}.yml": (b"s%d " % n) * (size // 4) for n in range(shared)}
+    files.update({
+        f"backend/module_{n}.py": (b"p%d-%d " % (index, n)) * (size // 8) for n in range(unique)
+    })
+    return files
+
+
+def write_direct(root: str, files: dict):
+    for path, content in files.items():
+        location = os.path.join(root, path)
+        os.makedirs(os.path.dirname(location), exist_ok=True)
+        with open(location, "wb") as fh:
+            fh.write(content)
+            fh.flush()
+            os.fsync(fh.fileno())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--shared", type=int, default=40)
+    parser.add_argument("--unique", type=int, default=10)
+    parser.add_argument("--size-kb", type=int, default=16)
+    parser.add_argument("--link", choices=("hardlink", "reflink"), default="hardlink")
+    args = parser.parse_args()
+
+    size = args.size_kb * 1024
+    trees = [project_files(n, args.shared, args.unique, size) for n in range(args.projects)]
+    total_bytes = sum(len(content) for files in trees for content in files.values())
+
+    with tempfile.TemporaryDirectory() as workdir:
+        started = time.perf_counter()
+        for index, files in enumerate(trees):
+            write_direct(os.path.join(workdir, "direct", str(index)), files)
+        direct = time.perf_counter() - started
+
+        sink = OutputSink(os.path.join(workdir, "store"), link=args.link)
+        started = time.perf_counter()
+        for index, files in enumerate(trees):
+            sink.write(os.path.join(workdir, "sink", str(index)), files)
+        sunk = time.perf_counter() - started
+
+    stats = sink.stats()
+    mb = total_bytes / 1e6
+    print(f"projects:           {args.projects} x {args.shared + args.unique} files ({mb:.1f} MB)")
+    print(f"direct + fsync:     {mb / direct:8.1f} MB/s  {mb:8.1f} MB on disk")
+    print(f"output sink:        {mb / sunk:8.1f} MB/s  {stats['stored_bytes'] / 1e6:8.1f} MB on disk")
+    print(f"dedup ratio:        {stats['dedup_ratio']:8.1%}")
+    print(f"fsyncs:             {args.projects * (args.shared + args.unique)} -> {stats['fsyncs']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# benchmarks/persistence.py
+"""
+Benchmark: actualizaciones de estado por segundo
+
+Compara StatePersistence (write-behind por lotes) con escritura síncrona
+de una transacción por evento. Cada workflow genera el alta del
+proyecto, el workflow en running, dos transiciones por tarea y el cierre.
+
+    python -m benchmarks.persistence [--workflows N] [--url sqlite:///...]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Dict
+
+from sqlalchemy import create_engine, insert
+
+from genesis_core.state.persistence import (
+    StatePersistence,
+    _upsert,
+    metadata,
+    project_row,
+    projects,
+    task_transitions,
+    workflow_row,
+    workflows,
+)
+
+TASKS = ("analyze_architecture", "design_architecture", "generate_backend",
+         "generate_frontend", "setup_devops")
+
+
+def _states(index: int):
+    created = datetime.utcnow()
+    project = SimpleNamespace(
+        name=f"bench-{index}", template="saas-basic", output_path=f"/tmp/bench/{index}",
+        created_at=created, config={"name": f"bench-{index}"},
+    )
+    workflow = SimpleNamespace(
+        status="running", started_at=created, completed_at=None, error=None,
+    )
+    return project, workflow
+
+
+def _events(workflows_count: int):
+    """(tipo, workflow_id, payload) en el orden en que los emite el orquestador"""
+    for index in range(workflows_count):
+        workflow_id = f"wf-{index}"
+        project, workflow = _states(index)
+        yield "project", workflow_id, project
+        yield "workflow", workflow_id, workflow
+        for task_id in TASKS:
+            yield "task", workflow_id, (task_id, "started")
+            yield "task", workflow_id, (task_id, "completed")
+        workflow.status = "completed"
+        workflow.completed_at = datetime.utcnow()
+        yield "workflow", workflow_id, workflow
+
+
+class SynchronousWriter:
+    """Referencia: una transacción por evento, en el camino del request"""
+
+    def __init__(self, url: str):
+        self.engine = create_engine(url)
+        metadata.create_all(self.engine)
+
+    def write(self, kind: str, workflow_id: str, payload: Any):
+        with self.engine.begin() as conn:
+            if kind == "project":
+                _upsert(conn, projects, [project_row(workflow_id, payload)])
+            elif kind == "workflow":
+                _upsert(conn, workflows, [workflow_row(workflow_id, payload)])
+            else:
+                task_id, status = payload
+                conn.execute(insert(task_transitions), [{
+                    "workflow_id": workflow_id, "task_id": task_id,
+                    "status": status, "at": datetime.utcnow(),
+                }])
+
+
+def bench_sync(url: str, workflows_count: int) -> Dict[str, float]:
+    writer = SynchronousWriter(url)
+    events = list(_events(workflows_count))
+    started = time.perf_counter()
+    for kind, workflow_id, payload in events:
+        writer.write(kind, workflow_id, payload)
+    elapsed = time.perf_counter() - started
+    writer.engine.dispose()
+    return {"events": len(events), "seconds": elapsed, "request_path": elapsed}
+
+
+async def bench_write_behind(url: str, workflows_count: int) -> Dict[str, float]:
+    persistence = StatePersistence(url)
+    await persistence.start()
+    events = list(_events(workflows_count))
+
+    started = time.perf_counter()
+    for position, (kind, workflow_id, payload) in enumerate(events):
+        if kind == "project":
+            persistence.record_project(workflow_id, payload)
+        elif kind == "workflow":
+            persistence.record_workflow(workflow_id, payload)
+        else:
+            persistence.record_task(workflow_id, *payload)
+        # Ceder el loop como lo haría el orquestador entre eventos
+        if position % 100 == 0:
+            await asyncio.sleep(0)
+    request_path = time.perf_counter() - started
+    await persistence.stop()
+    elapsed = time.perf_counter() - started
+
+    return {"events": len(events), "seconds": elapsed, "request_path": request_path}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workflows", type=int, default=2000)
+    parser.add_argument("--url", default=None, help="por defecto, SQLite temporal")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        def url(name: str) -> str:
+            return args.url or f"sqlite:///{os.path.join(directory, name)}"
+
+        sync = bench_sync(url("sync.db"), args.workflows)
+        behind = asyncio.run(bench_write_behind(url("behind.db"), args.workflows))
+
+    for label, result in (("synchronous", sync), ("write-behind", behind)):
+        print(
+            f"{label:13} {result['events'] / result['seconds']:12.0f} updates/s   "
+            f"request path {result['request_path'] / result['events'] * 1e6:8.2f} us/update"
+        )
+    print(f"speedup       {sync['seconds'] / behind['seconds']:12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
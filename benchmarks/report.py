@@ -0,0 +1,103 @@
+# benchmarks/report.py
+"""
+Informes de escenarios y comparación contra una línea base
+
+Un informe es un dict plano serializable a JSON. compare() marca como
+regresión cualquier métrica que empeore más que la tolerancia relativa
+respecto de la línea base del mismo escenario.
+"""
+
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+# Métricas comparables y si "más alto" es mejor
+_DIRECTIONS: Dict[str, bool] = {
+    "throughput": True,
+    "latency_p50": False,
+    "latency_p99": False,
+    "loop_lag_p99": False,
+    "loop_lag_max": False,
+    "peak_bytes_per_workflow": False,
+    "retained_bytes_per_workflow": False,
+    "success_rate": True,
+}
+
+
+@dataclass
+class ScenarioReport:
+    """Resultado de un escenario"""
+    scenario: str
+    workflows: int
+    succeeded: int
+    failed: int
+    wall_time: float
+    throughput: float
+    latency_p50: float
+    latency_p99: float
+    loop_lag_p50: float
+    loop_lag_p99: float
+    loop_lag_max: float
+    peak_bytes_per_workflow: Optional[float] = None
+    retained_bytes_per_workflow: Optional[float] = None
+    parameters: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def success_rate(self) -> float:
+        return self.succeeded / self.workflows if self.workflows else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "success_rate": self.success_rate}
+
+    def format(self) -> str:
+        lines = [
+            f"scenario:        {self.scenario}",
+            f"workflows:       {self.workflows} ({self.succeeded} ok, {self.failed} failed)",
+            f"wall time:       {self.wall_time:10.3f} s",
+            f"throughput:      {self.throughput:10.2f} workflows/s",
+            f"latency p50/p99: {self.latency_p50 * 1e3:10.2f} / {self.latency_p99 * 1e3:.2f} ms",
+            f"loop lag p50/p99/max: {self.loop_lag_p50 * 1e3:.2f} / "
+            f"{self.loop_lag_p99 * 1e3:.2f} / {self.loop_lag_max * 1e3:.2f} ms",
+        ]
+        if self.peak_bytes_per_workflow is not None:
+            lines.append(
+                f"memory/workflow: {self.peak_bytes_per_workflow / 1024:10.1f} KiB peak, "
+                f"{self.retained_bytes_per_workflow / 1024:.1f} KiB retained"
+            )
+        return "\n".join(lines)
+
+
+def save(reports: List[ScenarioReport], path: str):
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump({report.scenario: report.to_dict() for report in reports}, fh, indent=2)
+
+
+def load(path: str) -> Dict[str, Dict[str, Any]]:
+    with open(path, "r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def compare(
+    report: ScenarioReport, baseline: Dict[str, Any], tolerance: float = 0.2
+) -> List[str]:
+    """Regresiones de report frente a baseline (dict de to_dict())"""
+    if baseline.get("parameters") != report.parameters:
+        return [
+            f"{report.scenario}: parameters differ from baseline, "
+            f"results are not comparable"
+        ]
+
+    current = report.to_dict()
+    regressions = []
+    for metric, higher_is_better in _DIRECTIONS.items():
+        before, after = baseline.get(metric), current.get(metric)
+        if before is None or after is None or before == 0:
+            continue
+        change = (after - before) / abs(before)
+        worse = -change if higher_is_better else change
+        if worse > tolerance:
+            regressions.append(
+                f"{report.scenario}: {metric} {before:.6g} -> {after:.6g} "
+                f"({change:+.1%}, tolerance {tolerance:.0%})"
+            )
+    return regressions
@@ -0,0 +1,97 @@
+# benchmarks/run.py
+"""
+Benchmarks de orquestación con MCPturbo simulado
+
+    python -m benchmarks.run [--scenario single|concurrent|soak|all]
+                             [--baseline baseline.json] [--save out.json]
+
+Con --baseline termina con código 1 si alguna métrica empeora más que
+--tolerance respecto del mismo escenario en la línea base.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from benchmarks import report as reports
+from benchmarks.scenarios import concurrent, single, soak
+from benchmarks.simulated_mcpturbo import LatencyDistribution, SimulatedMCPturbo
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scenario", choices=["single", "concurrent", "soak", "all"], default="all")
+    parser.add_argument("--workflows", type=int, default=None,
+                        help="workflows para single (50) / concurrent (1000)")
+    parser.add_argument("--duration", type=float, default=60.0, help="segundos de soak")
+    parser.add_argument("--rate", type=float, default=50.0, help="llegadas/s en soak")
+    parser.add_argument("--time-scale", type=float, default=1.0,
+                        help="multiplicador de la latencia simulada de los agentes")
+    parser.add_argument("--latency", default=None,
+                        help='latencia para todos los agentes, "kind:a[:b]"')
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--capacity", type=int, default=None, help="capacidad por agente")
+    parser.add_argument("--instances", type=int, default=1, help="instancias por tipo de agente")
+    parser.add_argument("--straggler-rate", type=float, default=0.0,
+                        help="fracción de llamadas rezagadas")
+    parser.add_argument("--straggler-factor", type=float, default=20.0,
+                        help="multiplicador de latencia de una llamada rezagada")
+    parser.add_argument("--hedging", action="store_true", help="activar hedging de tareas")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--no-memory", action="store_true", help="sin tracemalloc")
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument("--save", default=None)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    def backend() -> SimulatedMCPturbo:
+        simulated = SimulatedMCPturbo(
+            time_scale=args.time_scale, seed=args.seed, instances=args.instances
+        )
+        for profile in simulated.profiles.values():
+            if args.latency:
+                profile.latency = LatencyDistribution.parse(args.latency)
+            if args.capacity:
+                profile.capacity = args.capacity
+            profile.failure_rate = args.failure_rate
+            profile.straggler_rate = args.straggler_rate
+            profile.straggler_factor = args.straggler_factor
+        return simulated
+
+    config = {"hedging_enabled": True} if args.hedging else None
+    memory = not args.no_memory
+    selected = ["single", "concurrent", "soak"] if args.scenario == "all" else [args.scenario]
+    results = []
+    for name in selected:
+        if name == "single":
+            run = single(backend(), args.workflows or 50, measure_memory=memory, config=config)
+        elif name == "concurrent":
+            run = concurrent(
+                backend(), args.workflows or 1000, measure_memory=memory, config=config
+            )
+        else:
+            run = soak(backend(), args.duration, args.rate, measure_memory=memory, config=config)
+        result = asyncio.run(run)
+        results.append(result)
+        print(result.format())
+        print()
+
+    if args.save:
+        reports.save(results, args.save)
+
+    if args.baseline:
+        baseline = reports.load(args.baseline)
+        regressions = [
+            regression
+            for result in results if result.scenario in baseline
+            for regression in reports.compare(result, baseline[result.scenario], args.tolerance)
+        ]
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print("no regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
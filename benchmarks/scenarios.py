@@ -0,0 +1,208 @@
+# benchmarks/scenarios.py
+"""
+Escenarios de benchmark sobre CoreOrchestrator + MCPturbo simulado
+
+- single: workflows de uno en uno (overhead por workflow sin contención)
+- concurrent: N workflows lanzados a la vez (1000 por defecto)
+- soak: llegadas a ritmo constante durante un tiempo (fugas, deriva)
+
+Cada escenario mide throughput, latencia p50/p99 (execution_time de
+GenerationResult), lag del event loop y, opcionalmente, memoria por
+workflow con tracemalloc (que encarece los tiempos: comparar siempre con
+la misma opción).
+"""
+
+import asyncio
+import gc
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from genesis_core.config.orchestrator_config import OrchestratorConfig
+from genesis_core.config.project_config import ProjectConfig, StackConfig
+from genesis_core.orchestrator.admission import percentile
+from genesis_core.orchestrator.core_orchestrator import (
+    CoreOrchestrator,
+    GenerationRequest,
+    GenerationResult,
+)
+
+from benchmarks.report import ScenarioReport
+from benchmarks.simulated_mcpturbo import SimulatedMCPturbo
+
+
+class LoopLagMonitor:
+    """Retraso del event loop: cuánto tarda en despertar un sleep(interval)"""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        self._task = asyncio.ensure_future(self._sample())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _sample(self):
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, time.monotonic() - expected))
+
+
+def make_request(index: int) -> GenerationRequest:
+    """Request distinto por índice (sin aciertos de la cache de arquitectura)"""
+    return GenerationRequest(
+        project_config=ProjectConfig(
+            name=f"bench-{index}",
+            components=["backend", "frontend"],
+            features=["authentication"],
+            stack=StackConfig(backend="fastapi", frontend="nextjs"),
+        ),
+        output_path=f"/tmp/genesis-bench/{index}",
+    )
+
+
+def make_orchestrator(
+    backend: SimulatedMCPturbo, max_in_flight: int, config: Optional[Dict[str, Any]] = None
+) -> CoreOrchestrator:
+    config = OrchestratorConfig(**{
+        "max_in_flight_workflows": max_in_flight,
+        "admission_queue_depth": max_in_flight,
+        "parallelism_global_budget": max_in_flight * 4,
+        "agent_reconcile_interval": 0,
+        **(config or {}),
+    })
+    core = CoreOrchestrator(config)
+    backend.install(core)
+    return core
+
+
+async def _measure(
+    scenario: str,
+    parameters: Dict[str, Any],
+    core: CoreOrchestrator,
+    body: Callable[[], Awaitable[List[GenerationResult]]],
+    measure_memory: bool,
+) -> ScenarioReport:
+    await core.start()
+    monitor = LoopLagMonitor()
+
+    if measure_memory:
+        gc.collect()
+        tracemalloc.start()
+        memory_before = tracemalloc.get_traced_memory()[0]
+
+    monitor.start()
+    started = time.monotonic()
+    try:
+        results = await body()
+    finally:
+        wall_time = time.monotonic() - started
+        await monitor.stop()
+
+    peak = retained = None
+    if measure_memory:
+        gc.collect()
+        current, peak_total = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak = (peak_total - memory_before) / max(len(results), 1)
+        retained = (current - memory_before) / max(len(results), 1)
+
+    await core.stop()
+
+    latencies = sorted(result.execution_time for result in results)
+    lag = sorted(monitor.samples)
+    succeeded = sum(1 for result in results if result.success)
+    return ScenarioReport(
+        scenario=scenario,
+        workflows=len(results),
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        wall_time=wall_time,
+        throughput=len(results) / wall_time if wall_time else 0.0,
+        latency_p50=percentile(latencies, 0.50),
+        latency_p99=percentile(latencies, 0.99),
+        loop_lag_p50=percentile(lag, 0.50),
+        loop_lag_p99=percentile(lag, 0.99),
+        loop_lag_max=lag[-1] if lag else 0.0,
+        peak_bytes_per_workflow=peak,
+        retained_bytes_per_workflow=retained,
+        parameters=parameters,
+    )
+
+
+async def single(
+    backend: SimulatedMCPturbo,
+    workflows: int = 50,
+    measure_memory: bool = True,
+    config: Optional[Dict[str, Any]] = None,
+) -> ScenarioReport:
+    """Workflows secuenciales, uno en vuelo cada vez"""
+    core = make_orchestrator(backend, max_in_flight=1, config=config)
+
+    async def body():
+        return [await core.execute_project_generation(make_request(i)) for i in range(workflows)]
+
+    return await _measure(
+        "single", {"workflows": workflows, "memory": measure_memory}, core, body, measure_memory
+    )
+
+
+async def concurrent(
+    backend: SimulatedMCPturbo,
+    workflows: int = 1000,
+    measure_memory: bool = True,
+    config: Optional[Dict[str, Any]] = None,
+) -> ScenarioReport:
+    """Todos los workflows lanzados a la vez"""
+    core = make_orchestrator(backend, max_in_flight=workflows, config=config)
+
+    async def body():
+        return await asyncio.gather(*(
+            core.execute_project_generation(make_request(i)) for i in range(workflows)
+        ))
+
+    return await _measure(
+        "concurrent", {"workflows": workflows, "memory": measure_memory}, core, body, measure_memory
+    )
+
+
+async def soak(
+    backend: SimulatedMCPturbo,
+    duration: float = 60.0,
+    rate: float = 50.0,
+    measure_memory: bool = True,
+    config: Optional[Dict[str, Any]] = None,
+) -> ScenarioReport:
+    """Llegadas a ritmo constante (rate/s) durante duration segundos"""
+    core = make_orchestrator(backend, max_in_flight=max(1, int(rate * 10)), config=config)
+
+    async def body():
+        pending = []
+        started = time.monotonic()
+        index = 0
+        while time.monotonic() - started < duration:
+            pending.append(asyncio.ensure_future(
+                core.execute_project_generation(make_request(index))
+            ))
+            index += 1
+            # Reloj absoluto: el retraso del loop no reduce el ritmo de llegadas
+            await asyncio.sleep(max(0.0, started + index / rate - time.monotonic()))
+        return await asyncio.gather(*pending)
+
+    return await _measure(
+        "soak",
+        {"duration": duration, "rate": rate, "memory": measure_memory},
+        core,
+        body,
+        measure_memory,
+    )
+
+
+SCENARIOS = {"single": single, "concurrent": concurrent, "soak": soak}
@@ -0,0 +1,262 @@
+# benchmarks/simulated_mcpturbo.py
+"""
+Sustituto local de MCPturbo para benchmarks
+
+Simula protocol (broadcasts), orchestrator (ejecución del DAG) y
+AgentRegistry con agentes de latencia, tasa de fallo y capacidad
+configurables. Ejecuta el WorkflowDefinition real que construye
+CoreOrchestrator: respeta dependencias, max_parallel_tasks, la capacidad
+de cada agente (compartida entre workflows) y el timeout, y emite los
+broadcasts task.queued / task.started / task.completed / task.failed.
+
+No sustituye al paquete mcpturbo (Task / WorkflowDefinition siguen
+viniendo de él); se inyecta en una instancia de CoreOrchestrator con
+SimulatedMCPturbo.install().
+"""
+
+import asyncio
+import random
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+Handler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+@dataclass
+class LatencyDistribution:
+    """
+    Distribución de latencia en segundos
+
+    kind: "fixed" (a), "uniform" (a..b), "exponential" (media a) o
+    "lognormal" (mediana a, sigma b)
+    """
+    kind: str = "lognormal"
+    a: float = 0.01
+    b: float = 0.5
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            return self.a
+        if self.kind == "uniform":
+            return rng.uniform(self.a, self.b)
+        if self.kind == "exponential":
+            return rng.expovariate(1.0 / self.a)
+        if self.kind == "lognormal":
+            return self.a * rng.lognormvariate(0.0, self.b)
+        raise ValueError(f"Unknown latency distribution: {self.kind}")
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyDistribution":
+        """Formato de CLI: "kind:a[:b]" (p. ej. "lognormal:0.02:0.4")"""
+        kind, *values = spec.split(":")
+        return cls(kind, *(float(value) for value in values))
+
+
+@dataclass
+class AgentProfile:
+    """Comportamiento simulado de un agente"""
+    latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    failure_rate: float = 0.0
+    capacity: int = 64
+    files_per_task: int = 10
+    # Llamadas rezagadas: con probabilidad straggler_rate la latencia se
+    # multiplica por straggler_factor
+    straggler_rate: float = 0.0
+    straggler_factor: float = 20.0
+
+    def sample_latency(self, rng: random.Random) -> float:
+        latency = self.latency.sample(rng)
+        if self.straggler_rate and rng.random() < self.straggler_rate:
+            latency *= self.straggler_factor
+        return latency
+
+
+def default_profiles() -> Dict[str, AgentProfile]:
+    """Perfiles por defecto para los agentes del workflow de generación"""
+    return {
+        "architect_agent": AgentProfile(LatencyDistribution("lognormal", 0.02, 0.3)),
+        "backend_agent": AgentProfile(LatencyDistribution("lognormal", 0.05, 0.4), files_per_task=40),
+        "frontend_agent": AgentProfile(LatencyDistribution("lognormal", 0.04, 0.4), files_per_task=30),
+        "devops_agent": AgentProfile(LatencyDistribution("lognormal", 0.01, 0.3), files_per_task=8),
+    }
+
+
+@dataclass
+class SimulatedWorkflowResult:
+    """Misma forma que el resultado de mcpturbo.orchestrator.execute_workflow"""
+    success: bool
+    generated_files: List[str] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    task_results: Dict[str, Any] = field(default_factory=dict)
+
+
+class SimulatedTaskError(Exception):
+    """Fallo simulado de una tarea"""
+
+
+class SimulatedProtocol:
+    """Broadcasts en proceso"""
+
+    def __init__(self):
+        self.handlers: Dict[str, List[Handler]] = {}
+        self.broadcasts = 0
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    def subscribe_to_broadcasts(self, topic: str, handler: Handler):
+        self.handlers.setdefault(topic, []).append(handler)
+
+    async def broadcast(self, topic: str, event: Dict[str, Any]):
+        self.broadcasts += 1
+        for handler in self.handlers.get(topic, ()):
+            await handler(event)
+
+
+class SimulatedRegistry:
+    """AgentRegistry con los agentes de los perfiles"""
+
+    def __init__(self, agents: List[str]):
+        self.agents = list(agents)
+
+    def list_agents(self) -> List[str]:
+        return list(self.agents)
+
+
+class SimulatedOrchestrator:
+    """Ejecución simulada de WorkflowDefinitions"""
+
+    def __init__(
+        self,
+        protocol: SimulatedProtocol,
+        profiles: Dict[str, AgentProfile],
+        time_scale: float = 1.0,
+        seed: Optional[int] = None,
+    ):
+        self.protocol = protocol
+        self.profiles = profiles
+        self.time_scale = time_scale
+        self.rng = random.Random(seed)
+        self._capacity: Dict[str, asyncio.Semaphore] = {}
+        self._running: Dict[str, asyncio.Task] = {}
+
+    def _profile(self, agent_id: str) -> AgentProfile:
+        """Perfil por instancia o, si no tiene propio, el de su tipo ("<tipo>:<n>")"""
+        profile = self.profiles.get(agent_id) or self.profiles.get(agent_id.split(":", 1)[0])
+        return profile or AgentProfile()
+
+    def _agent_slot(self, agent_id: str) -> asyncio.Semaphore:
+        slot = self._capacity.get(agent_id)
+        if slot is None:
+            slot = self._capacity[agent_id] = asyncio.Semaphore(self._profile(agent_id).capacity)
+        return slot
+
+    async def execute_workflow(self, workflow_id: str, workflow_def: Any) -> SimulatedWorkflowResult:
+        run = asyncio.ensure_future(self._run(workflow_id, workflow_def))
+        self._running[workflow_id] = run
+        try:
+            return await asyncio.wait_for(asyncio.shield(run), workflow_def.timeout)
+        except asyncio.TimeoutError:
+            run.cancel()
+            return SimulatedWorkflowResult(False, error="Workflow timed out")
+        except asyncio.CancelledError:
+            if run.cancelled():
+                return SimulatedWorkflowResult(False, error="Workflow cancelled")
+            run.cancel()
+            raise
+        finally:
+            self._running.pop(workflow_id, None)
+
+    async def cancel_workflow(self, workflow_id: str) -> bool:
+        run = self._running.get(workflow_id)
+        if run is None:
+            return False
+        run.cancel()
+        return True
+
+    async def _run(self, workflow_id: str, workflow_def: Any) -> SimulatedWorkflowResult:
+        parallel = asyncio.Semaphore(workflow_def.max_parallel_tasks)
+        futures: Dict[str, asyncio.Future] = {}
+        task_results: Dict[str, Any] = {}
+        generated_files: List[str] = []
+
+        async def run_task(task: Any):
+            for dep in task.dependencies:
+                if dep in futures:
+                    await futures[dep]
+
+            event = {"workflow_id": workflow_id, "task_id": task.id, "agent_id": task.agent_id}
+            profile = self._profile(task.agent_id)
+            await self.protocol.broadcast("task.queued", event)
+
+            async with parallel, self._agent_slot(task.agent_id):
+                await self.protocol.broadcast("task.started", event)
+                await asyncio.sleep(profile.sample_latency(self.rng) * self.time_scale)
+
+                if self.rng.random() < profile.failure_rate:
+                    error = f"Simulated failure in {task.id}"
+                    await self.protocol.broadcast("task.failed", {**event, "error": error})
+                    raise SimulatedTaskError(error)
+
+                files = [f"{task.id}/file_{i}.py" for i in range(profile.files_per_task)]
+                task_results[task.id] = {"task_id": task.id, "files": len(files)}
+                generated_files.extend(files)
+                await self.protocol.broadcast(
+                    "task.completed",
+                    {**event, "generated_files": files, "result": task_results[task.id]},
+                )
+
+        for task in workflow_def.tasks:
+            futures[task.id] = asyncio.ensure_future(run_task(task))
+
+        try:
+            await asyncio.gather(*futures.values())
+        except SimulatedTaskError as e:
+            for future in futures.values():
+                future.cancel()
+            await asyncio.gather(*futures.values(), return_exceptions=True)
+            await self.protocol.broadcast("workflow.failed", {"workflow_id": workflow_id, "error": str(e)})
+            return SimulatedWorkflowResult(False, error=str(e))
+        except asyncio.CancelledError:
+            for future in futures.values():
+                future.cancel()
+            raise
+
+        await self.protocol.broadcast("workflow.completed", {"workflow_id": workflow_id})
+        return SimulatedWorkflowResult(
+            True,
+            generated_files=generated_files,
+            metadata={"simulated": True},
+            task_results=task_results,
+        )
+
+
+class SimulatedMCPturbo:
+    """Protocol + orchestrator + registry simulados, listos para inyectar"""
+
+    def __init__(
+        self,
+        profiles: Optional[Dict[str, AgentProfile]] = None,
+        time_scale: float = 1.0,
+        seed: Optional[int] = None,
+        instances: int = 1,
+    ):
+        self.profiles = profiles or default_profiles()
+        self.protocol = SimulatedProtocol()
+        self.orchestrator = SimulatedOrchestrator(self.protocol, self.profiles, time_scale, seed)
+        # Instancias adicionales de cada agente: "<tipo>:2" ... "<tipo>:<instances>"
+        self.registry = SimulatedRegistry([
+            agent_id if index == 1 else f"{agent_id}:{index}"
+            for agent_id in self.profiles
+            for index in range(1, instances + 1)
+        ])
+
+    def install(self, core: Any):
+        """Sustituir las dependencias MCPturbo de un CoreOrchestrator (antes de start())"""
+        core.mcp_protocol = self.protocol
+        core.mcp_orchestrator = self.orchestrator
+        core.agent_registry = self.registry
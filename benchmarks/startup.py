@@ -0,0 +1,137 @@
+# benchmarks/startup.py
+"""
+Benchmark: coste de arranque en frío de genesis_core
+
+Ejecuta `python -X importtime` en procesos nuevos importando
+core_orchestrator y resume el tiempo acumulado, los imports más pesados y
+qué dependencias diferidas (MCPturbo, pydantic, sqlalchemy, redis) se
+cargaron. Mide también import + CoreOrchestrator() sin start().
+
+Con --check termina con error si el mejor tiempo de importación supera
+STARTUP_BUDGET_MS o si se cargó alguna dependencia diferida; la suite
+de tests lo ejecuta así.
+
+    python -m benchmarks.startup [--runs N] [--top N] [--check]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+MODULE = "genesis_core.orchestrator.core_orchestrator"
+
+# Tiempo acumulado de importar MODULE (mejor de --runs procesos)
+STARTUP_BUDGET_MS = 250.0
+
+# No deben cargarse al importar MODULE
+DEFERRED_MODULES = ("mcpturbo", "pydantic", "sqlalchemy", "redis")
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+imported = time.perf_counter()
+{construct}
+constructed = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - started) * 1000,
+    "construct_ms": (constructed - imported) * 1000,
+    "loaded": sorted({{name.split(".")[0] for name in sys.modules}}),
+}}))
+"""
+
+
+@dataclass
+class ImportProfile:
+    """Un proceso: tiempo acumulado por módulo (ms) y módulos cargados"""
+    cumulative: Dict[str, float] = field(default_factory=dict)
+    loaded: List[str] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        return self.cumulative.get(MODULE, 0.0)
+
+    def deferred_loaded(self) -> List[str]:
+        return [name for name in DEFERRED_MODULES if name in self.loaded]
+
+    def heaviest(self, top: int) -> List[Tuple[str, float]]:
+        ranked = sorted(self.cumulative.items(), key=lambda item: item[1], reverse=True)
+        return [(name, ms) for name, ms in ranked if name != MODULE][:top]
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True, text=True, check=True, env=os.environ.copy(),
+    )
+
+
+def profile_import(module: str = MODULE) -> ImportProfile:
+    """Importar module en un proceso nuevo con -X importtime"""
+    probe = _PROBE.format(module=module, construct="")
+    completed = _run(probe, "-X", "importtime")
+    profile = ImportProfile(loaded=json.loads(completed.stdout)["loaded"])
+    for line in completed.stderr.splitlines():
+        # import time: <self us> | <cumulative us> | <indentación><módulo>
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            profile.cumulative[name.strip()] = int(cumulative) / 1000
+    return profile
+
+
+def profile_construction() -> Dict[str, object]:
+    """Import + CoreOrchestrator() (sin start()) en un proceso nuevo"""
+    construct = "{}.CoreOrchestrator()".format(MODULE)
+    return json.loads(_run(_PROBE.format(module=MODULE, construct=construct)).stdout)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--check", action="store_true", help="aplicar el presupuesto")
+    args = parser.parse_args()
+
+    profiles = [profile_import() for _ in range(args.runs)]
+    totals = [profile.total_ms for profile in profiles]
+    best = min(totals)
+    deferred = sorted({name for profile in profiles for name in profile.deferred_loaded()})
+
+    print(f"import {MODULE}   runs: {args.runs}")
+    print(
+        f"  best {best:7.1f} ms   median {statistics.median(totals):7.1f} ms   "
+        f"budget {STARTUP_BUDGET_MS:.0f} ms"
+    )
+    print(f"  deferred modules loaded: {', '.join(deferred) or 'none'}")
+    print("  heaviest imports (cumulative, median run):")
+    median_run = sorted(profiles, key=lambda profile: profile.total_ms)[len(profiles) // 2]
+    for name, ms in median_run.heaviest(args.top):
+        print(f"    {ms:8.1f} ms  {name}")
+
+    if not args.check:
+        construction = [profile_construction() for _ in range(args.runs)]
+        construct_ms = statistics.median(run["construct_ms"] for run in construction)
+        loaded = [name for name in DEFERRED_MODULES if name in construction[0]["loaded"]]
+        print("CoreOrchestrator() without start()")
+        print(f"  median {construct_ms:7.1f} ms   loaded: {', '.join(loaded) or 'none'}")
+        return 0
+
+    failures = []
+    if best > STARTUP_BUDGET_MS:
+        failures.append(f"import took {best:.1f} ms (budget {STARTUP_BUDGET_MS:.0f} ms)")
+    if deferred:
+        failures.append(f"deferred modules loaded at import: {', '.join(deferred)}")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
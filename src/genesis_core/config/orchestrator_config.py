@@ -0,0 +1,100 @@
+# src/genesis_core/config/orchestrator_config.py
+from typing import Dict, Optional
+from pydantic import BaseModel, Field
+
+
+class OrchestratorConfig(BaseModel):
+    """
+    Configuración operativa del CoreOrchestrator
+
+    Parámetros de runtime (caches, límites, retención) independientes
+    del proyecto que se genera
+    """
+    # Cache de la fase de arquitectura (memoria + disco opcional)
+    architecture_cache_size: int = Field(default=256, ge=0)
+    architecture_cache_ttl: float = Field(default=24 * 3600.0, gt=0)
+    architecture_cache_dir: Optional[str] = None
+    architecture_cache_disk_size: int = Field(default=4096, ge=0)
+
+    # Retención de estado (project_states / workflow_states)
+    retention_max_live_workflows: int = Field(default=1000, ge=0)
+    retention_max_age: float = Field(default=3600.0, gt=0)
+    retention_max_archived: int = Field(default=100_000, ge=0)
+    retention_spill_path: Optional[str] = None
+    retention_max_spilled: int = Field(default=1_000_000, ge=0)
+    retention_interval: float = Field(default=60.0, ge=0)
+
+    # Admisión: workflows simultáneos y cola de espera por prioridad
+    max_in_flight_workflows: int = Field(default=32, ge=1)
+    admission_queue_depth: int = Field(default=256, ge=0)
+    admission_aging_interval: float = Field(default=10.0, gt=0)
+
+    # Índice de agentes: reconciliación periódica contra AgentRegistry (0 = off)
+    agent_reconcile_interval: float = Field(default=30.0, ge=0)
+
+    # Enrutado entre instancias de un agente ("<tipo>:<n>"): least_loaded | p2c
+    agent_routing: str = Field(default="least_loaded", pattern="^(least_loaded|p2c)$")
+    agent_latency_alpha: float = Field(default=0.2, gt=0, le=1)
+
+    # Paralelismo adaptativo: presupuesto global y capacidad por tipo de agente
+    parallelism_global_budget: int = Field(default=64, ge=1)
+    agent_concurrency_limits: Dict[str, int] = Field(default_factory=dict)
+    workflow_timeout: int = Field(default=1800, gt=0)
+
+    # Regeneración incremental: snapshots de workflows exitosos
+    incremental_snapshot_limit: int = Field(default=256, ge=0)
+
+    # Manifest en disco de archivos generados; con directorio configurado
+    # GenerationResult.manifest sustituye a la lista generated_files
+    manifest_dir: Optional[str] = None
+
+    # Persistencia write-behind del estado (desactivada sin URL)
+    persistence_url: Optional[str] = None
+    persistence_batch_size: int = Field(default=500, ge=1)
+    persistence_flush_interval: float = Field(default=0.5, gt=0)
+    persistence_max_pending: int = Field(default=100_000, ge=1)
+
+    # Modo distribuido (leases y estado compartido en Redis)
+    distributed_redis_url: Optional[str] = None
+    node_id: Optional[str] = None
+    lease_ttl: float = Field(default=15.0, gt=0)
+    lease_shards: int = Field(default=16, ge=1)
+    takeover_interval: float = Field(default=5.0, ge=0)
+
+    # Checkpoints por tarea para reanudar workflows interrumpidos
+    checkpoint_dir: Optional[str] = None
+    checkpoint_fsync: bool = True
+    checkpoint_ttl: Optional[float] = Field(default=7 * 24 * 3600.0, gt=0)
+
+    # Requests idénticos en curso (config + output_path) comparten workflow
+    coalesce_identical_requests: bool = True
+
+    # Drenado en stop(): espera a los activos y luego cancela el resto
+    drain_timeout: float = Field(default=30.0, ge=0)
+    drain_cancel_timeout: float = Field(default=10.0, gt=0)
+
+    # Ingesta de broadcasts: cola acotada aplicada por lotes
+    event_queue_size: int = Field(default=10_000, ge=1)
+    event_batch_size: int = Field(default=256, ge=1)
+
+    # Hedging: duplicar en otra instancia del agente las tareas que superan
+    # el percentil hedge_quantile de su historia (opt-in)
+    hedging_enabled: bool = False
+    hedge_quantile: float = Field(default=0.95, gt=0, lt=1)
+    hedge_min_samples: int = Field(default=20, ge=1)
+    hedge_budget: float = Field(default=0.05, ge=0, le=1)
+    hedge_min_delay: float = Field(default=0.0, ge=0)
+
+    # Resultados grandes entre tareas como handles a blobs por contenido
+    # (opt-in: los agentes deben resolver {"$blob": ...}); blob_dir los
+    # deja en disco para leerlos con mmap desde otro proceso
+    blob_handles_enabled: bool = False
+    blob_threshold: int = Field(default=64 * 1024, ge=0)
+    blob_dir: Optional[str] = None
+
+    # Sink de salida: los archivos generados se deduplican por contenido en
+    # output_sink_dir y el árbol del proyecto queda enlazado a esos blobs
+    output_sink_dir: Optional[str] = None
+    output_sink_link: str = Field(default="hardlink", pattern="^(hardlink|reflink)$")
+    output_sink_batch_size: int = Field(default=256, ge=1)
+    output_sink_fsync: bool = True
@@ -1,6 +1,6 @@
 # src/genesis_core/config/project_config.py
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 from enum import Enum
 
 
@@ -70,24 +70,27 @@ class ProjectConfig(BaseModel):
     # Metadata adicional
     metadata: Dict[str, Any] = Field(default_factory=dict)
     
-    @validator('name')
+    @field_validator('name')
+    @classmethod
     def validate_name(cls, v):
         """Validar nombre del proyecto"""
         if not v.replace('-', '').replace('_', '').isalnum():
             raise ValueError("Name must be alphanumeric with hyphens or underscores")
         return v.lower()
     
-    @validator('components')
+    @field_validator('components')
+    @classmethod
     def validate_components(cls, v):
         """Validar componentes"""
         if not v:
             raise ValueError("At least one component is required")
         return v
     
-    @validator('stack')
-    def validate_stack_consistency(cls, v, values):
+    @field_validator('stack')
+    @classmethod
+    def validate_stack_consistency(cls, v, info: ValidationInfo):
         """Validar consistencia del stack"""
-        components = values.get('components', [])
+        components = info.data.get('components', [])
         
         if ComponentType.BACKEND in components and not v.backend:
             raise ValueError("Backend stack required when backend component selected")
@@ -99,9 +102,9 @@ class ProjectConfig(BaseModel):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convertir a diccionario para serialización"""
-        return self.dict()
+        return self.model_dump()
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ProjectConfig":
         """Crear desde diccionario"""
-        return cls(**data)
\ No newline at end of file
+        return cls.model_validate(data)
\ No newline at end of file
@@ -0,0 +1,150 @@
+# src/genesis_core/config/validation.py
+"""
+Validación rápida y masiva de ProjectConfig
+
+ConfigValidator cachea (LRU) el resultado de validar cada configuración:
+los dicts se indexan por su JSON canónico (claves ordenadas) y las líneas
+JSONL por su texto exacto, que se valida directamente con
+model_validate_json sin pasar por json.loads. También se cachean los
+errores, así que una configuración inválida repetida no se revalida.
+
+La cache guarda su propia instancia y cada llamada recibe una copia
+(model_copy(deep=True)): modificar la config devuelta no afecta a las
+siguientes validaciones de la misma configuración.
+"""
+
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import IO, Any, Dict, Iterable, Iterator, List, Mapping, Optional, Union
+
+from pydantic import ValidationError
+
+from .project_config import ProjectConfig
+
+
+def canonical_json(data: Mapping[str, Any]) -> str:
+    """JSON estable de un dict (independiente del orden de claves)"""
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+
+
+@dataclass
+class ValidationOutcome:
+    """Resultado de validar una configuración de un lote"""
+    index: int
+    config: Optional[ProjectConfig] = None
+    errors: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def valid(self) -> bool:
+        return self.errors is None
+
+    def format(self) -> str:
+        """Una línea por error: 'index: campo: mensaje'"""
+        return "\n".join(
+            f"{self.index}: {'.'.join(str(part) for part in error['loc']) or '<root>'}: "
+            f"{error['msg']}"
+            for error in self.errors or ()
+        )
+
+
+class ConfigValidator:
+    """
+    Validación de ProjectConfig con cache de resultados
+
+    - max_entries: configuraciones (válidas o no) recordadas; 0 desactiva
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Union[str, bytes], Union[ProjectConfig, ValidationError]]" = (
+            OrderedDict()
+        )
+        self._stats = {"validated": 0, "hits": 0, "misses": 0, "invalid": 0}
+
+    def validate(self, data: Mapping[str, Any]) -> ProjectConfig:
+        """Validar un dict; lanza ValidationError como ProjectConfig"""
+        return self._lookup(canonical_json(data), ProjectConfig.model_validate, data)
+
+    def validate_json(self, raw: Union[str, bytes]) -> ProjectConfig:
+        """Validar un documento JSON sin decodificarlo antes"""
+        return self._lookup(raw, ProjectConfig.model_validate_json, raw)
+
+    def validate_many(
+        self, items: Iterable[Mapping[str, Any]], start: int = 0
+    ) -> Iterator[ValidationOutcome]:
+        """Validar dicts en streaming; un ValidationOutcome por elemento"""
+        for index, data in enumerate(items, start):
+            yield self._outcome(index, self.validate, data)
+
+    def validate_jsonl(
+        self, source: Union[str, IO[str], IO[bytes], Iterable[Union[str, bytes]]]
+    ) -> Iterator[ValidationOutcome]:
+        """
+        Validar un archivo JSONL (ruta, archivo abierto o líneas)
+
+        index es el número de línea (desde 1); las líneas vacías se saltan
+        y el JSON malformado se reporta como error de esa línea.
+        """
+        if isinstance(source, str):
+            with open(source, "rb") as fh:
+                yield from self.validate_jsonl(fh)
+            return
+
+        for number, line in enumerate(source, 1):
+            line = line.strip()
+            if line:
+                yield self._outcome(number, self.validate_json, line)
+
+    def clear(self):
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._stats, "size": len(self._cache)}
+
+    def _outcome(self, index: int, validate: Any, data: Any) -> ValidationOutcome:
+        try:
+            return ValidationOutcome(index, config=validate(data))
+        except ValidationError as e:
+            return ValidationOutcome(index, errors=e.errors(include_url=False))
+
+    def _lookup(self, key: Union[str, bytes], validate: Any, data: Any) -> ProjectConfig:
+        self._stats["validated"] += 1
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._stats["hits"] += 1
+            self._cache.move_to_end(key)
+        else:
+            self._stats["misses"] += 1
+            try:
+                cached = validate(data)
+            except ValidationError as e:
+                cached = e
+            self._remember(key, cached)
+
+        if isinstance(cached, ValidationError):
+            self._stats["invalid"] += 1
+            # Sin acumular tracebacks de lanzamientos anteriores
+            raise cached.with_traceback(None)
+        return cached.model_copy(deep=True)
+
+    def _remember(self, key: Union[str, bytes], value: Union[ProjectConfig, ValidationError]):
+        if self.max_entries <= 0:
+            return
+        self._cache[key] = value
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+
+# Validador compartido del proceso
+default_validator = ConfigValidator()
+
+
+def validate_many(items: Iterable[Mapping[str, Any]]) -> Iterator[ValidationOutcome]:
+    return default_validator.validate_many(items)
+
+
+def validate_jsonl(
+    source: Union[str, IO[str], IO[bytes], Iterable[Union[str, bytes]]]
+) -> Iterator[ValidationOutcome]:
+    return default_validator.validate_jsonl(source)
@@ -0,0 +1,25 @@
+# src/genesis_core/exceptions.py
+from typing import Optional
+
+
+class CoreOrchestratorError(Exception):
+    """Error base de Genesis Core"""
+
+
+class AdmissionRejectedError(CoreOrchestratorError):
+    """Request rechazado por cola de admisión llena"""
+    
+    def __init__(self, queue_depth: int, retry_after: Optional[float] = None):
+        self.queue_depth = queue_depth
+        self.retry_after = retry_after
+        super().__init__(
+            f"Admission queue full (depth={queue_depth}, "
+            f"retry_after={retry_after if retry_after is not None else 'unknown'}s)"
+        )
+
+
+class OrchestratorDrainingError(CoreOrchestratorError):
+    """Request rechazado porque el orquestador se está deteniendo"""
+    
+    def __init__(self):
+        super().__init__("Orchestrator is shutting down and not accepting requests")
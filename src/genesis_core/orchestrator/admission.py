@@ -0,0 +1,204 @@
+# src/genesis_core/orchestrator/admission.py
+"""
+Control de admisión delante de execute_project_generation
+
+Limita los workflows en curso y encola el exceso en colas FIFO por
+prioridad. Cuando la cola está llena el request se rechaza al instante
+con la profundidad de cola y un tiempo de espera sugerido, en lugar de
+dejar que la sobrecarga aparezca como timeouts de MCPturbo.
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import AsyncIterator, Deque, Dict, List, Optional
+
+from genesis_core.exceptions import AdmissionRejectedError, OrchestratorDrainingError
+
+
+class Priority(IntEnum):
+    """Clases de prioridad (menor valor = se atiende antes)"""
+    INTERACTIVE = 0
+    NORMAL = 1
+    BULK = 2
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Percentil por rango más cercano sobre una lista ya ordenada"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(q * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+class _Waiter:
+    __slots__ = ("future", "enqueued_at")
+
+    def __init__(self, future: "asyncio.Future[None]", enqueued_at: float):
+        self.future = future
+        self.enqueued_at = enqueued_at
+
+
+class AdmissionController:
+    """
+    Cola de admisión acotada con prioridades
+
+    - max_in_flight: workflows ejecutándose a la vez
+    - max_queue_depth: requests esperando; por encima se rechaza
+    - aging_interval: cada intervalo de espera sube un nivel de prioridad,
+      así los trabajos BULK no esperan indefinidamente
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 32,
+        max_queue_depth: int = 256,
+        aging_interval: float = 10.0,
+        wait_window: int = 1024,
+    ):
+        self.max_in_flight = max_in_flight
+        self.max_queue_depth = max_queue_depth
+        self.aging_interval = aging_interval
+
+        self._in_flight = 0
+        self._depth = 0
+        self._queues: Dict[Priority, Deque[_Waiter]] = {p: deque() for p in Priority}
+        self._wait_times: Deque[float] = deque(maxlen=wait_window)
+        self._closed = False
+        self._stats = {"admitted": 0, "queued": 0, "rejected": 0, "peak_queue_depth": 0}
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return self._depth
+
+    async def acquire(
+        self, priority: Priority = Priority.NORMAL, reject_when_full: bool = True
+    ) -> float:
+        """
+        Esperar un slot de ejecución; devuelve los segundos esperados
+
+        Raises:
+            AdmissionRejectedError: si la cola está llena y reject_when_full
+            OrchestratorDrainingError: si la admisión está cerrada
+        """
+        if self._closed:
+            self._stats["rejected"] += 1
+            raise OrchestratorDrainingError()
+
+        if self._in_flight < self.max_in_flight and self._depth == 0:
+            self._in_flight += 1
+            self._admitted(0.0)
+            return 0.0
+
+        if reject_when_full and self._depth >= self.max_queue_depth:
+            self._stats["rejected"] += 1
+            raise AdmissionRejectedError(
+                queue_depth=self._depth, retry_after=self._retry_after()
+            )
+
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), time.monotonic())
+        self._queues[Priority(priority)].append(waiter)
+        self._depth += 1
+        self._stats["queued"] += 1
+        self._stats["peak_queue_depth"] = max(self._stats["peak_queue_depth"], self._depth)
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # El slot ya estaba concedido (o la cola se cerró)
+                if waiter.future.exception() is None:
+                    self.release()
+            else:
+                self._queues[Priority(priority)].remove(waiter)
+                self._depth -= 1
+            raise
+
+        waited = time.monotonic() - waiter.enqueued_at
+        self._admitted(waited)
+        return waited
+
+    def close(self) -> int:
+        """Dejar de admitir; rechaza lo encolado y devuelve cuántos había"""
+        self._closed = True
+        rejected = 0
+        for queue in self._queues.values():
+            while queue:
+                waiter = queue.popleft()
+                if not waiter.future.done():
+                    waiter.future.set_exception(OrchestratorDrainingError())
+                    rejected += 1
+        self._depth = 0
+        self._stats["rejected"] += rejected
+        return rejected
+
+    def reopen(self):
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def release(self):
+        """Liberar un slot y despachar al siguiente en cola"""
+        self._in_flight -= 1
+        while self._in_flight < self.max_in_flight and self._depth:
+            waiter = self._pop_next()
+            self._in_flight += 1
+            waiter.future.set_result(None)
+
+    @asynccontextmanager
+    async def slot(
+        self, priority: Priority = Priority.NORMAL, reject_when_full: bool = True
+    ) -> AsyncIterator[float]:
+        """Context manager: acquire + release"""
+        waited = await self.acquire(priority, reject_when_full)
+        try:
+            yield waited
+        finally:
+            self.release()
+
+    def stats(self) -> Dict[str, float]:
+        """Profundidad de cola, slots en uso y percentiles de espera"""
+        waits = sorted(self._wait_times)
+        return {
+            **self._stats,
+            "in_flight": self._in_flight,
+            "queue_depth": self._depth,
+            "wait_p50": percentile(waits, 0.50),
+            "wait_p95": percentile(waits, 0.95),
+            "wait_p99": percentile(waits, 0.99),
+        }
+
+    def _admitted(self, waited: float):
+        self._stats["admitted"] += 1
+        self._wait_times.append(waited)
+
+    def _pop_next(self) -> _Waiter:
+        """Elegir la cabeza de cola con mejor prioridad efectiva (con aging)"""
+        now = time.monotonic()
+        best: Optional[Priority] = None
+        best_key = None
+
+        for priority, queue in self._queues.items():
+            if not queue:
+                continue
+            head = queue[0]
+            aged = int((now - head.enqueued_at) / self.aging_interval)
+            key = (priority - aged, head.enqueued_at)
+            if best_key is None or key < best_key:
+                best, best_key = priority, key
+
+        self._depth -= 1
+        return self._queues[best].popleft()
+
+    def _retry_after(self) -> Optional[float]:
+        if not self._wait_times:
+            return None
+        return percentile(sorted(self._wait_times), 0.95)
@@ -0,0 +1,106 @@
+# src/genesis_core/orchestrator/agent_index.py
+"""
+Índice local de disponibilidad de agentes
+
+Se mantiene con los eventos agent.registered / agent.deregistered de
+MCPturbo y se reconcilia periódicamente contra AgentRegistry, de modo
+que validar un request no requiere consultar el registry.
+
+Las instancias se agrupan además por tipo ("backend_agent:2" es una
+réplica de "backend_agent"), así que saber si un tipo tiene instancias
+no recorre el índice entero.
+"""
+
+import time
+from typing import AbstractSet, Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+
+def agent_type(agent_id: str) -> str:
+    """Tipo de agente de una instancia ("backend_agent:2" -> "backend_agent")"""
+    return agent_id.split(":", 1)[0]
+
+
+class AgentAvailabilityIndex:
+    """Conjunto de agentes disponibles con contadores de deriva"""
+
+    def __init__(self):
+        self._agents: Set[str] = set()
+        self._by_type: Dict[str, Set[str]] = {}
+        self.warmed = False
+        self.last_reconciled: Optional[float] = None
+        self._on_removed: List[Callable[[str], None]] = []
+        self._stats = {
+            "registrations": 0,
+            "deregistrations": 0,
+            "reconciliations": 0,
+            "drift_corrections": 0,
+        }
+
+    def reconcile(self, agents: Iterable[str]) -> int:
+        """Reemplazar el contenido con la vista del registry; devuelve la deriva"""
+        fresh = set(agents)
+        drift = len(fresh.symmetric_difference(self._agents)) if self.warmed else 0
+        removed = self._agents - fresh
+
+        self._agents = fresh
+        self._by_type = {}
+        for agent_id in fresh:
+            self._by_type.setdefault(agent_type(agent_id), set()).add(agent_id)
+        self.warmed = True
+        self.last_reconciled = time.monotonic()
+        self._stats["reconciliations"] += 1
+        self._stats["drift_corrections"] += drift
+        for agent_id in removed:
+            self._notify_removed(agent_id)
+        return drift
+
+    def add(self, agent_id: str):
+        if agent_id and agent_id not in self._agents:
+            self._agents.add(agent_id)
+            self._by_type.setdefault(agent_type(agent_id), set()).add(agent_id)
+            self._stats["registrations"] += 1
+
+    def discard(self, agent_id: str):
+        if agent_id in self._agents:
+            self._agents.discard(agent_id)
+            kind = agent_type(agent_id)
+            instances = self._by_type[kind]
+            instances.discard(agent_id)
+            if not instances:
+                del self._by_type[kind]
+            self._stats["deregistrations"] += 1
+            self._notify_removed(agent_id)
+
+    def on_removed(self, callback: Callable[[str], None]):
+        """Registrar callback(agent_id) para las instancias que salen del índice"""
+        self._on_removed.append(callback)
+
+    def _notify_removed(self, agent_id: str):
+        for callback in self._on_removed:
+            callback(agent_id)
+
+    def instances(self, kind: str) -> AbstractSet[str]:
+        """Instancias disponibles de un tipo de agente"""
+        return self._by_type.get(kind, frozenset())
+
+    def has_type(self, kind: str) -> bool:
+        return kind in self._by_type
+
+    def missing(self, required: Iterable[str]) -> List[str]:
+        """Agentes requeridos que no están disponibles"""
+        return [agent_id for agent_id in required if agent_id not in self._agents]
+
+    def snapshot(self) -> List[str]:
+        return sorted(self._agents)
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._stats, "size": len(self._agents), "types": len(self._by_type)}
+
+    def __contains__(self, agent_id: object) -> bool:
+        return agent_id in self._agents
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._agents)
+
+    def __len__(self) -> int:
+        return len(self._agents)
@@ -0,0 +1,226 @@
+# src/genesis_core/orchestrator/agent_pool.py
+"""
+Pool de instancias de agentes y enrutado de tareas
+
+Cada agente puede tener varias réplicas registradas en MCPturbo como
+"<tipo>" o "<tipo>:<n>". El pool reparte las tareas de cada workflow
+entre las instancias disponibles del tipo que piden, con tres señales por
+instancia:
+
+- in_flight: tareas que empezaron y aún no terminaron
+- queued: tareas asignadas que aún no empezaron, ponderadas por lo cerca
+  que están de poder ejecutarse (1 las listas; menos cuantas más
+  dependencias pendientes tengan)
+- ewma: media exponencial de la latencia de las tareas que completó
+
+La puntuación es (in_flight + queued + 1) * ewma; una instancia sin
+historia usa la media de las de su tipo. Estrategias:
+
+- least_loaded: la instancia de menor puntuación
+- p2c: la mejor de dos elegidas al azar (power of two choices); evita que
+  los workflows que se construyen a la vez elijan todos la misma
+
+La disponibilidad sale del índice local de agentes. La asignación se hace
+al construir el workflow, que es cuando se fija el agent_id de cada Task;
+la tarea pasa de queued a in_flight con su task.started. Cuando una
+instancia sale del índice se descarta su carga, en cuanto no le quedan
+tareas asignadas.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional
+
+from genesis_core.orchestrator.agent_index import AgentAvailabilityIndex, agent_type
+
+STRATEGIES = ("least_loaded", "p2c")
+
+
+@dataclass
+class InstanceLoad:
+    """Carga y latencia observadas de una instancia"""
+    in_flight: int = 0
+    queued: float = 0.0
+    completed: int = 0
+    ewma: Optional[float] = None
+
+    def observe(self, latency: float, alpha: float):
+        self.completed += 1
+        self.ewma = latency if self.ewma is None else alpha * latency + (1 - alpha) * self.ewma
+
+
+def _idle(load: InstanceLoad) -> bool:
+    # queued acumula pesos fraccionarios: tolerar el error de redondeo
+    return load.in_flight == 0 and abs(load.queued) < 1e-9
+
+
+class AgentPool:
+    """
+    Enrutado de tareas a instancias de agentes
+
+    - index: agentes disponibles (instancias)
+    - strategy: least_loaded | p2c
+    - alpha: peso de la última latencia en la EWMA
+    """
+
+    def __init__(
+        self,
+        index: AgentAvailabilityIndex,
+        strategy: str = "least_loaded",
+        alpha: float = 0.2,
+        seed: Optional[int] = None,
+    ):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown routing strategy: {strategy}")
+        self.index = index
+        self.strategy = strategy
+        self.alpha = alpha
+
+        self._rng = random.Random(seed)
+        self._load: Dict[str, InstanceLoad] = {}
+        self._assigned: Dict[str, Dict[str, str]] = {}
+        # Asignaciones aún sin task.started: peso con el que cuentan
+        self._queued: Dict[str, Dict[str, float]] = {}
+        self._stats = {"routed": 0, "unrouted": 0}
+        index.on_removed(self.forget)
+
+    # Instancias
+
+    def instances(self, kind: str) -> List[str]:
+        """Instancias disponibles de un tipo de agente"""
+        return sorted(self.index.instances(kind))
+
+    def missing(self, required: Iterable[str]) -> List[str]:
+        """Tipos requeridos sin ninguna instancia disponible"""
+        return [kind for kind in required if not self.index.has_type(kind)]
+
+    def load(self, agent_id: str) -> InstanceLoad:
+        load = self._load.get(agent_id)
+        if load is None:
+            load = self._load[agent_id] = InstanceLoad()
+        return load
+
+    def forget(self, agent_id: str):
+        """Descartar la carga de una instancia que ya no está en el índice"""
+        load = self._load.get(agent_id)
+        if load is not None and _idle(load) and agent_id not in self.index:
+            del self._load[agent_id]
+
+    def score(self, agent_id: str) -> float:
+        load = self.load(agent_id)
+        latency = load.ewma
+        if latency is None:
+            known = [
+                other.ewma for name, other in self._load.items()
+                if other.ewma is not None and agent_type(name) == agent_type(agent_id)
+            ]
+            latency = sum(known) / len(known) if known else 1.0
+        return (load.in_flight + load.queued + 1) * latency
+
+    def ranked(self, kind: str) -> List[str]:
+        """Instancias del tipo de mejor a peor puntuación"""
+        return sorted(self.instances(kind), key=self.score)
+
+    def choose(self, kind: str) -> Optional[str]:
+        candidates = self.instances(kind)
+        if len(candidates) > 2 and self.strategy == "p2c":
+            candidates = self._rng.sample(candidates, 2)
+        return min(candidates, key=self.score, default=None)
+
+    # Asignaciones
+
+    def route(
+        self,
+        workflow_id: str,
+        tasks: Mapping[str, str],
+        readiness: Optional[Mapping[str, float]] = None,
+    ) -> Dict[str, str]:
+        """
+        Asignar instancia a cada tarea (task_id -> tipo de agente)
+
+        readiness: peso en (0, 1] con el que cuenta cada tarea hasta su
+        task.started (por defecto 1). Las tareas cuyo tipo no tiene
+        instancias conocidas conservan el agent_id original.
+        """
+        routing = {}
+        for task_id, kind in tasks.items():
+            instance = self.choose(agent_type(kind))
+            if instance is None:
+                self._stats["unrouted"] += 1
+                routing[task_id] = kind
+                continue
+            weight = readiness.get(task_id, 1.0) if readiness is not None else 1.0
+            self._assign(workflow_id, task_id, instance)
+            self._queued.setdefault(workflow_id, {})[task_id] = weight
+            self.load(instance).queued += weight
+            routing[task_id] = instance
+        return routing
+
+    def reserve(self, workflow_id: str, task_id: str, instance: str):
+        """Contar la tarea como en curso en instance hasta complete/release"""
+        self._assign(workflow_id, task_id, instance)
+        self.load(instance).in_flight += 1
+
+    def start(self, workflow_id: str, task_id: str):
+        """task.started: la asignación pasa de queued a in_flight"""
+        weight = self._queued.get(workflow_id, {}).pop(task_id, None)
+        if weight is None:
+            return
+        load = self.load(self._assigned[workflow_id][task_id])
+        load.queued -= weight
+        load.in_flight += 1
+
+    def complete(self, workflow_id: str, task_id: str, latency: Optional[float] = None):
+        """La tarea terminó; latency (s en ejecución) alimenta la EWMA"""
+        instance = self._unassign(workflow_id, task_id)
+        # Una instancia ya fuera del índice no vuelve a acumular historia
+        if instance in self.index and latency is not None:
+            self.load(instance).observe(latency, self.alpha)
+
+    def release(self, workflow_id: str):
+        """Liberar las tareas del workflow que no llegaron a terminar"""
+        for task_id in list(self._assigned.get(workflow_id, ())):
+            self._unassign(workflow_id, task_id)
+        self._assigned.pop(workflow_id, None)
+        self._queued.pop(workflow_id, None)
+
+    def _assign(self, workflow_id: str, task_id: str, instance: str):
+        self._unassign(workflow_id, task_id)
+        self._assigned.setdefault(workflow_id, {})[task_id] = instance
+        self._stats["routed"] += 1
+
+    def _unassign(self, workflow_id: str, task_id: str) -> Optional[str]:
+        instance = self._assigned.get(workflow_id, {}).pop(task_id, None)
+        if instance is None:
+            return None
+        load = self.load(instance)
+        weight = self._queued.get(workflow_id, {}).pop(task_id, None)
+        if weight is None:
+            load.in_flight -= 1
+        else:
+            load.queued -= weight
+        self.forget(instance)
+        return instance
+
+    # Métricas
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Carga por instancia disponible"""
+        return {
+            agent_id: {
+                "in_flight": self.load(agent_id).in_flight,
+                "queued": self.load(agent_id).queued,
+                "completed": self.load(agent_id).completed,
+                "ewma": self.load(agent_id).ewma,
+                "score": self.score(agent_id),
+            }
+            for agent_id in sorted(self.index)
+        }
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            **self._stats,
+            "instances": len(self.index),
+            "in_flight": sum(load.in_flight for load in self._load.values()),
+            "queued": sum(load.queued for load in self._load.values()),
+        }
@@ -0,0 +1,122 @@
+# src/genesis_core/orchestrator/batch.py
+"""
+Ejecución de lotes de generación con concurrencia acotada
+
+Un pool fijo de workers consume los requests del lote, de modo que nunca
+hay más de max_concurrency workflows en curso (ni más tareas asyncio vivas
+que workers). Los resultados se entregan en orden de finalización.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class BatchSummary:
+    """Tiempos y contadores agregados de un lote"""
+    total: int
+    succeeded: int = 0
+    failed: int = 0
+    rejected: int = 0
+    wall_time: float = 0.0
+    cumulative_execution_time: float = 0.0
+    started_at: Optional[float] = field(default=None, repr=False)
+
+    def start(self):
+        self.started_at = time.monotonic()
+
+    def finish(self):
+        if self.started_at is not None:
+            self.wall_time = time.monotonic() - self.started_at
+
+    def record(self, result: Any, rejected: bool = False):
+        """Contabilizar un GenerationResult"""
+        if rejected:
+            self.rejected += 1
+        elif result.success:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        self.cumulative_execution_time += result.execution_time
+
+    @property
+    def completed(self) -> int:
+        return self.succeeded + self.failed + self.rejected
+
+    @property
+    def throughput(self) -> float:
+        """Generaciones terminadas por segundo de reloj"""
+        return self.completed / self.wall_time if self.wall_time else 0.0
+
+    @property
+    def mean_execution_time(self) -> float:
+        finished = self.succeeded + self.failed
+        return self.cumulative_execution_time / finished if finished else 0.0
+
+
+class BatchGeneration:
+    """
+    Iterador asíncrono sobre los resultados de un lote
+
+    Uso:
+        batch = orchestrator.execute_batch_generation(requests, max_concurrency=8)
+        async for result in batch:
+            ...
+        batch.summary.wall_time
+    """
+
+    def __init__(self, results: AsyncIterator[Any], summary: BatchSummary):
+        self._results = results
+        self.summary = summary
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self._results
+
+
+async def iterate_bounded(
+    items: Sequence[T],
+    worker: Callable[[T], Awaitable[R]],
+    max_concurrency: int,
+) -> AsyncIterator[R]:
+    """Ejecutar worker(item) con a lo sumo max_concurrency en paralelo"""
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
+
+    queue: "asyncio.Queue[Any]" = asyncio.Queue()
+    pending = iter(items)
+    closing = False
+
+    async def _consume():
+        # El iterador es compartido: cada worker toma el siguiente item libre
+        for item in pending:
+            try:
+                await queue.put(await worker(item))
+            except asyncio.CancelledError as e:
+                # Cancelación ajena al cierre del lote: el item también
+                # entrega su resultado para que la espera no se quede colgada
+                if not closing:
+                    queue.put_nowait(e)
+                raise
+            except Exception as e:
+                await queue.put(e)
+
+    workers = [
+        asyncio.ensure_future(_consume())
+        for _ in range(min(max_concurrency, len(items)))
+    ]
+    try:
+        for _ in range(len(items)):
+            outcome = await queue.get()
+            if isinstance(outcome, BaseException):
+                raise outcome
+            yield outcome
+    finally:
+        closing = True
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -0,0 +1,272 @@
+# src/genesis_core/orchestrator/blob_store.py
+"""
+Blobs direccionados por contenido para resultados grandes entre tareas
+
+Los resultados que genesis_core inyecta en los params de las tareas
+(seeded_results: arquitectura cacheada, regeneración incremental,
+reanudación, relanzamiento por hedging) se serializan una vez, se
+guardan por su sha256 y en los params solo viaja un handle:
+
+    {"$blob": "<sha256>", "size": 412345, "encoding": "json"}
+
+con "path" además si el store tiene directorio (agentes en otro proceso
+lo mapean con mmap). Los consumidores leen el contenido con read(), que
+devuelve un memoryview sin copia, y solo lo decodifican si lo necesitan.
+
+Cada workflow retiene los blobs que referencia; al terminar se liberan y
+un blob sin workflows que lo usen se borra. La serialización de un mismo
+objeto se reutiliza mientras el blob exista (los resultados sembrados se
+tratan como inmutables).
+"""
+
+import asyncio
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Set, Tuple
+
+HANDLE_KEY = "$blob"
+
+
+@dataclass(frozen=True)
+class BlobHandle:
+    """Referencia a un blob: digest, tamaño, codificación y ruta opcional"""
+    digest: str
+    size: int
+    encoding: str
+    path: Optional[str] = None
+
+    def to_param(self) -> Dict[str, Any]:
+        param = {HANDLE_KEY: self.digest, "size": self.size, "encoding": self.encoding}
+        if self.path is not None:
+            param["path"] = self.path
+        return param
+
+    @classmethod
+    def from_param(cls, param: Dict[str, Any]) -> "BlobHandle":
+        return cls(param[HANDLE_KEY], param["size"], param["encoding"], param.get("path"))
+
+
+def is_handle(value: Any) -> bool:
+    """Un param es un handle de blob"""
+    return isinstance(value, dict) and HANDLE_KEY in value
+
+
+def encode(value: Any) -> Tuple[bytes, str]:
+    """Bytes y codificación de un resultado (bytes, texto o JSON canónico)"""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value), "bytes"
+    if isinstance(value, str):
+        return value.encode("utf-8"), "text"
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8"), "json"
+
+
+def decode(data: memoryview, encoding: str) -> Any:
+    if encoding == "bytes":
+        return bytes(data)
+    if encoding == "text":
+        return str(data, "utf-8")
+    return json.loads(bytes(data))
+
+
+class _Blob:
+    __slots__ = ("handle", "data", "source", "workflows", "written")
+
+    def __init__(self, handle: BlobHandle, data: Optional[bytes], source: Any):
+        self.handle = handle
+        self.data = data
+        self.source = source
+        self.workflows: Set[str] = set()
+        # Escritura a disco en curso (compartida por quien pida el mismo blob)
+        self.written: Optional[asyncio.Future] = None
+
+
+class BlobStore:
+    """
+    Store de blobs con alcance por workflow
+
+    - threshold: tamaño serializado mínimo para sustituir un valor por handle
+    - directory: con directorio los blobs van a disco (legibles por mmap
+      desde otros procesos); sin él se guardan en memoria
+    """
+
+    def __init__(self, threshold: int = 64 * 1024, directory: Optional[str] = None):
+        self.threshold = threshold
+        self.directory = directory
+
+        self._blobs: Dict[str, _Blob] = {}
+        self._by_source: Dict[int, str] = {}
+        self._scopes: Dict[str, Set[str]] = {}
+        # Borrados de archivo en curso por digest: un blob nuevo con el
+        # mismo contenido se escribe cuando terminan
+        self._removing: Dict[str, asyncio.Future] = {}
+        self._stats = {
+            "stored": 0,
+            "reused": 0,
+            "released": 0,
+            "bytes_deduplicated": 0,
+        }
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    # Escritura
+
+    async def reference(self, workflow_id: str, value: Any) -> Any:
+        """Handle (como param) para value, o value tal cual si es pequeño"""
+        digest = self._by_source.get(id(value))
+        blob = self._blobs.get(digest) if digest is not None else None
+        if blob is None or blob.source is not value:
+            data, encoding = encode(value)
+            if len(data) < self.threshold:
+                return value
+            blob = self._store(data, encoding, value)
+
+        # La referencia se registra antes de esperar la escritura: un
+        # release concurrente de otro workflow no puede borrar el blob
+        digest = blob.handle.digest
+        scope = self._scopes.setdefault(workflow_id, set())
+        scope.add(digest)
+        blob.workflows.add(workflow_id)
+        if blob.written is not None:
+            try:
+                await asyncio.shield(blob.written)
+            except Exception:
+                # Escritura fallida: olvidar el blob para que se reintente
+                scope.discard(digest)
+                blob.workflows.discard(workflow_id)
+                if self._blobs.get(digest) is blob:
+                    del self._blobs[digest]
+                    self._by_source.pop(id(blob.source), None)
+                raise
+        return blob.handle.to_param()
+
+    async def reference_all(self, workflow_id: str, values: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: await self.reference(workflow_id, value) for key, value in values.items()}
+
+    def _store(self, data: bytes, encoding: str, source: Any) -> _Blob:
+        """Blob para data: el existente o uno nuevo registrado ya (sin await)"""
+        digest = hashlib.sha256(data).hexdigest()
+        blob = self._blobs.get(digest)
+        if blob is not None:
+            # Mismo contenido desde otro objeto (o en escritura): se comparte
+            self._stats["reused"] += 1
+            self._stats["bytes_deduplicated"] += len(data)
+            return blob
+
+        path = os.path.join(self.directory, digest) if self.directory else None
+        blob = _Blob(BlobHandle(digest, len(data), encoding, path), None if path else data, source)
+        if path is not None:
+            blob.written = asyncio.ensure_future(
+                self._write_after(self._removing.get(digest), path, data)
+            )
+        self._blobs[digest] = blob
+        self._by_source[id(source)] = digest
+        self._stats["stored"] += 1
+        return blob
+
+    async def _write_after(self, removal: Optional[asyncio.Future], path: str, data: bytes):
+        if removal is not None:
+            await asyncio.gather(asyncio.shield(removal), return_exceptions=True)
+        await asyncio.to_thread(self._write, path, data)
+
+    @staticmethod
+    def _write(path: str, data: bytes):
+        if os.path.exists(path):
+            return
+        directory = os.path.dirname(path)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".blob-")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    # Lectura
+
+    def read(self, handle: Any) -> memoryview:
+        """Contenido de un blob sin copiarlo (handle o param con "$blob")"""
+        if is_handle(handle):
+            handle = BlobHandle.from_param(handle)
+        blob = self._blobs.get(handle.digest)
+        if blob is not None and blob.data is not None:
+            return memoryview(blob.data)
+
+        path = handle.path or (blob.handle.path if blob is not None else None)
+        if path is None:
+            raise KeyError(f"Unknown blob: {handle.digest}")
+        if handle.size == 0:
+            return memoryview(b"")
+        with open(path, "rb") as fh:
+            # El memoryview mantiene vivo el mapeo
+            return memoryview(mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def load(self, handle: Any) -> Any:
+        """Contenido decodificado de un blob"""
+        if is_handle(handle):
+            handle = BlobHandle.from_param(handle)
+        return decode(self.read(handle), handle.encoding)
+
+    # Liberación
+
+    async def release(self, workflow_id: str) -> int:
+        """Soltar los blobs de un workflow; devuelve los blobs borrados"""
+        removed = []
+        for digest in self._scopes.pop(workflow_id, ()):
+            blob = self._blobs.get(digest)
+            if blob is None:
+                continue
+            blob.workflows.discard(workflow_id)
+            if not blob.workflows:
+                del self._blobs[digest]
+                self._by_source.pop(id(blob.source), None)
+                removed.append(blob)
+
+        # El borrado queda registrado por digest antes de cualquier await
+        on_disk = [blob for blob in removed if blob.handle.path]
+        if on_disk:
+            removal = asyncio.ensure_future(self._remove(on_disk))
+            for blob in on_disk:
+                self._removing[blob.handle.digest] = removal
+            removal.add_done_callback(lambda done: self._forget_removal(on_disk, done))
+            await asyncio.shield(removal)
+        self._stats["released"] += len(removed)
+        return len(removed)
+
+    async def _remove(self, blobs):
+        # Una escritura aún en curso crearía el archivo después del unlink
+        pending = [blob.written for blob in blobs if blob.written is not None]
+        if pending:
+            await asyncio.gather(*(asyncio.shield(w) for w in pending), return_exceptions=True)
+        await asyncio.to_thread(self._unlink, [blob.handle.path for blob in blobs])
+
+    def _forget_removal(self, blobs, removal: asyncio.Future):
+        for blob in blobs:
+            if self._removing.get(blob.handle.digest) is removal:
+                del self._removing[blob.handle.digest]
+
+    @staticmethod
+    def _unlink(paths):
+        for path in paths:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+    # Métricas
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            **self._stats,
+            "blobs": len(self._blobs),
+            "bytes": sum(blob.handle.size for blob in self._blobs.values()),
+            "workflows": len(self._scopes),
+        }
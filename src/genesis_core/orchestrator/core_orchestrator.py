@@ -11,30 +11,102 @@ MANDAMIENTOS CUMPLIDOS:
 """
 
 import asyncio
+import inspect
+import logging
+import os
+import socket
+import time
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
-from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, List, Mapping, Optional, Sequence, Set,
+    Tuple,
+)
+from dataclasses import dataclass, field, replace
 
-# MANDAMIENTO: Usar exclusivamente primitivas de MCPturbo
-from mcpturbo import protocol, orchestrator as mcp_orchestrator
-from mcpturbo.agents import AgentRegistry
-from mcpturbo.workflows import WorkflowDefinition, Task
+# MCPturbo, pydantic y los backends de estado (sqlalchemy, redis) se
+# importan donde se usan: importar este módulo no los carga
+if TYPE_CHECKING:
+    from mcpturbo.workflows import WorkflowDefinition
 
-from genesis_core.state.project_state import ProjectState
-from genesis_core.state.workflow_state import WorkflowState
-from genesis_core.config.project_config import ProjectConfig
-from genesis_core.exceptions import CoreOrchestratorError
+    from genesis_core.state.project_state import ProjectState
+    from genesis_core.state.workflow_state import WorkflowState
+    from genesis_core.state.persistence import StatePersistence
+    from genesis_core.state.checkpoint import CheckpointStore
+    from genesis_core.state.distributed import DistributedCoordinator
+    from genesis_core.config.project_config import ProjectConfig
+    from genesis_core.config.orchestrator_config import OrchestratorConfig
+
+from genesis_core.exceptions import (
+    AdmissionRejectedError,
+    CoreOrchestratorError,
+    OrchestratorDrainingError,
+)
+from genesis_core.orchestrator.admission import AdmissionController, Priority
+from genesis_core.orchestrator.agent_index import AgentAvailabilityIndex
+from genesis_core.orchestrator.agent_pool import AgentPool, agent_type
+from genesis_core.orchestrator.blob_store import BlobStore
+from genesis_core.orchestrator.batch import BatchGeneration, BatchSummary, iterate_bounded
+from genesis_core.orchestrator.drain import DrainReport, drain_workflows
+from genesis_core.orchestrator.event_ingestion import EventIngestor
+from genesis_core.orchestrator.events import (
+    GenerationEvent,
+    GenerationFinished,
+    WorkflowEventBus,
+)
+from genesis_core.orchestrator.hedging import HedgeWin, HedgingPolicy, WorkflowHedges
+from genesis_core.orchestrator.result_cache import ArchitectureCache, canonical_hash
+from genesis_core.orchestrator.metrics import MetricsRegistry
+from genesis_core.orchestrator.manifest import FileManifest, ManifestWriter
+from genesis_core.orchestrator.output_sink import OutputSink
+from genesis_core.orchestrator.incremental import (
+    GenerationSnapshot,
+    SnapshotStore,
+    carried_files,
+    carried_task_files,
+    plan_incremental,
+)
+from genesis_core.orchestrator.parallelism import ParallelismDecision, ParallelismPlanner
+from genesis_core.orchestrator.single_flight import SingleFlight
+from genesis_core.orchestrator.retention import WorkflowRetention
+from genesis_core.orchestrator.tracing import WorkflowTrace
+from genesis_core.orchestrator.workflow_builder import compile_workflow, workflow_key
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
 class GenerationRequest:
     """Request para generación de proyecto"""
-    project_config: ProjectConfig
+    project_config: "ProjectConfig"
     output_path: str
     workflow_id: Optional[str] = None
     callback_url: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    priority: Priority = Priority.NORMAL
+    
+    def to_payload(self) -> Dict[str, Any]:
+        """Forma serializable (para relanzar el request en otro nodo)"""
+        return {
+            "project_config": self.project_config.to_dict(),
+            "output_path": self.output_path,
+            "callback_url": self.callback_url,
+            "metadata": self.metadata,
+            "priority": int(self.priority),
+        }
+    
+    @classmethod
+    def from_payload(cls, workflow_id: str, payload: Dict[str, Any]) -> "GenerationRequest":
+        from genesis_core.config.validation import default_validator
+        
+        return cls(
+            project_config=default_validator.validate(payload["project_config"]),
+            output_path=payload["output_path"],
+            workflow_id=workflow_id,
+            callback_url=payload.get("callback_url"),
+            metadata=payload.get("metadata") or {},
+            priority=Priority(payload.get("priority", Priority.NORMAL)),
+        )
 
 
 @dataclass
@@ -47,6 +119,46 @@ class GenerationResult:
     error: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     execution_time: float = 0.0
+    manifest: Optional[FileManifest] = None
+
+
+def _mcp_protocol():
+    from mcpturbo import protocol
+    return protocol
+
+
+def _mcp_orchestrator():
+    from mcpturbo import orchestrator
+    return orchestrator
+
+
+def _agent_registry():
+    from mcpturbo.agents import AgentRegistry
+    return AgentRegistry()
+
+
+class _MCPturbo:
+    """
+    Atributo resuelto contra MCPturbo en el primer acceso (a más tardar en
+    start()); un valor asignado antes (p. ej. un mock) no se sustituye
+    """
+
+    def __init__(self, resolve: Callable[[], Any]):
+        self.resolve = resolve
+
+    def __set_name__(self, owner, name: str):
+        self.slot = "_" + name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = instance.__dict__.get(self.slot)
+        if value is None:
+            value = instance.__dict__[self.slot] = self.resolve()
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.slot] = value
 
 
 class CoreOrchestrator:
@@ -66,21 +178,181 @@ class CoreOrchestrator:
     - CLI o UI (eso es de genesis-cli)
     """
     
-    def __init__(self):
-        # MANDAMIENTO: Usar MCPturbo, no protocolo propio
-        self.mcp_protocol = protocol
-        self.mcp_orchestrator = mcp_orchestrator
-        self.agent_registry = AgentRegistry()
+    # MANDAMIENTO: Usar MCPturbo, no protocolo propio (se conecta en start())
+    mcp_protocol = _MCPturbo(_mcp_protocol)
+    mcp_orchestrator = _MCPturbo(_mcp_orchestrator)
+    agent_registry = _MCPturbo(_agent_registry)
+    
+    def __init__(self, config: Optional["OrchestratorConfig"] = None):
+        if config is None:
+            from genesis_core.config.orchestrator_config import OrchestratorConfig
+            config = OrchestratorConfig()
+        self.config = config
+        
+        # Índice local de agentes disponibles (eventos + reconciliación)
+        self.agent_index = AgentAvailabilityIndex()
+        self._reconcile_task: Optional[asyncio.Task] = None
+        self._retention_task: Optional[asyncio.Task] = None
+        
+        # Enrutado de tareas entre instancias de cada agente
+        self.agent_pool = AgentPool(
+            self.agent_index,
+            strategy=self.config.agent_routing,
+            alpha=self.config.agent_latency_alpha,
+        )
+        self.routing_decisions: Dict[str, Dict[str, str]] = {}
         
         # Estado interno
-        self.project_states: Dict[str, ProjectState] = {}
-        self.workflow_states: Dict[str, WorkflowState] = {}
+        self.project_states: Dict[str, "ProjectState"] = {}
+        self.workflow_states: Dict[str, "WorkflowState"] = {}
+        
+        # Eventos de progreso por workflow (broadcasts task.* de MCPturbo)
+        self.events = WorkflowEventBus()
+        
+        # Ingesta de broadcasts: se encolan y se aplican por lotes
+        self.ingestion = EventIngestor(
+            max_queue=self.config.event_queue_size,
+            batch_size=self.config.event_batch_size,
+        )
+        for topic, handler, timed in (
+            ("workflow.completed", self._handle_workflow_completed, False),
+            ("workflow.failed", self._handle_workflow_failed, False),
+            ("task.queued", self._handle_task_queued, True),
+            ("task.started", self._handle_task_started, True),
+            ("task.progress", self._handle_task_progress, False),
+            ("task.completed", self._handle_task_completed, True),
+            ("task.failed", self._handle_task_failed, True),
+            ("agent.registered", self._handle_agent_registered, False),
+            ("agent.deregistered", self._handle_agent_deregistered, False),
+        ):
+            self.ingestion.register(topic, handler, timed=timed)
+        self._manifest_writers: Dict[str, ManifestWriter] = {}
+        
+        # Sink de salida con deduplicación por contenido (opcional)
+        self.output_sink: Optional[OutputSink] = None
+        if self.config.output_sink_dir:
+            self.output_sink = OutputSink(
+                self.config.output_sink_dir,
+                link=self.config.output_sink_link,
+                batch_size=self.config.output_sink_batch_size,
+                fsync=self.config.output_sink_fsync,
+            )
+        
+        # Spans por tarea (encolado/inicio/fin) para timeline y ruta crítica
+        self.traces: Dict[str, WorkflowTrace] = {}
+        
+        # Persistencia write-behind (opcional)
+        self.persistence: Optional["StatePersistence"] = None
+        if self.config.persistence_url:
+            from genesis_core.state.persistence import StatePersistence
+            
+            self.persistence = StatePersistence(
+                url=self.config.persistence_url,
+                batch_size=self.config.persistence_batch_size,
+                flush_interval=self.config.persistence_flush_interval,
+                max_pending=self.config.persistence_max_pending,
+            )
+        
+        # Checkpoints de resultados por tarea (reanudar tras un reinicio)
+        self.checkpoints: Optional["CheckpointStore"] = None
+        if self.config.checkpoint_dir:
+            from genesis_core.state.checkpoint import CheckpointStore
+            
+            self.checkpoints = CheckpointStore(
+                self.config.checkpoint_dir,
+                fsync=self.config.checkpoint_fsync,
+                ttl=self.config.checkpoint_ttl,
+            )
+        
+        # Modo distribuido: leases por workflow y estado compartido en Redis
+        self.distributed: Optional["DistributedCoordinator"] = None
+        if self.config.distributed_redis_url:
+            from genesis_core.state.distributed import DistributedCoordinator, connect
+            
+            self.distributed = DistributedCoordinator(
+                connect(self.config.distributed_redis_url),
+                node_id=self.config.node_id or f"{socket.gethostname()}-{uuid.uuid4().hex[:8]}",
+                lease_ttl=self.config.lease_ttl,
+                shards=self.config.lease_shards,
+                on_lease_lost=self._handle_lease_lost,
+            )
+        self._takeover_task: Optional[asyncio.Task] = None
+        self._taken_over: Set[asyncio.Task] = set()
+        
+        # Snapshots (config + resultados por tarea) para regeneración incremental
+        self.snapshots = SnapshotStore(max_entries=self.config.incremental_snapshot_limit)
+        
+        # Retención: los workflows terminados se archivan como resúmenes
+        self.retention = WorkflowRetention(
+            max_live=self.config.retention_max_live_workflows,
+            max_age=self.config.retention_max_age,
+            max_archived=self.config.retention_max_archived,
+            spill_path=self.config.retention_spill_path,
+            max_spilled=self.config.retention_max_spilled,
+        )
         
         # Control de ejecución
         self.running = False
         self.active_workflows: Set[str] = set()
+        self._runs: Dict[str, asyncio.Future] = {}
+        # Tarea propia que ejecuta cada run (para cancelar los que aún no
+        # llegaron a MCPturbo)
+        self._run_tasks: Dict[str, asyncio.Task] = {}
+        # workflow_id -> task_id -> archivos reportados en task.completed
+        self._task_files: Dict[str, Dict[str, List[str]]] = {}
+        self.single_flight: SingleFlight[GenerationResult] = SingleFlight()
+        self.admission = AdmissionController(
+            max_in_flight=self.config.max_in_flight_workflows,
+            max_queue_depth=self.config.admission_queue_depth,
+            aging_interval=self.config.admission_aging_interval,
+        )
+        
+        # Paralelismo efectivo por workflow (ancho del DAG + carga global)
+        self.parallelism = ParallelismPlanner(
+            global_budget=self.config.parallelism_global_budget,
+            agent_capacity=self.config.agent_concurrency_limits,
+        )
+        self.parallelism_decisions: Dict[str, ParallelismDecision] = {}
         
-        # Métricas
+        # Hedging de tareas rezagadas (opcional)
+        self.hedging: Optional[HedgingPolicy] = None
+        if self.config.hedging_enabled:
+            self.hedging = HedgingPolicy(
+                quantile=self.config.hedge_quantile,
+                min_samples=self.config.hedge_min_samples,
+                budget=self.config.hedge_budget,
+                min_delay=self.config.hedge_min_delay,
+            )
+        self._hedges: Dict[str, WorkflowHedges] = {}
+        
+        # Resultados sembrados grandes como handles a blobs (opcional)
+        self.blobs: Optional[BlobStore] = None
+        if self.config.blob_handles_enabled:
+            self.blobs = BlobStore(
+                threshold=self.config.blob_threshold,
+                directory=self.config.blob_dir,
+            )
+        
+        # Cache de la fase de arquitectura (resultados de architect_agent)
+        self.architecture_cache = ArchitectureCache(
+            max_entries=self.config.architecture_cache_size,
+            ttl=self.config.architecture_cache_ttl,
+            directory=self.config.architecture_cache_dir,
+            max_disk_entries=self.config.architecture_cache_disk_size,
+        )
+        
+        # Métricas: contadores/histogramas con reloj monotónico
+        self.telemetry = MetricsRegistry()
+        for name, help_text in (
+            ("generations_total", "Generation requests by outcome"),
+            ("tasks_total", "Workflow tasks by outcome"),
+            ("generation_seconds", "End-to-end generation latency"),
+            ("phase_seconds", "Latency per generation phase"),
+            ("task_seconds", "Latency per workflow task"),
+            ("agent_seconds", "Task latency per agent"),
+        ):
+            self.telemetry.describe(name, help_text)
+        self._task_started: Dict[Tuple[str, str], float] = {}
         self.metrics = {
             "projects_created": 0,
             "workflows_executed": 0,
@@ -93,38 +365,119 @@ class CoreOrchestrator:
         if self.running:
             return
         
-        # MANDAMIENTO: Delegar inicialización a MCPturbo
+        # MANDAMIENTO: Delegar inicialización a MCPturbo. Se importa y
+        # conecta aquí para que el primer request no pague la importación
+        for name in ("mcp_protocol", "mcp_orchestrator", "agent_registry"):
+            getattr(self, name)
         await self.mcp_protocol.start()
+        self.admission.reopen()
+        
+        if self.persistence is not None:
+            await self.persistence.start()
+        
+        # Checkpoints que ya nadie va a reanudar
+        if self.checkpoints is not None:
+            await self.checkpoints.expire()
+        
+        if self.distributed is not None:
+            await self.distributed.start()
+            if self.config.takeover_interval > 0:
+                self._takeover_task = asyncio.ensure_future(self._takeover_loop())
         
         # Configurar handlers de eventos
+        await self.ingestion.start()
         self._setup_event_handlers()
         
+        # Precargar índice de agentes; si el registry aún no responde se
+        # cargará en la primera validación
+        try:
+            await self._reconcile_agent_index()
+        except Exception as e:
+            logger.warning("Agent index warm-up failed: %s", e)
+        
+        if self.config.agent_reconcile_interval > 0:
+            self._reconcile_task = asyncio.ensure_future(self._agent_reconcile_loop())
+        if self.config.retention_interval > 0:
+            self._retention_task = asyncio.ensure_future(self._retention_loop())
+        
         self.running = True
     
-    async def stop(self):
-        """Detener el orquestador"""
+    async def stop(self, drain_timeout: Optional[float] = None) -> Optional[DrainReport]:
+        """
+        Detener el orquestador drenando los workflows activos
+        
+        Deja de admitir requests (los encolados se rechazan), espera hasta
+        drain_timeout a que terminen los activos y cancela el resto en
+        paralelo; con checkpoints quedan reanudables. Devuelve qué pasó
+        con cada workflow.
+        """
         if not self.running:
-            return
+            return None
+        
+        started = time.monotonic()
+        report = DrainReport(rejected_queued=self.admission.close())
+        if self._takeover_task is not None:
+            self._takeover_task.cancel()
+            self._takeover_task = None
         
-        # Cancelar workflows activos
-        for workflow_id in list(self.active_workflows):
-            await self.cancel_workflow(workflow_id)
+        # Checkpoints existentes: se listan una sola vez, tras cancelar
+        checkpointed: Optional[Set[str]] = None
+        
+        def resumable(workflow_id: str) -> bool:
+            nonlocal checkpointed
+            if checkpointed is None:
+                checkpointed = set(self.get_resumable_workflows())
+            return workflow_id in checkpointed
+        
+        async def cancel(workflow_id: str) -> bool:
+            # Aún arrancando (sin lanzar en MCPturbo): cancelar la tarea local
+            task = self._run_tasks.get(workflow_id)
+            if workflow_id not in self.active_workflows and task is not None:
+                task.cancel()
+                return True
+            return await self.cancel_workflow(workflow_id)
+        
+        report.outcomes = await drain_workflows(
+            set(self.active_workflows) | set(self._runs),
+            dict(self._runs),
+            cancel=cancel,
+            resumable=resumable,
+            timeout=self.config.drain_timeout if drain_timeout is None else drain_timeout,
+            cancel_timeout=self.config.drain_cancel_timeout,
+        )
+        report.duration = time.monotonic() - started
+        if report.outcomes or report.rejected_queued:
+            logger.info(
+                "Drained %d workflows in %.2fs: %s (rejected %d queued)",
+                len(report.outcomes), report.duration, report.summary(),
+                report.rejected_queued
+            )
+        
+        if self._reconcile_task is not None:
+            self._reconcile_task.cancel()
+            self._reconcile_task = None
+        if self._retention_task is not None:
+            self._retention_task.cancel()
+            self._retention_task = None
+        
+        # Soltar leases: lo que quede activo lo relanzará otro nodo
+        if self.distributed is not None:
+            await self.distributed.stop()
+        
+        # Aplicar eventos pendientes y volcar el estado antes de soltar el protocolo
+        await self.ingestion.stop()
+        if self.persistence is not None:
+            await self.persistence.stop()
         
         await self.mcp_protocol.stop()
         self.running = False
+        return report
     
     def _setup_event_handlers(self):
         """Configurar handlers de eventos MCPturbo"""
         # MANDAMIENTO: Usar sistema de eventos de MCPturbo
-        self.mcp_protocol.subscribe_to_broadcasts(
-            "workflow.completed", self._handle_workflow_completed
-        )
-        self.mcp_protocol.subscribe_to_broadcasts(
-            "workflow.failed", self._handle_workflow_failed
-        )
-        self.mcp_protocol.subscribe_to_broadcasts(
-            "agent.registered", self._handle_agent_registered
-        )
+        for topic in self.ingestion.topics:
+            self.mcp_protocol.subscribe_to_broadcasts(topic, self.ingestion.receiver(topic))
     
     async def execute_project_generation(
         self, request: GenerationRequest
@@ -133,13 +486,369 @@ class CoreOrchestrator:
         Ejecutar generación de proyecto completo
         
         INTERFAZ PRINCIPAL para consumidores externos (genesis-cli)
+        
+        Un request idéntico a otro en curso (misma config, output_path,
+        workflow_id y callback_url) no lanza otro workflow: recibe una copia
+        del mismo resultado. El workflow compartido se admite con la
+        prioridad del primer request.
         """
-        start_time = datetime.utcnow()
+        if not self.config.coalesce_identical_requests:
+            return await self._execute_project_generation(request)
+        
+        key = canonical_hash({
+            "config": request.project_config.to_dict(),
+            "output_path": request.output_path,
+            "workflow_id": request.workflow_id,
+            "callback_url": request.callback_url,
+        })
+        result = await self.single_flight.run(
+            key, lambda: self._execute_project_generation(request)
+        )
+        # Cada llamador recibe su copia: mutarla no afecta a los demás
+        return replace(
+            result,
+            generated_files=list(result.generated_files),
+            metadata=dict(result.metadata),
+        )
+    
+    async def _execute_project_generation(
+        self, request: GenerationRequest
+    ) -> GenerationResult:
+        started = time.monotonic()
         workflow_id = request.workflow_id or str(uuid.uuid4())
         
         try:
             # Validar configuración
             await self._validate_generation_request(request)
+        except Exception as e:
+            return self._rejected_result(workflow_id, e, started)
+        finally:
+            self.telemetry.observe(
+                "phase_seconds", time.monotonic() - started, phase="validation"
+            )
+        
+        return await self._admit_and_run(request, workflow_id, started)
+    
+    async def stream_project_generation(
+        self, request: GenerationRequest
+    ) -> AsyncIterator[GenerationEvent]:
+        """
+        Variante en streaming de execute_project_generation
+        
+        Entrega TaskStarted / TaskCompleted / TaskFailed a medida que
+        MCPturbo los emite y termina con GenerationFinished (el
+        GenerationResult completo). Si el consumidor abandona el stream,
+        la generación se cancela.
+        """
+        workflow_id = request.workflow_id or str(uuid.uuid4())
+        request = replace(request, workflow_id=workflow_id)
+        finished = object()
+        
+        queue = self.events.subscribe(workflow_id)
+        run = asyncio.ensure_future(self.execute_project_generation(request))
+        run.add_done_callback(lambda _: queue.put_nowait(finished))
+        try:
+            while True:
+                event = await queue.get()
+                if event is finished:
+                    break
+                yield event
+            
+            yield GenerationFinished(workflow_id, run.result())
+        finally:
+            self.events.unsubscribe(workflow_id, queue)
+            if not run.done():
+                run.cancel()
+    
+    async def execute_incremental_generation(
+        self,
+        previous_workflow_id: str,
+        new_config: "ProjectConfig",
+        priority: Priority = Priority.NORMAL,
+    ) -> GenerationResult:
+        """
+        Regenerar solo lo afectado por un cambio de configuración
+        
+        Compara la config del workflow anterior con new_config y reejecuta
+        las tareas que consumen los campos cambiados, más sus dependientes.
+        El resto de resultados se reutiliza del workflow anterior.
+        """
+        started = time.monotonic()
+        workflow_id = str(uuid.uuid4())
+        
+        snapshot = self.snapshots.get(previous_workflow_id)
+        if snapshot is None:
+            return self._rejected_result(
+                workflow_id,
+                CoreOrchestratorError(
+                    f"No reusable results for workflow: {previous_workflow_id}"
+                ),
+                started
+            )
+        
+        request = GenerationRequest(
+            project_config=new_config,
+            output_path=snapshot.output_path,
+            workflow_id=workflow_id,
+            metadata={"incremental_from": previous_workflow_id},
+            priority=priority
+        )
+        try:
+            await self._validate_generation_request(request)
+        except Exception as e:
+            return self._rejected_result(workflow_id, e, started)
+        
+        config_dict = new_config.to_dict()
+        plan = plan_incremental(
+            compile_workflow(*workflow_key(new_config)), snapshot, config_dict
+        )
+        incremental = {
+            "incremental_from": previous_workflow_id,
+            "changed_fields": list(plan.changed_fields),
+            "rerun_tasks": list(plan.rerun),
+            "reused_tasks": list(plan.reused),
+            "full_regeneration": plan.full
+        }
+        
+        if not plan.rerun:
+            # Nada que regenerar: el resultado anterior sigue vigente
+            manifest = snapshot.generated_files
+            if not isinstance(manifest, FileManifest):
+                manifest = None
+            return GenerationResult(
+                success=True,
+                workflow_id=previous_workflow_id,
+                project_path=snapshot.output_path,
+                generated_files=[] if manifest else list(snapshot.generated_files),
+                metadata=incremental,
+                execution_time=time.monotonic() - started,
+                manifest=manifest
+            )
+        
+        # Las tareas reejecutadas reciben la config nueva y qué cambió
+        task_params = {} if plan.full else {
+            task_id: {"config": config_dict, "changed_fields": list(plan.changed_fields)}
+            for task_id in plan.rerun
+        }
+        result = await self._admit_and_run(
+            request, workflow_id, started,
+            seeded_results=plan.seeded_results,
+            task_params=task_params,
+            base_files=() if plan.full else carried_files(snapshot, plan.rerun),
+            base_task_files={} if plan.full else carried_task_files(snapshot, plan.rerun)
+        )
+        result.metadata = {**(result.metadata or {}), **incremental}
+        return result
+    
+    async def resume_workflow(self, workflow_id: str) -> GenerationResult:
+        """
+        Reanudar un workflow interrumpido desde su checkpoint
+        
+        Reconstruye el DAG del request original y omite las tareas con
+        resultado guardado; esos resultados se inyectan en las
+        dependientes como en la regeneración incremental.
+        """
+        started = time.monotonic()
+        
+        if self.checkpoints is None:
+            return self._rejected_result(
+                workflow_id, CoreOrchestratorError("Checkpointing is not enabled"), started
+            )
+        if workflow_id in self.active_workflows:
+            return self._rejected_result(
+                workflow_id,
+                CoreOrchestratorError(f"Workflow is already running: {workflow_id}"),
+                started
+            )
+        
+        checkpoint = await self.checkpoints.load(workflow_id)
+        if checkpoint is None:
+            return self._rejected_result(
+                workflow_id,
+                CoreOrchestratorError(f"No checkpoint for workflow: {workflow_id}"),
+                started
+            )
+        
+        request = GenerationRequest.from_payload(workflow_id, checkpoint.request)
+        try:
+            await self._validate_generation_request(request)
+        except Exception as e:
+            return self._rejected_result(workflow_id, e, started)
+        
+        result = await self._admit_and_run(
+            request, workflow_id, started,
+            seeded_results=checkpoint.task_results,
+            task_params=checkpoint.task_params,
+            base_files=checkpoint.base_files,
+            base_task_files=checkpoint.task_files
+        )
+        result.metadata = {
+            **(result.metadata or {}),
+            "resumed_tasks": sorted(checkpoint.task_results)
+        }
+        return result
+    
+    def get_resumable_workflows(self) -> List[str]:
+        """Workflows con checkpoint que no se están ejecutando"""
+        if self.checkpoints is None:
+            return []
+        return [
+            workflow_id for workflow_id in self.checkpoints.workflow_ids()
+            if workflow_id not in self.active_workflows
+        ]
+    
+    async def _admit_and_run(
+        self,
+        request: GenerationRequest,
+        workflow_id: str,
+        started: float,
+        **run_options: Any,
+    ) -> GenerationResult:
+        """Admisión: esperar slot o rechazar rápido si la cola está llena"""
+        waiting = time.monotonic()
+        try:
+            await self.admission.acquire(request.priority)
+        except AdmissionRejectedError as e:
+            result = self._rejected_result(workflow_id, e, started)
+            result.metadata = {"queue_depth": e.queue_depth, "retry_after": e.retry_after}
+            return result
+        except OrchestratorDrainingError as e:
+            return self._rejected_result(workflow_id, e, started)
+        
+        self.telemetry.observe("phase_seconds", time.monotonic() - waiting, phase="admission")
+        try:
+            return await self._run_generation(request, workflow_id, started, **run_options)
+        finally:
+            self.admission.release()
+    
+    def execute_batch_generation(
+        self, requests: Sequence[GenerationRequest], max_concurrency: int = 8
+    ) -> BatchGeneration:
+        """
+        Ejecutar un lote de generaciones con concurrencia acotada
+        
+        Valida todo el lote antes de lanzar nada y resuelve los agentes
+        disponibles una sola vez. Los GenerationResult se entregan a medida
+        que terminan; batch.summary contiene los tiempos agregados.
+        """
+        if max_concurrency < 1:
+            raise CoreOrchestratorError("max_concurrency must be >= 1")
+        
+        summary = BatchSummary(total=len(requests))
+        return BatchGeneration(
+            self._iterate_batch(list(requests), max_concurrency, summary), summary
+        )
+    
+    async def _iterate_batch(
+        self,
+        requests: List[GenerationRequest],
+        max_concurrency: int,
+        summary: BatchSummary,
+    ) -> AsyncIterator[GenerationResult]:
+        """Validar el lote completo y ejecutar los requests aceptados"""
+        summary.start()
+        try:
+            # Una sola resolución de agentes para todo el lote
+            await self._ensure_agent_index()
+            
+            accepted, rejected = [], []
+            for request in requests:
+                started = time.monotonic()
+                workflow_id = request.workflow_id or str(uuid.uuid4())
+                try:
+                    await self._validate_generation_request(request)
+                except Exception as e:
+                    rejected.append(self._rejected_result(workflow_id, e, started))
+                    continue
+                accepted.append(replace(request, workflow_id=workflow_id))
+            
+            for result in rejected:
+                summary.record(result, rejected=True)
+                yield result
+            
+            async for result in iterate_bounded(
+                accepted, self._run_batch_item, max_concurrency
+            ):
+                summary.record(result)
+                yield result
+        finally:
+            summary.finish()
+    
+    async def _run_batch_item(self, request: GenerationRequest) -> GenerationResult:
+        started = time.monotonic()
+        
+        # El lote ya acota su concurrencia: espera en cola en vez de rechazar
+        waiting = time.monotonic()
+        try:
+            async with self.admission.slot(request.priority, reject_when_full=False):
+                self.telemetry.observe(
+                    "phase_seconds", time.monotonic() - waiting, phase="admission"
+                )
+                return await self._run_generation(request, request.workflow_id, started)
+        except OrchestratorDrainingError as e:
+            return self._rejected_result(request.workflow_id, e, started)
+    
+    async def _run_generation(
+        self, request: GenerationRequest, workflow_id: str, started: float, **options: Any
+    ) -> GenerationResult:
+        """
+        Ejecutar un request ya validado en una tarea propia del orquestador
+        
+        stop() solo cancela esa tarea (nunca la del llamador) y la
+        cancelación llega al llamador como un resultado "cancelled".
+        """
+        task = asyncio.ensure_future(
+            self._generate(request, workflow_id, started, **options)
+        )
+        self._run_tasks.setdefault(workflow_id, task)
+        try:
+            await asyncio.wait((task,))
+        except asyncio.CancelledError:
+            # Se canceló el llamador: la generación no le sobrevive
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            raise
+        finally:
+            if self._run_tasks.get(workflow_id) is task:
+                del self._run_tasks[workflow_id]
+        if task.cancelled():
+            return self._cancelled_result(workflow_id, started)
+        return task.result()
+    
+    async def _generate(
+        self,
+        request: GenerationRequest,
+        workflow_id: str,
+        started: float,
+        seeded_results: Optional[Dict[str, Any]] = None,
+        task_params: Optional[Dict[str, Dict[str, Any]]] = None,
+        base_files: Sequence[str] = (),
+        base_task_files: Optional[Mapping[str, Sequence[str]]] = None,
+    ) -> GenerationResult:
+        """
+        Cuerpo de _run_generation
+        
+        seeded_results: resultados ya conocidos (esas tareas no se ejecutan)
+        task_params: params extra por tarea
+        base_files: archivos previos que siguen vigentes (incremental)
+        base_task_files: a qué tarea pertenece cada uno de base_files
+        """
+        from genesis_core.state.project_state import ProjectState
+        from genesis_core.state.workflow_state import WorkflowState
+        
+        # Si la tarea se cancela no pasa por ningún otro camino
+        outcome = "cancelled"
+        run = asyncio.get_running_loop().create_future()
+        self._runs.setdefault(workflow_id, run)
+        self._task_files[workflow_id] = {
+            task_id: list(files) for task_id, files in (base_task_files or {}).items()
+        }
+        try:
+            # Modo distribuido: un único nodo dueño por workflow
+            if self.distributed is not None and not await self.distributed.acquire(
+                workflow_id, request.to_payload()
+            ):
+                raise CoreOrchestratorError(f"Workflow is owned by another node: {workflow_id}")
             
             # Crear estado del proyecto
             project_state = ProjectState(
@@ -147,12 +856,29 @@ class CoreOrchestrator:
                 template=request.project_config.template,
                 config=request.project_config,
                 output_path=request.output_path,
-                created_at=start_time
+                created_at=datetime.utcnow()
             )
             self.project_states[workflow_id] = project_state
+            if self.persistence is not None:
+                self.persistence.record_project(workflow_id, project_state)
+            
+            # Reutilizar arquitectura si ya se diseñó para esta configuración
+            config_dict = request.project_config.to_dict()
+            cache_key = canonical_hash(config_dict)
+            seeded = dict(seeded_results or {})
+            if "design_architecture" not in seeded:
+                cached_architecture = await self.architecture_cache.lookup(cache_key)
+                if cached_architecture is not None:
+                    seeded["analyze_architecture"] = cached_architecture.analysis
+                    seeded["design_architecture"] = cached_architecture.design
             
             # Construir workflow usando MCPturbo
-            workflow_def = await self._build_generation_workflow(request)
+            building = time.monotonic()
+            workflow_def = await self._build_generation_workflow(
+                request, workflow_id, seeded, config_dict, task_params
+            )
+            self.telemetry.observe("phase_seconds", time.monotonic() - building, phase="build")
+            self.traces[workflow_id] = WorkflowTrace.from_definition(workflow_def)
             
             # Crear estado del workflow
             workflow_state = WorkflowState(
@@ -160,30 +886,103 @@ class CoreOrchestrator:
                 definition=workflow_def,
                 project_state=project_state,
                 status="running",
-                started_at=start_time
+                started_at=project_state.created_at
             )
             self.workflow_states[workflow_id] = workflow_state
+            self._persist_workflow(workflow_id)
+            await self._publish_status(workflow_id)
             self.active_workflows.add(workflow_id)
             
+            # Manifest: se alimenta con los task.completed durante la ejecución
+            if self.config.manifest_dir:
+                self._manifest_writers[workflow_id] = ManifestWriter(
+                    os.path.join(self.config.manifest_dir, f"{workflow_id}.manifest"),
+                    root=request.output_path
+                )
+            
+            # Checkpoint: request y resultados ya conocidos; los task.completed
+            # se irán añadiendo durante la ejecución
+            if self.checkpoints is not None:
+                await self.checkpoints.begin(
+                    workflow_id, request.to_payload(), seeded, task_params, base_files
+                )
+            
             # MANDAMIENTO: Ejecutar usando MCPturbo orchestrator
-            result = await self.mcp_orchestrator.execute_workflow(
-                workflow_id, workflow_def
-            )
+            self.metrics["workflows_executed"] += 1
+            executing = time.monotonic()
+            if self.hedging is None:
+                result = await self.mcp_orchestrator.execute_workflow(
+                    workflow_id, workflow_def
+                )
+            else:
+                hedges = self._hedges[workflow_id] = self._workflow_hedges(
+                    request, workflow_id, seeded, config_dict, task_params
+                )
+                result = await self._execute_hedged(
+                    request, workflow_id, workflow_def, hedges, config_dict, task_params
+                )
+            self.telemetry.observe("phase_seconds", time.monotonic() - executing, phase="execute")
+            
+            # Aplicar los eventos del workflow que aún estén en cola
+            await self.ingestion.flush()
+            hedged_results: Dict[str, Any] = {}
+            hedged_files: List[str] = []
+            hedges = self._hedges.pop(workflow_id, None)
+            if hedges is not None:
+                hedges.close()
+                if hedges.restarts:
+                    # Lo resuelto antes de relanzar no viene en el último resultado
+                    hedged_results = hedges.results
+                    hedged_files = hedges.carried_files()
+                    base_files = [*base_files, *hedged_files]
             
             # Procesar resultado
-            execution_time = (datetime.utcnow() - start_time).total_seconds()
+            execution_time = time.monotonic() - started
+            self._mark_finished(
+                workflow_id, "completed" if result.success else "failed",
+                None if result.success else result.error
+            )
+            outcome = self._workflow_outcome(workflow_id, result.success)
             
             if result.success:
+                task_results = {**hedged_results, **self._task_results(result)}
+                await self._cache_architecture(cache_key, task_results)
+                if self.checkpoints is not None:
+                    await self.checkpoints.discard(workflow_id)
+                
+                generated_files = result.generated_files
+                digests = await self._sink_outputs(
+                    request.output_path, [*generated_files, *hedged_files]
+                )
+                manifest = await self._finish_manifest(
+                    workflow_id, [*generated_files, *base_files], digests
+                )
+                if manifest is not None:
+                    generated_files = []
+                elif base_files:
+                    generated_files = list(dict.fromkeys([*base_files, *generated_files]))
+                
+                self.snapshots.record(workflow_id, GenerationSnapshot(
+                    config=config_dict,
+                    output_path=request.output_path,
+                    task_results={**seeded, **task_results},
+                    generated_files=manifest or tuple(generated_files),
+                    task_files={
+                        task_id: tuple(files)
+                        for task_id, files in self._task_files.get(workflow_id, {}).items()
+                    }
+                ))
+                
                 self.metrics["projects_created"] += 1
-                self.metrics["workflows_executed"] += 1
                 
                 return GenerationResult(
                     success=True,
                     workflow_id=workflow_id,
                     project_path=request.output_path,
-                    generated_files=result.generated_files,
+                    generated_files=generated_files,
                     execution_time=execution_time,
-                    metadata=result.metadata
+                    metadata=result.metadata,
+                    manifest=manifest
                 )
             else:
                 return GenerationResult(
@@ -194,101 +993,483 @@ class CoreOrchestrator:
                 )
                 
         except Exception as e:
-            return GenerationResult(
-                success=False,
-                workflow_id=workflow_id,
-                error=f"Error en orquestación: {str(e)}",
-                execution_time=(datetime.utcnow() - start_time).total_seconds()
-            )
+            outcome = "failure"
+            self._mark_finished(workflow_id, "failed", str(e))
+            return self._error_result(workflow_id, e, started)
         finally:
+            finished = time.monotonic()
+            self._record_outcome(outcome, finished - started)
+            trace = self.traces.get(workflow_id)
+            if trace is not None:
+                trace.finish(finished)
+            for key in [key for key in self._task_started if key[0] == workflow_id]:
+                del self._task_started[key]
+            
+            if self.distributed is not None:
+                await self._publish_status(workflow_id)
+                await self.distributed.release(workflow_id)
+            
             # Cleanup
+            hedges = self._hedges.pop(workflow_id, None)
+            if hedges is not None:
+                hedges.close()
+            run.set_result(outcome)
+            if self._runs.get(workflow_id) is run:
+                del self._runs[workflow_id]
+                self._task_files.pop(workflow_id, None)
+            writer = self._manifest_writers.pop(workflow_id, None)
+            if writer is not None:
+                writer.close()
             self.active_workflows.discard(workflow_id)
+            self.parallelism.release(workflow_id)
+            self.agent_pool.release(workflow_id)
+            if self.blobs is not None:
+                await self.blobs.release(workflow_id)
+            self._enforce_retention()
     
-    async def _build_generation_workflow(
-        self, request: GenerationRequest
-    ) -> WorkflowDefinition:
+    def _workflow_hedges(
+        self,
+        request: GenerationRequest,
+        workflow_id: str,
+        seeded: Dict[str, Any],
+        config_dict: Dict[str, Any],
+        task_params: Optional[Dict[str, Dict[str, Any]]],
+    ) -> WorkflowHedges:
+        """Estado de hedging del workflow, con el DAG compilado del request"""
+        compiled = compile_workflow(*workflow_key(request.project_config))
+        
+        async def bind(hedge_id: str, task_id: str, agent_id: str, known: Dict[str, Any]):
+            return compiled.bind(
+                config_dict,
+                request.output_path,
+                hedge_id,
+                seeded_results=await self._seeded_params(workflow_id, known),
+                task_params=task_params,
+                max_parallel_tasks=1,
+                timeout=self.config.workflow_timeout,
+                only=(task_id,),
+                agents={task_id: agent_id},
+            )
+        
+        return WorkflowHedges(
+            seeded, {spec.id: spec.dependencies for spec in compiled.tasks}, bind
+        )
+    
+    async def _execute_hedged(
+        self,
+        request: GenerationRequest,
+        workflow_id: str,
+        workflow_def: "WorkflowDefinition",
+        hedges: WorkflowHedges,
+        config_dict: Dict[str, Any],
+        task_params: Optional[Dict[str, Dict[str, Any]]],
+    ) -> Any:
         """
-        Construir workflow de generación usando MCPturbo
+        execute_workflow compitiendo con los duplicados de tareas rezagadas
         
-        MANDAMIENTO: No implementar lógica de workflow propia
+        Si un duplicado gana, el intento en curso se cancela y el workflow
+        se relanza con lo ya resuelto como seeded_results
         """
-        tasks = []
-        
-        # 1. Análisis de arquitectura
-        tasks.append(Task(
-            id="analyze_architecture",
-            agent_id="architect_agent",
-            action="analyze_requirements",
-            params={
-                "config": request.project_config.to_dict(),
-                "output_path": request.output_path
-            },
-            dependencies=[]
-        ))
+        while True:
+            attempt = asyncio.ensure_future(
+                self.mcp_orchestrator.execute_workflow(workflow_id, workflow_def)
+            )
+            try:
+                await asyncio.wait({attempt, hedges.won}, return_when=asyncio.FIRST_COMPLETED)
+            except asyncio.CancelledError:
+                attempt.cancel()
+                raise
+            if attempt.done() or workflow_id not in self.active_workflows:
+                return await attempt
+            
+            win: HedgeWin = hedges.won.result()
+            await self.mcp_orchestrator.cancel_workflow(workflow_id)
+            finished = (await asyncio.gather(attempt, return_exceptions=True))[0]
+            if not isinstance(finished, BaseException) and finished.success:
+                # Terminó mientras se cancelaba
+                return finished
+            logger.info(
+                "Hedge of %s/%s won on %s, relaunching workflow",
+                workflow_id, win.task_id, win.agent_id
+            )
+            
+            # Descartar lo que dejó el intento cancelado
+            await self.ingestion.flush()
+            now = time.monotonic()
+            trace = self.traces.get(workflow_id)
+            if trace is not None:
+                trace.end(win.task_id, now, "hedged")
+            for key in [key for key in self._task_started if key[0] == workflow_id]:
+                del self._task_started[key]
+            state = self.workflow_states.get(workflow_id)
+            if state is not None and state.status != "running":
+                state.status, state.completed_at, state.error = "running", None, None
+                self._persist_workflow(workflow_id)
+            
+            hedges.restart(win)
+            self._record_task_files(workflow_id, win.task_id, win.generated_files)
+            await self._checkpoint_task({
+                "workflow_id": workflow_id, "task_id": win.task_id, "result": win.result,
+                "generated_files": win.generated_files,
+            })
+            workflow_def = await self._build_generation_workflow(
+                request, workflow_id, hedges.known(), config_dict, task_params
+            )
+    
+    def _watch_straggler(
+        self, hedges: WorkflowHedges, event: Dict[str, Any], started_at: float
+    ):
+        """Programar el duplicado de una tarea que acaba de empezar"""
+        workflow_id, task_id = event.get("workflow_id"), event.get("task_id")
+        self.hedging.record_execution(task_id)
+        delay = self.hedging.delay(self.telemetry.histogram("task_seconds", task_id=task_id))
+        if delay is None:
+            return
         
-        # 2. Diseño de arquitectura
-        tasks.append(Task(
-            id="design_architecture", 
-            agent_id="architect_agent",
-            action="design_architecture",
-            params={
-                "requirements": "{{analyze_architecture.result}}"
-            },
-            dependencies=["analyze_architecture"]
+        hedges.settle(task_id)
+        hedges.watchers[task_id] = asyncio.ensure_future(self._hedge_straggler(
+            hedges,
+            workflow_id,
+            task_id,
+            event.get("agent_id") or self._task_agent(workflow_id, task_id),
+            started_at + delay,
         ))
+    
+    async def _hedge_straggler(
+        self,
+        hedges: WorkflowHedges,
+        workflow_id: str,
+        task_id: str,
+        agent_id: Optional[str],
+        deadline: float,
+    ):
+        """Duplicar la tarea en otra instancia si sigue en curso al vencer el plazo"""
+        await asyncio.sleep(max(0.0, deadline - time.monotonic()))
+        key = (workflow_id, task_id)
+        if key not in self._task_started or hedges.won.done():
+            return
+        if any(other[0] == workflow_id and other != key for other in self._task_started):
+            self.hedging.record("skipped_busy")
+            return
+        if not agent_id or not hedges.can_bind(task_id):
+            return
+        alternate = self.hedging.alternate(agent_id, self.agent_pool.ranked(agent_type(agent_id)))
+        if alternate is None or not self.hedging.acquire(task_id):
+            return
         
-        # 3. Generación de backend
-        if "backend" in request.project_config.components:
-            tasks.append(Task(
-                id="generate_backend",
-                agent_id="backend_agent", 
-                action="generate_backend",
-                params={
-                    "architecture": "{{design_architecture.result}}",
-                    "output_path": f"{request.output_path}/backend"
-                },
-                dependencies=["design_architecture"]
-            ))
+        hedge_id = f"{workflow_id}:hedge:{task_id}"
+        logger.info("Task %s/%s is straggling, hedging on %s", workflow_id, task_id, alternate)
+        self.agent_pool.reserve(hedge_id, task_id, alternate)
+        try:
+            result = await self.mcp_orchestrator.execute_workflow(
+                hedge_id, await hedges.bind(hedge_id, task_id, alternate, hedges.known())
+            )
+        except asyncio.CancelledError:
+            # La tarea original terminó antes: cancelar el duplicado
+            self.hedging.record("lost")
+            try:
+                await self.mcp_orchestrator.cancel_workflow(hedge_id)
+            except Exception as e:
+                logger.warning("Cancelling hedge %s failed: %s", hedge_id, e)
+            raise
+        except Exception as e:
+            self.hedging.record("failed")
+            logger.warning("Hedge %s failed: %s", hedge_id, e)
+            return
+        finally:
+            self.agent_pool.release(hedge_id)
         
-        # 4. Generación de frontend  
-        if "frontend" in request.project_config.components:
-            tasks.append(Task(
-                id="generate_frontend",
-                agent_id="frontend_agent",
-                action="generate_frontend", 
-                params={
-                    "architecture": "{{design_architecture.result}}",
-                    "output_path": f"{request.output_path}/frontend"
-                },
-                dependencies=["design_architecture"]
+        task_results = self._task_results(result)
+        if not result.success or task_id not in task_results:
+            self.hedging.record("failed")
+        elif key not in self._task_started or hedges.won.done():
+            self.hedging.record("lost")
+        else:
+            self.hedging.record("won")
+            hedges.won.set_result(HedgeWin(
+                task_id, alternate, task_results[task_id], list(result.generated_files or ())
             ))
+    
+    def _error_result(
+        self, workflow_id: str, error: Exception, started: float
+    ) -> GenerationResult:
+        """Resultado fallido por error de orquestación"""
+        return GenerationResult(
+            success=False,
+            workflow_id=workflow_id,
+            error=f"Error en orquestación: {str(error)}",
+            execution_time=time.monotonic() - started
+        )
+    
+    def _cancelled_result(self, workflow_id: str, started: float) -> GenerationResult:
+        """Generación cancelada por stop() antes de terminar"""
+        return GenerationResult(
+            success=False,
+            workflow_id=workflow_id,
+            error="Generation cancelled",
+            execution_time=time.monotonic() - started
+        )
+    
+    def _rejected_result(
+        self, workflow_id: str, error: Exception, started: float
+    ) -> GenerationResult:
+        """Request que no llegó a ejecutarse (validación o admisión)"""
+        self._record_outcome("rejected")
+        return self._error_result(workflow_id, error, started)
+    
+    def _workflow_outcome(self, workflow_id: str, success: bool) -> str:
+        state = self.workflow_states.get(workflow_id)
+        if state is not None and state.status == "cancelled":
+            return "cancelled"
+        return "success" if success else "failure"
+    
+    def _record_outcome(self, outcome: str, execution_time: Optional[float] = None):
+        """Contadores por resultado y métricas derivadas"""
+        self.telemetry.inc("generations_total", outcome=outcome)
+        if execution_time is None:
+            return
         
-        # 5. Configuración DevOps
-        backend_deps = ["generate_backend"] if "backend" in request.project_config.components else []
-        frontend_deps = ["generate_frontend"] if "frontend" in request.project_config.components else []
-        
-        tasks.append(Task(
-            id="setup_devops",
-            agent_id="devops_agent",
-            action="setup_devops",
-            params={
-                "architecture": "{{design_architecture.result}}",
-                "output_path": request.output_path
-            },
-            dependencies=["design_architecture"] + backend_deps + frontend_deps
-        ))
+        histogram = self.telemetry.histogram("generation_seconds")
+        histogram.observe(execution_time)
+        self.metrics["average_execution_time"] = histogram.mean
+        # success_rate sobre workflows ejecutados (sin rechazos previos)
+        succeeded = self.telemetry.counter("generations_total", outcome="success")
+        self.metrics["success_rate"] = succeeded / histogram.count
+    
+    def _observe_task(
+        self, event: Dict[str, Any], outcome: str, received_at: Optional[float] = None
+    ):
+        """Latencia por tarea y por agente a partir de task.*"""
+        workflow_id, task_id = event.get("workflow_id"), event.get("task_id")
+        now = received_at or time.monotonic()
+        trace = self.traces.get(workflow_id)
+        if trace is not None:
+            trace.end(task_id, now, "completed" if outcome == "success" else "failed")
+        
+        started = self._task_started.pop((workflow_id, task_id), None)
+        self.telemetry.inc("tasks_total", outcome=outcome)
+        if started is None:
+            self.agent_pool.complete(workflow_id, task_id)
+            return
+        
+        elapsed = now - started
+        self.agent_pool.complete(
+            workflow_id, task_id, elapsed if outcome == "success" else None
+        )
+        agent_id = event.get("agent_id") or self._task_agent(workflow_id, task_id)
+        self.telemetry.observe("task_seconds", elapsed, task_id=task_id)
+        self.telemetry.observe("agent_seconds", elapsed, agent_id=agent_id or "unknown")
+    
+    def _task_agent(self, workflow_id: str, task_id: str) -> Optional[str]:
+        state = self.workflow_states.get(workflow_id)
+        for task in getattr(getattr(state, "definition", None), "tasks", None) or ():
+            if task.id == task_id:
+                return task.agent_id
+        return None
+    
+    def _mark_finished(self, workflow_id: str, status: str, error: Optional[str] = None):
+        """Cerrar estado del workflow si ningún evento lo hizo antes"""
+        state = self.workflow_states.get(workflow_id)
+        if state is None or state.status != "running":
+            return
+        
+        state.status = status
+        state.completed_at = datetime.utcnow()
+        if error:
+            state.error = error
+        self._persist_workflow(workflow_id)
+    
+    def _persist_workflow(self, workflow_id: str):
+        """Encolar el estado actual del workflow para persistencia"""
+        if self.persistence is not None and workflow_id in self.workflow_states:
+            self.persistence.record_workflow(workflow_id, self.workflow_states[workflow_id])
+    
+    async def _publish_status(self, workflow_id: str):
+        """Publicar el estado para consultas desde otros nodos"""
+        if self.distributed is None:
+            return
+        status = self.get_workflow_status(workflow_id)
+        if status is None:
+            return
+        try:
+            await self.distributed.publish_status(workflow_id, status)
+        except Exception as e:
+            logger.warning("Publishing status of %s failed: %s", workflow_id, e)
+    
+    async def _takeover_loop(self):
+        while True:
+            await asyncio.sleep(self.config.takeover_interval)
+            try:
+                await self.take_over_orphans()
+            except Exception as e:
+                logger.warning("Orphan takeover failed: %s", e)
+    
+    async def take_over_orphans(self) -> List[str]:
+        """Relanzar en este nodo los workflows huérfanos que le tocan"""
+        if self.distributed is None:
+            return []
+        
+        claimed = await self.distributed.claim_orphans()
+        for workflow_id, payload in claimed:
+            run = asyncio.ensure_future(self._run_taken_over(workflow_id, payload))
+            self._taken_over.add(run)
+            run.add_done_callback(self._taken_over.discard)
+        return [workflow_id for workflow_id, _ in claimed]
+    
+    async def _run_taken_over(
+        self, workflow_id: str, payload: Dict[str, Any]
+    ) -> GenerationResult:
+        # Con checkpoint visible (directorio compartido) no se repiten tareas
+        if self.checkpoints is not None and workflow_id in self.checkpoints.workflow_ids():
+            return await self.resume_workflow(workflow_id)
+        
+        request = GenerationRequest.from_payload(workflow_id, payload)
+        request.metadata = {**request.metadata, "taken_over": True}
+        return await self.execute_project_generation(request)
+    
+    async def _handle_lease_lost(self, workflow_id: str):
+        """Otro nodo tomó el workflow: dejar de ejecutarlo aquí"""
+        logger.warning("Lease lost for workflow %s, cancelling local run", workflow_id)
+        await self.cancel_workflow(workflow_id)
+    
+    def _persist_task(self, event: Dict[str, Any], status: str):
+        if self.persistence is not None and event.get("workflow_id") in self.workflow_states:
+            self.persistence.record_task(event["workflow_id"], event.get("task_id"), status)
+    
+    async def _sink_outputs(
+        self, output_path: str, files: Sequence[str]
+    ) -> Dict[str, Tuple[int, str]]:
+        """
+        Deduplicar los archivos nuevos del workflow en el sink
+        
+        Los archivos reutilizados de una generación anterior ya pasaron por
+        él. Devuelve path -> (size, sha256).
+        """
+        if self.output_sink is None or not files:
+            return {}
+        try:
+            return await asyncio.to_thread(self.output_sink.ingest, output_path, files)
+        except OSError as e:
+            # El proyecto ya está escrito: sin deduplicar sigue siendo válido
+            logger.warning("Output sink failed for %s: %s", output_path, e)
+            return {}
+    
+    async def _finish_manifest(
+        self,
+        workflow_id: str,
+        files: Sequence[str],
+        digests: Optional[Dict[str, Tuple[int, str]]] = None,
+    ) -> Optional[FileManifest]:
+        """
+        Completar el manifest con los archivos que no llegaron por eventos
+        
+        digests (del sink) evita volver a leer los archivos ya hasheados.
+        """
+        writer = self._manifest_writers.pop(workflow_id, None)
+        if writer is None:
+            return None
+        try:
+            for path, (size, sha256) in (digests or {}).items():
+                writer.append(path, size, sha256)
+            await asyncio.to_thread(writer.add_files, files)
+        finally:
+            writer.close()
+        return FileManifest(writer.path)
+    
+    @staticmethod
+    def _task_results(result: Any) -> Dict[str, Any]:
+        """Resultados por tarea, si MCPturbo los reporta"""
+        task_results = getattr(result, "task_results", None)
+        return task_results if isinstance(task_results, dict) else {}
+    
+    async def _cache_architecture(self, cache_key: str, task_results: Dict[str, Any]):
+        """Guardar resultados frescos de architect_agent"""
+        if "analyze_architecture" in task_results and "design_architecture" in task_results:
+            await self.architecture_cache.store(
+                cache_key,
+                analysis=task_results["analyze_architecture"],
+                design=task_results["design_architecture"],
+            )
+    
+    async def _build_generation_workflow(
+        self,
+        request: GenerationRequest,
+        workflow_id: Optional[str] = None,
+        seeded_results: Optional[Dict[str, Any]] = None,
+        config_dict: Optional[Dict[str, Any]] = None,
+        task_params: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> "WorkflowDefinition":
+        """
+        Construir workflow de generación usando MCPturbo
+        
+        La topología se compila una vez por (template, componentes); aquí
+        solo se enlazan los parámetros del request. Las tareas con
+        resultado ya conocido (arquitectura cacheada, regeneración
+        incremental) se omiten y su resultado se inyecta en los params de
+        las siguientes.
+        
+        MANDAMIENTO: No implementar lógica de workflow propia
+        """
+        compiled = compile_workflow(*workflow_key(request.project_config))
+        workflow_id = workflow_id or request.workflow_id or str(uuid.uuid4())
+        seeded_results = seeded_results or {}
+        
+        # Paralelismo según el DAG que realmente se ejecutará y la carga actual
+        pending_tasks = [
+            task_id for task_id in compiled.topological_order
+            if task_id not in seeded_results
+        ]
+        decision = self.parallelism.plan(
+            workflow_id,
+            dag_width=compiled.width(pending_tasks),
+            agent_demand=compiled.agent_demand(pending_tasks),
+        )
+        self.parallelism_decisions[workflow_id] = decision
+        
+        # Instancia de cada tarea según carga y latencia (las reservas de un
+        # intento anterior se liberan); hasta su task.started cada tarea
+        # pesa menos cuantas más dependencias le falten
+        self.agent_pool.release(workflow_id)
+        depths = compiled.depths(pending_tasks)
+        routing = self.agent_pool.route(
+            workflow_id,
+            {spec.id: spec.agent_id for spec in compiled.tasks if spec.id in depths},
+            readiness={task_id: 1 / (depth + 1) for task_id, depth in depths.items()},
+        )
+        self.routing_decisions[workflow_id] = {
+            **self.routing_decisions.get(workflow_id, {}), **routing
+        }
         
-        # MANDAMIENTO: Usar WorkflowDefinition de MCPturbo
-        return WorkflowDefinition(
-            id=request.workflow_id or str(uuid.uuid4()),
-            name="project_generation",
-            tasks=tasks,
-            max_parallel_tasks=3,
-            timeout=1800  # 30 minutos
+        return compiled.bind(
+            config_dict if config_dict is not None else request.project_config.to_dict(),
+            request.output_path,
+            workflow_id,
+            seeded_results=await self._seeded_params(workflow_id, seeded_results),
+            task_params=task_params,
+            max_parallel_tasks=decision.effective,
+            timeout=self.config.workflow_timeout,
+            agents=routing,
         )
     
+    async def _seeded_params(self, workflow_id: str, seeded: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Resultados sembrados tal como viajan en los params de las tareas
+        
+        Con blobs activos, los grandes se sustituyen por un handle del
+        workflow: se serializan una vez y se comparten entre tareas (y
+        entre workflows con el mismo contenido).
+        """
+        if self.blobs is None or not seeded:
+            return seeded
+        return await self.blobs.reference_all(workflow_id, seeded)
+    
     async def _validate_generation_request(self, request: GenerationRequest):
-        """Validar request de generación"""
+        """
+        Validar request de generación
+        
+        La disponibilidad de agentes se consulta en el índice local: sin I/O
+        salvo la primera vez, si el índice no se pudo precargar en start()
+        """
         if not request.project_config.name:
             raise CoreOrchestratorError("Project name is required")
         
@@ -303,10 +1484,50 @@ class CoreOrchestrator:
             required_agents.append("frontend_agent")
         required_agents.append("devops_agent")
         
-        available_agents = self.agent_registry.list_agents()
-        for agent_id in required_agents:
-            if agent_id not in available_agents:
-                raise CoreOrchestratorError(f"Required agent not available: {agent_id}")
+        await self._ensure_agent_index()
+        missing = self.agent_pool.missing(required_agents)
+        if missing:
+            raise CoreOrchestratorError(f"Required agent not available: {missing[0]}")
+    
+    async def _ensure_agent_index(self):
+        if not self.agent_index.warmed:
+            await self._reconcile_agent_index()
+    
+    async def _reconcile_agent_index(self):
+        """Sincronizar índice con AgentRegistry (el registry puede ser sync o async)"""
+        agents = self.agent_registry.list_agents()
+        if inspect.isawaitable(agents):
+            agents = await agents
+        
+        drift = self.agent_index.reconcile(agents)
+        if drift:
+            logger.info("Agent index reconciled, %d entries corrected", drift)
+    
+    def _enforce_retention(self) -> int:
+        # _runs incluye los workflows que aún arrancan: ya tienen estado
+        # pero todavía no están en active_workflows
+        return self.retention.enforce(
+            self.workflow_states, self.project_states, self._runs,
+            companions=(self.parallelism_decisions, self.routing_decisions, self.traces)
+        )
+    
+    async def _retention_loop(self):
+        """Aplicar max_age aunque no termine ningún workflow"""
+        while True:
+            await asyncio.sleep(self.config.retention_interval)
+            try:
+                self._enforce_retention()
+            except Exception as e:
+                logger.warning("Retention enforcement failed: %s", e)
+    
+    async def _agent_reconcile_loop(self):
+        """Reconciliación periódica para corregir eventos perdidos"""
+        while True:
+            await asyncio.sleep(self.config.agent_reconcile_interval)
+            try:
+                await self._reconcile_agent_index()
+            except Exception as e:
+                logger.warning("Agent index reconciliation failed: %s", e)
     
     # Event Handlers
     async def _handle_workflow_completed(self, event: Dict[str, Any]):
@@ -315,6 +1536,7 @@ class CoreOrchestrator:
         if workflow_id in self.workflow_states:
             self.workflow_states[workflow_id].status = "completed"
             self.workflow_states[workflow_id].completed_at = datetime.utcnow()
+            self._persist_workflow(workflow_id)
     
     async def _handle_workflow_failed(self, event: Dict[str, Any]):
         """Manejar workflow fallido"""
@@ -323,19 +1545,111 @@ class CoreOrchestrator:
             self.workflow_states[workflow_id].status = "failed"
             self.workflow_states[workflow_id].completed_at = datetime.utcnow()
             self.workflow_states[workflow_id].error = event.get("error")
+            self._persist_workflow(workflow_id)
+    
+    async def _handle_task_queued(
+        self, event: Dict[str, Any], received_at: Optional[float] = None
+    ):
+        """Manejar tarea encolada (lista para ejecutar)"""
+        trace = self.traces.get(event.get("workflow_id"))
+        if trace is not None:
+            trace.enqueue(event.get("task_id"), received_at or time.monotonic())
+        self._persist_task(event, "queued")
+    
+    async def _handle_task_started(
+        self, event: Dict[str, Any], received_at: Optional[float] = None
+    ):
+        """Manejar inicio de tarea"""
+        workflow_id, now = event.get("workflow_id"), received_at or time.monotonic()
+        if workflow_id in self.active_workflows:
+            self._task_started[(workflow_id, event.get("task_id"))] = now
+            self.agent_pool.start(workflow_id, event.get("task_id"))
+            hedges = self._hedges.get(workflow_id)
+            if hedges is not None:
+                self._watch_straggler(hedges, event, now)
+        trace = self.traces.get(workflow_id)
+        if trace is not None:
+            trace.start(event.get("task_id"), now)
+        self._persist_task(event, "started")
+        self.events.publish_broadcast("task.started", event)
+    
+    async def _handle_task_progress(self, event: Dict[str, Any]):
+        """Manejar avance intermedio de una tarea"""
+        self.events.publish_broadcast("task.progress", event)
+    
+    async def _handle_task_completed(
+        self, event: Dict[str, Any], received_at: Optional[float] = None
+    ):
+        """Manejar tarea completada"""
+        self._observe_task(event, "success", received_at)
+        hedges = self._hedges.get(event.get("workflow_id"))
+        if hedges is not None:
+            hedges.completed(event.get("task_id"), event)
+            hedges.settle(event.get("task_id"))
+        self._persist_task(event, "completed")
+        self.events.publish_broadcast("task.completed", event)
+        if "generated_files" in event:
+            self._record_task_files(
+                event.get("workflow_id"), event.get("task_id"), event["generated_files"]
+            )
+        
+        writer = self._manifest_writers.get(event.get("workflow_id"))
+        if writer is not None and event.get("generated_files"):
+            await asyncio.to_thread(writer.add_files, event["generated_files"])
+        
+        await self._checkpoint_task(event)
+    
+    def _record_task_files(self, workflow_id: str, task_id: str, files: Optional[Sequence[str]]):
+        """Atribuir archivos a la tarea que los generó (incremental)"""
+        task_files = self._task_files.get(workflow_id)
+        if task_files is not None and task_id:
+            task_files[task_id] = list(files or ())
+    
+    async def _checkpoint_task(self, event: Dict[str, Any]):
+        """Guardar el resultado de la tarea antes de seguir"""
+        workflow_id = event.get("workflow_id")
+        if (
+            self.checkpoints is None
+            or workflow_id not in self.active_workflows
+            or "result" not in event
+        ):
+            return
+        try:
+            await self.checkpoints.record(
+                workflow_id, event.get("task_id"), event["result"],
+                event.get("generated_files") or ()
+            )
+        except Exception as e:
+            logger.warning("Checkpoint of %s/%s failed: %s", workflow_id, event.get("task_id"), e)
+    
+    async def _handle_task_failed(
+        self, event: Dict[str, Any], received_at: Optional[float] = None
+    ):
+        """Manejar tarea fallida"""
+        self._observe_task(event, "failure", received_at)
+        hedges = self._hedges.get(event.get("workflow_id"))
+        if hedges is not None:
+            hedges.settle(event.get("task_id"))
+        self._persist_task(event, "failed")
+        self.events.publish_broadcast("task.failed", event)
     
     async def _handle_agent_registered(self, event: Dict[str, Any]):
         """Manejar registro de agente"""
-        agent_id = event.get("agent_id")
-        # Log o métricas si es necesario
+        self.agent_index.add(event.get("agent_id"))
+    
+    async def _handle_agent_deregistered(self, event: Dict[str, Any]):
+        """Manejar baja de agente"""
+        self.agent_index.discard(event.get("agent_id"))
     
     # Métodos de consulta para consumidores externos
     def get_workflow_status(self, workflow_id: str) -> Optional[Dict[str, Any]]:
         """Obtener estado de workflow"""
         if workflow_id not in self.workflow_states:
-            return None
+            archived = self.retention.get(workflow_id)
+            return archived.workflow_status() if archived else None
         
         state = self.workflow_states[workflow_id]
+        decision = self.parallelism_decisions.get(workflow_id)
         return {
             "workflow_id": workflow_id,
             "status": state.status,
@@ -343,13 +1657,23 @@ class CoreOrchestrator:
             "completed_at": state.completed_at.isoformat() if state.completed_at else None,
             "project_name": state.project_state.name,
             "progress": state.get_progress(),
-            "error": state.error
+            "error": state.error,
+            "parallelism": decision.to_dict() if decision else None,
+            "routing": self.routing_decisions.get(workflow_id)
         }
     
+    async def fetch_workflow_status(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        """Estado de workflow desde cualquier nodo (local o compartido)"""
+        status = self.get_workflow_status(workflow_id)
+        if status is None and self.distributed is not None:
+            status = await self.distributed.fetch_status(workflow_id)
+        return status
+    
     def get_project_status(self, workflow_id: str) -> Optional[Dict[str, Any]]:
         """Obtener estado del proyecto"""
         if workflow_id not in self.project_states:
-            return None
+            archived = self.retention.get(workflow_id)
+            return archived.project_status() if archived else None
         
         state = self.project_states[workflow_id]
         return {
@@ -361,18 +1685,120 @@ class CoreOrchestrator:
             "features": state.config.features
         }
     
+    def get_workflow_trace(
+        self, workflow_id: str, format: str = "chrome"
+    ) -> Optional[Dict[str, Any]]:
+        """Timeline del workflow como Chrome trace ("chrome") u OTLP ("otlp")"""
+        trace = self.traces.get(workflow_id)
+        if trace is None:
+            return None
+        if format == "otlp":
+            return trace.to_otlp()
+        if format == "chrome":
+            return trace.to_chrome_trace()
+        raise CoreOrchestratorError(f"Unknown trace format: {format}")
+    
+    def get_critical_path(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        """Ruta crítica del workflow y holgura de cada tarea"""
+        trace = self.traces.get(workflow_id)
+        return trace.critical_path() if trace else None
+    
     def get_available_agents(self) -> List[str]:
         """Obtener agentes disponibles"""
+        if self.agent_index.warmed:
+            return self.agent_index.snapshot()
         return self.agent_registry.list_agents()
     
+    def get_agent_load(self) -> Dict[str, Dict[str, Any]]:
+        """Tareas en curso, latencia EWMA y puntuación por instancia de agente"""
+        return self.agent_pool.snapshot()
+    
     def get_metrics(self) -> Dict[str, Any]:
         """Obtener métricas del orquestador"""
+        latency = self.telemetry.histogram("generation_seconds")
         return {
             **self.metrics,
+            **{
+                f"generations_{outcome}": self.telemetry.counter(
+                    "generations_total", outcome=outcome
+                )
+                for outcome in ("success", "failure", "cancelled", "rejected")
+            },
+            "generation_p50": latency.quantile(0.50),
+            "generation_p95": latency.quantile(0.95),
+            "generation_p99": latency.quantile(0.99),
             "active_workflows": len(self.active_workflows),
-            "total_workflows": len(self.workflow_states),
-            "total_projects": len(self.project_states)
+            "total_workflows": len(self.workflow_states) + len(self.retention),
+            "total_projects": len(self.project_states) + len(self.retention),
+            "incremental_snapshots": len(self.snapshots),
+            "live_workflows": len(self.workflow_states),
+            "archived_workflows": len(self.retention),
+            "workflow_templates_compiled": compile_workflow.cache_info().currsize,
+            **{
+                f"parallelism_{name}": value
+                for name, value in self.parallelism.stats().items()
+            },
+            **{
+                f"agent_index_{name}": value
+                for name, value in self.agent_index.stats().items()
+            },
+            **{
+                f"agent_pool_{name}": value
+                for name, value in self.agent_pool.stats().items()
+            },
+            **{
+                f"hedging_{name}": value
+                for name, value in (self.hedging.stats() if self.hedging else {}).items()
+            },
+            **{
+                f"single_flight_{name}": value
+                for name, value in self.single_flight.stats().items()
+            },
+            **{
+                f"distributed_{name}": value
+                for name, value in (self.distributed.stats() if self.distributed else {}).items()
+            },
+            **{
+                f"checkpoint_{name}": value
+                for name, value in (self.checkpoints.stats() if self.checkpoints else {}).items()
+            },
+            **{
+                f"persistence_{name}": value
+                for name, value in (self.persistence.stats() if self.persistence else {}).items()
+            },
+            **{
+                f"ingestion_{name}": value
+                for name, value in self.ingestion.stats().items()
+            },
+            **{
+                f"events_{name}": value
+                for name, value in self.events.stats().items()
+            },
+            **{
+                f"admission_{name}": value
+                for name, value in self.admission.stats().items()
+            },
+            **{
+                f"architecture_cache_{name}": value
+                for name, value in self.architecture_cache.stats().items()
+            },
+            **{
+                f"output_sink_{name}": value
+                for name, value in (self.output_sink.stats() if self.output_sink else {}).items()
+            },
+            **{
+                f"blobs_{name}": value
+                for name, value in (self.blobs.stats() if self.blobs is not None else {}).items()
+            }
+        }
+    
+    def export_prometheus(self) -> str:
+        """Métricas en formato texto de Prometheus (sin locks)"""
+        gauges = {
+            name: value for name, value in self.get_metrics().items()
+            if isinstance(value, (int, float)) and not name.startswith("generations_")
         }
+        return self.telemetry.render_prometheus(gauges=gauges)
     
     async def cancel_workflow(self, workflow_id: str) -> bool:
         """Cancelar workflow"""
@@ -385,6 +1811,7 @@ class CoreOrchestrator:
         if success and workflow_id in self.workflow_states:
             self.workflow_states[workflow_id].status = "cancelled"
             self.workflow_states[workflow_id].completed_at = datetime.utcnow()
+            self._persist_workflow(workflow_id)
         
         self.active_workflows.discard(workflow_id)
         return success
\ No newline at end of file
@@ -0,0 +1,90 @@
+# src/genesis_core/orchestrator/drain.py
+"""
+Drenado de workflows activos al detener el orquestador
+
+Primero se espera hasta un plazo a que los workflows en curso terminen
+solos; los que no, se cancelan todos a la vez con un plazo propio. La
+duración total queda acotada por drain_timeout + cancel_timeout sin
+importar cuántos workflows haya activos.
+"""
+
+import asyncio
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Iterable, Mapping
+
+# Resultado de _run_generation -> resultado en el informe de drenado
+FINISHED = {"success": "completed", "failure": "failed", "cancelled": "cancelled"}
+
+
+@dataclass
+class DrainReport:
+    """
+    Qué pasó con cada workflow activo durante stop()
+
+    outcomes: workflow_id -> completed | failed | cancelled (terminó
+    durante la espera), checkpointed (cancelado, reanudable con
+    resume_workflow), cancelled (cancelado, sin checkpoint) o abandoned
+    (MCPturbo no confirmó la cancelación a tiempo)
+    """
+    outcomes: Dict[str, str] = field(default_factory=dict)
+    rejected_queued: int = 0
+    duration: float = 0.0
+
+    def summary(self) -> Dict[str, int]:
+        return dict(Counter(self.outcomes.values()))
+
+
+async def drain_workflows(
+    workflow_ids: Iterable[str],
+    runs: Mapping[str, "asyncio.Future[str]"],
+    cancel: Callable[[str], Awaitable[bool]],
+    resumable: Callable[[str], bool],
+    timeout: float,
+    cancel_timeout: float,
+) -> Dict[str, str]:
+    """
+    Esperar y cancelar; devuelve el resultado por workflow
+
+    runs: futuros que se resuelven con el outcome de cada ejecución
+    (success / failure / cancelled); los workflows sin futuro se cancelan
+    directamente.
+    """
+    workflow_ids = list(workflow_ids)
+    waiting = [runs[workflow_id] for workflow_id in workflow_ids if workflow_id in runs]
+    if waiting and timeout > 0:
+        await asyncio.wait(waiting, timeout=timeout)
+
+    outcomes = {}
+    remaining = []
+    for workflow_id in workflow_ids:
+        run = runs.get(workflow_id)
+        if run is not None and run.done() and not run.cancelled():
+            outcomes[workflow_id] = FINISHED.get(run.result(), run.result())
+        else:
+            remaining.append(workflow_id)
+    if not remaining:
+        return outcomes
+
+    # Cancelación concurrente con un único plazo para toda la fase
+    deadline = time.monotonic() + cancel_timeout
+    confirmed = await asyncio.gather(
+        *(asyncio.wait_for(cancel(workflow_id), cancel_timeout) for workflow_id in remaining),
+        return_exceptions=True,
+    )
+    settling = [runs[workflow_id] for workflow_id in remaining if workflow_id in runs]
+    left = deadline - time.monotonic()
+    if settling and left > 0:
+        await asyncio.wait(settling, timeout=left)
+
+    for workflow_id, ok in zip(remaining, confirmed):
+        run = runs.get(workflow_id)
+        if run is not None and run.done() and run.result() in ("success", "failure"):
+            # Terminó por su cuenta mientras se cancelaba
+            outcomes[workflow_id] = FINISHED[run.result()]
+        elif ok is True:
+            outcomes[workflow_id] = "checkpointed" if resumable(workflow_id) else "cancelled"
+        else:
+            outcomes[workflow_id] = "abandoned"
+    return outcomes
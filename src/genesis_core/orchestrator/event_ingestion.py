@@ -0,0 +1,258 @@
+# src/genesis_core/orchestrator/event_ingestion.py
+"""
+Ingesta por lotes de los broadcasts de MCPturbo
+
+Los handlers de suscripción solo encolan; una tarea aparte aplica los
+eventos al estado en lotes de batch_size, cediendo el event loop entre
+lotes para que una ráfaga no lo acapare. La cola está acotada:
+
+- los eventos coalescibles (progreso de una tarea, alta/baja de un
+  agente) sustituyen al pendiente con la misma clave sin ocupar hueco
+- cualquier otro evento (sin pendiente al que sustituir) nunca se
+  descarta: si la cola está llena el productor espera a que haya hueco
+
+Las entradas sustituidas se compactan en cuanto superan a las
+pendientes, así que la deque nunca pasa de 2 * max_queue entradas.
+
+El retraso entre recepción y aplicación se mide como lag de ingesta.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Optional, Tuple
+
+from genesis_core.orchestrator.metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[..., Awaitable[None]]
+
+
+def coalesce_key(topic: str, event: Dict[str, Any]) -> Optional[Hashable]:
+    """Clave bajo la que un evento supera a otro pendiente (None: no se fusiona)"""
+    if topic == "task.progress":
+        return (topic, event.get("workflow_id"), event.get("task_id"))
+    if topic in ("agent.registered", "agent.deregistered"):
+        # Solo importa el último estado del agente
+        return ("agent", event.get("agent_id"))
+    return None
+
+
+class _Entry:
+    __slots__ = ("topic", "event", "received_at", "key", "superseded")
+
+    def __init__(self, topic: str, event: Dict[str, Any], received_at: float, key: Optional[Hashable]):
+        self.topic = topic
+        self.event = event
+        self.received_at = received_at
+        self.key = key
+        self.superseded = False
+
+
+class EventIngestor:
+    """
+    Cola acotada de broadcasts aplicados por lotes
+
+    - max_queue: eventos pendientes (sin contar los ya superados)
+    - batch_size: eventos aplicados antes de ceder el event loop
+    """
+
+    def __init__(self, max_queue: int = 10_000, batch_size: int = 256):
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+
+        self._handlers: Dict[str, Tuple[Handler, bool]] = {}
+        self._queue: Deque[_Entry] = deque()
+        self._latest: Dict[Hashable, _Entry] = {}
+        self._pending = 0
+        self._superseded = 0
+
+        self._wakeup: Optional[asyncio.Event] = None
+        self._space: Optional[asyncio.Event] = None
+        self._apply_lock: Optional[asyncio.Lock] = None
+        self._consumer: Optional[asyncio.Task] = None
+
+        self.lag = LatencyHistogram()
+        self._lag_max = 0.0
+        self._stats = {
+            "received": 0,
+            "applied": 0,
+            "coalesced": 0,
+            "compactions": 0,
+            "batches": 0,
+            "max_batch": 0,
+            "handler_errors": 0,
+        }
+
+    # Registro
+
+    def register(self, topic: str, handler: Handler, timed: bool = False):
+        """
+        Handler de un topic; con timed recibe además received_at
+        (time.monotonic() de la recepción, no de la aplicación)
+        """
+        self._handlers[topic] = (handler, timed)
+
+    @property
+    def topics(self) -> Tuple[str, ...]:
+        return tuple(self._handlers)
+
+    def receiver(self, topic: str) -> Callable[[Dict[str, Any]], Awaitable[None]]:
+        """Handler para subscribe_to_broadcasts: solo encola"""
+        async def receive(event: Dict[str, Any]):
+            await self.put(topic, event)
+        return receive
+
+    # Ciclo de vida
+
+    def _ensure_primitives(self):
+        if self._apply_lock is None:
+            self._wakeup = asyncio.Event()
+            self._space = asyncio.Event()
+            self._apply_lock = asyncio.Lock()
+
+    async def start(self):
+        if self._consumer is not None:
+            return
+        self._ensure_primitives()
+        self._consumer = asyncio.ensure_future(self._consume())
+        if self._queue:
+            self._wakeup.set()
+
+    async def stop(self):
+        """Detener el consumidor aplicando lo pendiente"""
+        if self._consumer is not None:
+            self._consumer.cancel()
+            await asyncio.gather(self._consumer, return_exceptions=True)
+            self._consumer = None
+        await self.flush()
+
+    # Productor
+
+    async def put(self, topic: str, event: Dict[str, Any]):
+        self._ensure_primitives()
+        self._stats["received"] += 1
+        key = coalesce_key(topic, event)
+
+        previous = self._latest.get(key) if key is not None else None
+        if previous is None:
+            while self._pending >= self.max_queue:
+                self._space.clear()
+                await self._space.wait()
+            # Mientras se esperaba pudo encolarse otro con la misma clave
+            previous = self._latest.get(key) if key is not None else None
+        if previous is not None:
+            # Sustituye al pendiente: no ocupa hueco nuevo
+            previous.superseded = True
+            self._pending -= 1
+            self._superseded += 1
+            self._stats["coalesced"] += 1
+            if self._superseded > self._pending:
+                self._compact()
+
+        entry = _Entry(topic, event, time.monotonic(), key)
+        self._queue.append(entry)
+        self._pending += 1
+        if key is not None:
+            self._latest[key] = entry
+        self._wakeup.set()
+
+    def _compact(self):
+        """Quitar de la deque las entradas ya sustituidas"""
+        self._queue = deque(entry for entry in self._queue if not entry.superseded)
+        self._superseded = 0
+        self._stats["compactions"] += 1
+
+    # Consumidor
+
+    async def _consume(self):
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._queue:
+                await self._apply_batch()
+                # Ceder el loop entre lotes
+                await asyncio.sleep(0)
+
+    async def flush(self) -> int:
+        """
+        Aplicar ya todo lo pendiente; devuelve eventos aplicados
+
+        Sirve de barrera: también espera al lote que el consumidor ya sacó
+        de la cola y sigue aplicando.
+        """
+        self._ensure_primitives()
+        applied = 0
+        while True:
+            while self._queue:
+                applied += await self._apply_batch()
+            async with self._apply_lock:
+                if not self._queue:
+                    return applied
+
+    async def _apply_batch(self) -> int:
+        self._ensure_primitives()
+        async with self._apply_lock:
+            batch = []
+            while self._queue and len(batch) < self.batch_size:
+                entry = self._queue.popleft()
+                if entry.superseded:
+                    self._superseded -= 1
+                    continue
+                if entry.key is not None and self._latest.get(entry.key) is entry:
+                    del self._latest[entry.key]
+                self._pending -= 1
+                batch.append(entry)
+            if self._pending < self.max_queue:
+                self._space.set()
+
+            for entry in batch:
+                lag = time.monotonic() - entry.received_at
+                self.lag.observe(lag)
+                self._lag_max = max(self._lag_max, lag)
+                await self._apply(entry)
+
+        if batch:
+            self._stats["batches"] += 1
+            self._stats["applied"] += len(batch)
+            self._stats["max_batch"] = max(self._stats["max_batch"], len(batch))
+        return len(batch)
+
+    async def _apply(self, entry: _Entry):
+        registered = self._handlers.get(entry.topic)
+        if registered is None:
+            return
+        handler, timed = registered
+        try:
+            if timed:
+                await handler(entry.event, received_at=entry.received_at)
+            else:
+                await handler(entry.event)
+        except Exception as e:
+            self._stats["handler_errors"] += 1
+            logger.warning("Handler for %s failed: %s", entry.topic, e)
+
+    # Métricas
+
+    @property
+    def queue_depth(self) -> int:
+        return self._pending
+
+    def oldest_pending_age(self) -> float:
+        """Segundos que lleva esperando el evento pendiente más antiguo"""
+        for entry in self._queue:
+            if not entry.superseded:
+                return time.monotonic() - entry.received_at
+        return 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            **self._stats,
+            "queue_depth": self._pending,
+            "lag_p50": self.lag.quantile(0.50),
+            "lag_p99": self.lag.quantile(0.99),
+            "lag_max": self._lag_max,
+            "oldest_pending_age": self.oldest_pending_age(),
+        }
@@ -0,0 +1,138 @@
+# src/genesis_core/orchestrator/events.py
+"""
+Eventos de progreso por workflow
+
+Los broadcasts task.* de MCPturbo se convierten en eventos tipados y se
+reparten a las colas de quienes siguen ese workflow (p. ej. el stream de
+CoreOrchestrator.stream_project_generation).
+
+MANDAMIENTO: los eventos los emite MCPturbo; aquí solo se enrutan.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
+
+
+@dataclass
+class TaskStarted:
+    """Una tarea del workflow empezó a ejecutarse"""
+    workflow_id: str
+    task_id: str
+    agent_id: Optional[str] = None
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+
+
+@dataclass
+class TaskProgress:
+    """Avance intermedio de una tarea en curso (progress en 0..1)"""
+    workflow_id: str
+    task_id: str
+    agent_id: Optional[str] = None
+    progress: Optional[float] = None
+    message: Optional[str] = None
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+
+
+@dataclass
+class TaskCompleted:
+    """Una tarea terminó; generated_files son los archivos de esa tarea"""
+    workflow_id: str
+    task_id: str
+    agent_id: Optional[str] = None
+    generated_files: List[str] = field(default_factory=list)
+    result: Any = None
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+
+
+@dataclass
+class TaskFailed:
+    """Una tarea falló"""
+    workflow_id: str
+    task_id: str
+    agent_id: Optional[str] = None
+    error: Optional[str] = None
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+
+
+@dataclass
+class GenerationFinished:
+    """Último evento del stream: el GenerationResult completo"""
+    workflow_id: str
+    result: Any
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+
+
+GenerationEvent = Union[TaskStarted, TaskProgress, TaskCompleted, TaskFailed, GenerationFinished]
+
+
+def task_event_from_broadcast(topic: str, event: Dict[str, Any]) -> Optional[GenerationEvent]:
+    """Convertir un broadcast task.* de MCPturbo en evento tipado"""
+    workflow_id = event.get("workflow_id")
+    task_id = event.get("task_id")
+    if workflow_id is None or task_id is None:
+        return None
+
+    agent_id = event.get("agent_id")
+    if topic == "task.started":
+        return TaskStarted(workflow_id, task_id, agent_id)
+    if topic == "task.progress":
+        return TaskProgress(
+            workflow_id, task_id, agent_id,
+            progress=event.get("progress"), message=event.get("message"),
+        )
+    if topic == "task.completed":
+        return TaskCompleted(
+            workflow_id,
+            task_id,
+            agent_id,
+            generated_files=list(event.get("generated_files") or []),
+            result=event.get("result"),
+        )
+    if topic == "task.failed":
+        return TaskFailed(workflow_id, task_id, agent_id, error=event.get("error"))
+    return None
+
+
+class WorkflowEventBus:
+    """Reparto de eventos por workflow_id a colas de suscriptores"""
+
+    def __init__(self):
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+        self._stats = {"published": 0, "delivered": 0, "unrouted": 0}
+
+    def subscribe(self, workflow_id: str) -> asyncio.Queue:
+        """Nueva cola que recibirá los eventos de workflow_id"""
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(workflow_id, []).append(queue)
+        return queue
+
+    def unsubscribe(self, workflow_id: str, queue: asyncio.Queue):
+        queues = self._subscribers.get(workflow_id)
+        if not queues:
+            return
+        if queue in queues:
+            queues.remove(queue)
+        if not queues:
+            del self._subscribers[workflow_id]
+
+    def publish(self, event: GenerationEvent):
+        """Entregar evento a los suscriptores de su workflow (sin bloquear)"""
+        self._stats["published"] += 1
+        queues = self._subscribers.get(event.workflow_id)
+        if not queues:
+            self._stats["unrouted"] += 1
+            return
+        for queue in queues:
+            queue.put_nowait(event)
+        self._stats["delivered"] += len(queues)
+
+    def publish_broadcast(self, topic: str, event: Dict[str, Any]):
+        """Atajo para handlers de broadcasts task.*"""
+        typed = task_event_from_broadcast(topic, event)
+        if typed is not None:
+            self.publish(typed)
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._stats, "subscribed_workflows": len(self._subscribers)}
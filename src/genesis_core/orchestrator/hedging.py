@@ -0,0 +1,174 @@
+# src/genesis_core/orchestrator/hedging.py
+"""
+Ejecución especulativa (hedging) de tareas rezagadas
+
+Cuando una tarea lleva más que el percentil configurado de su propia
+historia (task_seconds), se lanza un duplicado en otra instancia del
+mismo tipo de agente como workflow de una sola tarea. El primero que
+termina gana y el otro se cancela; si gana el duplicado, el workflow
+original se cancela y se relanza con los resultados ya conocidos como
+seeded_results (las tareas terminadas no se repiten).
+
+Límites para que la carga extra quede acotada:
+
+- sin historia suficiente (min_samples) no se duplica nada
+- por tarea, los duplicados no superan budget * ejecuciones
+- solo se duplica la tarea si es la única en curso de su workflow, de
+  modo que relanzar no descarta trabajo de otras tareas
+
+La instancia del duplicado la elige el pool de agentes (la mejor del
+tipo que no sea la de la tarea original).
+"""
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from genesis_core.orchestrator.agent_pool import agent_type
+from genesis_core.orchestrator.metrics import LatencyHistogram
+
+
+@dataclass
+class HedgeWin:
+    """Resultado de un duplicado que terminó antes que la tarea original"""
+    task_id: str
+    agent_id: str
+    result: Any
+    generated_files: List[str] = field(default_factory=list)
+
+
+class HedgingPolicy:
+    """
+    Cuándo y dónde duplicar una tarea
+
+    - quantile: percentil de task_seconds a partir del cual se duplica
+    - min_samples: ejecuciones observadas antes de duplicar esa tarea
+    - budget: fracción máxima de ejecuciones de una tarea que se duplican
+    - min_delay: espera mínima antes de duplicar (segundos)
+    """
+
+    def __init__(
+        self,
+        quantile: float = 0.95,
+        min_samples: int = 20,
+        budget: float = 0.05,
+        min_delay: float = 0.0,
+    ):
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.budget = budget
+        self.min_delay = min_delay
+
+        self._executions: Counter = Counter()
+        self._hedges: Counter = Counter()
+        self._stats = {
+            "launched": 0,
+            "won": 0,
+            "lost": 0,
+            "failed": 0,
+            "skipped_budget": 0,
+            "skipped_busy": 0,
+            "skipped_no_instance": 0,
+        }
+
+    def delay(self, history: LatencyHistogram) -> Optional[float]:
+        """Segundos tras el inicio a partir de los que se duplica (None: no)"""
+        if history.count < self.min_samples:
+            return None
+        return max(self.min_delay, history.quantile(self.quantile))
+
+    def record_execution(self, task_id: str):
+        self._executions[task_id] += 1
+
+    def acquire(self, task_id: str) -> bool:
+        """Reservar un duplicado dentro del presupuesto de la tarea"""
+        if self._hedges[task_id] + 1 > self.budget * self._executions[task_id]:
+            self._stats["skipped_budget"] += 1
+            return False
+        self._hedges[task_id] += 1
+        self._stats["launched"] += 1
+        return True
+
+    def alternate(self, agent_id: str, available: Iterable[str]) -> Optional[str]:
+        """Primera instancia de available (por preferencia) del tipo de agent_id"""
+        kind = agent_type(agent_id)
+        for candidate in available:
+            if candidate != agent_id and agent_type(candidate) == kind:
+                return candidate
+        self._stats["skipped_no_instance"] += 1
+        return None
+
+    def record(self, outcome: str):
+        """won | lost | failed | skipped_busy"""
+        self._stats[outcome] += 1
+
+    def stats(self) -> Dict[str, float]:
+        launched = self._stats["launched"]
+        return {
+            **self._stats,
+            "win_rate": self._stats["won"] / launched if launched else 0.0,
+        }
+
+
+class WorkflowHedges:
+    """
+    Estado de hedging de un workflow en ejecución
+
+    - seeded: resultados conocidos al lanzar el workflow
+    - dependencies: task_id -> dependencias en el DAG compilado
+    - bind: corrutina (hedge_id, task_id, agent_id, seeded) ->
+      WorkflowDefinition de una sola tarea
+    """
+
+    def __init__(
+        self,
+        seeded: Mapping[str, Any],
+        dependencies: Mapping[str, Tuple[str, ...]],
+        bind: Callable[[str, str, str, Dict[str, Any]], Awaitable[Any]],
+    ):
+        self.seeded = dict(seeded)
+        self.dependencies = dependencies
+        self.bind = bind
+
+        self.results: Dict[str, Any] = {}
+        self.files: Dict[str, List[str]] = {}
+        self.watchers: Dict[str, asyncio.Task] = {}
+        self.restarts = 0
+        self.won: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    def known(self) -> Dict[str, Any]:
+        return {**self.seeded, **self.results}
+
+    def can_bind(self, task_id: str) -> bool:
+        """Se conocen los resultados de todas sus dependencias"""
+        known = self.known()
+        return all(dep in known for dep in self.dependencies.get(task_id, ()))
+
+    def completed(self, task_id: str, event: Mapping[str, Any]):
+        """task.completed del workflow original"""
+        if "result" in event:
+            self.results[task_id] = event["result"]
+        self.files[task_id] = list(event.get("generated_files") or ())
+
+    def restart(self, win: HedgeWin):
+        """El duplicado ganó: su resultado pasa a ser conocido"""
+        self.results[win.task_id] = win.result
+        self.files[win.task_id] = list(win.generated_files)
+        self.restarts += 1
+        self.won = asyncio.get_running_loop().create_future()
+
+    def carried_files(self) -> List[str]:
+        """Archivos de las tareas terminadas (incluidos duplicados ganadores)"""
+        return [path for files in self.files.values() for path in files]
+
+    def settle(self, task_id: str):
+        """La tarea original terminó: descartar su duplicado"""
+        watcher = self.watchers.pop(task_id, None)
+        if watcher is not None:
+            watcher.cancel()
+
+    def close(self):
+        for watcher in self.watchers.values():
+            watcher.cancel()
+        self.watchers.clear()
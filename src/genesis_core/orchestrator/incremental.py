@@ -0,0 +1,166 @@
+# src/genesis_core/orchestrator/incremental.py
+"""
+Regeneración incremental a partir de un diff de ProjectConfig
+
+Se compara la config anterior con la nueva, cada campo cambiado se asocia
+a las tareas que lo consumen y solo se reejecutan esas tareas y sus
+dependientes. El resto de resultados se reutiliza del snapshot del
+workflow anterior (inyectados como resultados ya conocidos).
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from genesis_core.orchestrator.workflow_builder import CompiledWorkflow
+
+# Campo cambiado -> tareas que lo consumen directamente. Los campos que no
+# aparecen aquí (name, template, components, features...) alteran la
+# arquitectura y fuerzan regeneración completa.
+FIELD_IMPACT: Dict[str, Tuple[str, ...]] = {
+    "stack.backend": ("generate_backend",),
+    "stack.database": ("generate_backend",),
+    "stack.cache": ("generate_backend",),
+    "stack.messaging": ("generate_backend",),
+    "stack.frontend": ("generate_frontend",),
+    "integrations": ("generate_backend",),
+    "deployment": ("setup_devops",),
+    "metadata": (),
+}
+
+ROOT_TASK = "analyze_architecture"
+
+# Campos cuyo orden no es significativo
+_UNORDERED_FIELDS = {"components", "features"}
+
+
+@dataclass
+class GenerationSnapshot:
+    """Lo necesario para regenerar incrementalmente desde un workflow"""
+    config: Dict[str, Any]
+    output_path: str
+    task_results: Dict[str, Any] = field(default_factory=dict)
+    # Tupla de rutas o FileManifest si el manifest en disco está activo
+    generated_files: Iterable[str] = ()
+    # task_id -> archivos que reportó en task.completed
+    task_files: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
+
+
+@dataclass
+class IncrementalPlan:
+    """Tareas a reejecutar y resultados reutilizados"""
+    changed_fields: Tuple[str, ...]
+    rerun: Tuple[str, ...]
+    seeded_results: Dict[str, Any]
+    full: bool = False
+
+    @property
+    def reused(self) -> Tuple[str, ...]:
+        return tuple(self.seeded_results)
+
+
+class SnapshotStore:
+    """Snapshots de los últimos workflows exitosos (LRU acotado)"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._snapshots: "OrderedDict[str, GenerationSnapshot]" = OrderedDict()
+
+    def record(self, workflow_id: str, snapshot: GenerationSnapshot):
+        if self.max_entries <= 0:
+            return
+        self._snapshots[workflow_id] = snapshot
+        self._snapshots.move_to_end(workflow_id)
+        while len(self._snapshots) > self.max_entries:
+            self._snapshots.popitem(last=False)
+
+    def get(self, workflow_id: str) -> Optional[GenerationSnapshot]:
+        return self._snapshots.get(workflow_id)
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+
+def diff_configs(old: Mapping[str, Any], new: Mapping[str, Any]) -> Set[str]:
+    """Rutas de campos cambiados ("stack.cache", "features", ...)"""
+    changed: Set[str] = set()
+    for key in set(old) | set(new):
+        before, after = old.get(key), new.get(key)
+        if key == "stack" and isinstance(before, Mapping) and isinstance(after, Mapping):
+            changed |= {f"stack.{name}" for name in diff_configs(before, after)}
+        elif key in _UNORDERED_FIELDS:
+            if sorted(map(str, before or [])) != sorted(map(str, after or [])):
+                changed.add(key)
+        elif before != after:
+            changed.add(key)
+    return changed
+
+
+def _downstream(compiled: CompiledWorkflow, roots: Iterable[str]) -> Set[str]:
+    selected: Set[str] = set()
+    pending: List[str] = list(roots)
+    while pending:
+        task_id = pending.pop()
+        if task_id in selected:
+            continue
+        selected.add(task_id)
+        pending.extend(compiled.dependents(task_id))
+    return selected
+
+
+def carried_files(snapshot: GenerationSnapshot, rerun: Iterable[str]) -> List[str]:
+    """
+    Archivos del snapshot que siguen vigentes si se reejecuta rerun
+
+    Se descartan los que reportaron las tareas reejecutadas (si los vuelven
+    a generar llegarán en el resultado nuevo); los no atribuidos a ninguna
+    tarea se conservan.
+    """
+    dropped = {path for task_id in rerun for path in snapshot.task_files.get(task_id, ())}
+    return [path for path in snapshot.generated_files if path not in dropped]
+
+
+def carried_task_files(
+    snapshot: GenerationSnapshot, rerun: Iterable[str]
+) -> Dict[str, Tuple[str, ...]]:
+    """Atribución por tarea de los archivos que se conservan"""
+    rerun = set(rerun)
+    return {
+        task_id: files for task_id, files in snapshot.task_files.items()
+        if task_id not in rerun
+    }
+
+
+def plan_incremental(
+    compiled: CompiledWorkflow,
+    snapshot: GenerationSnapshot,
+    new_config: Mapping[str, Any],
+) -> IncrementalPlan:
+    """Calcular qué tareas reejecutar para pasar de snapshot.config a new_config"""
+    changed = diff_configs(snapshot.config, new_config)
+    dag_tasks = set(compiled.topological_order)
+
+    roots: Set[str] = set()
+    for name in changed:
+        impact = FIELD_IMPACT.get(name)
+        roots.update((ROOT_TASK,) if impact is None else impact)
+
+    rerun = _downstream(compiled, roots & dag_tasks)
+    reused = dag_tasks - rerun
+
+    # Sin resultado previo para algo reutilizable no hay incremental posible
+    full = ROOT_TASK in rerun or bool(
+        rerun and not reused.issubset(snapshot.task_results)
+    )
+    if full:
+        rerun, reused = dag_tasks, set()
+
+    return IncrementalPlan(
+        changed_fields=tuple(sorted(changed)),
+        rerun=tuple(t for t in compiled.topological_order if t in rerun),
+        seeded_results={
+            task_id: snapshot.task_results[task_id]
+            for task_id in reused if task_id in snapshot.task_results
+        },
+        full=full,
+    )
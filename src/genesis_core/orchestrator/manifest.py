@@ -0,0 +1,210 @@
+# src/genesis_core/orchestrator/manifest.py
+"""
+Manifest en disco de archivos generados
+
+Formato append-only, una línea por archivo tras una cabecera:
+
+    genesis-manifest v1\\n
+    <path>\\0<size>\\0<sha256>\\n
+
+Se escribe durante la generación (a medida que las tareas reportan sus
+archivos) y se lee con un lector perezoso sobre mmap que nunca
+materializa la lista completa. Reabrir el manifest de un workflow
+(reanudación, relanzamiento tras hedging) continúa el archivo existente
+sin duplicar registros. Para deduplicar, el escritor solo guarda un
+digest de 64 bits por ruta (no las rutas): dos rutas con el mismo digest
+son improbables hasta cientos de millones de archivos. Los archivos que no existen localmente se
+registran con size -1 y hash vacío.
+"""
+
+import hashlib
+import mmap
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional, Set
+
+MANIFEST_HEADER = b"genesis-manifest v1\n"
+_SEP = b"\0"
+_EOL = b"\n"
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """Registro del manifest"""
+    path: str
+    size: int
+    sha256: str
+
+
+def _encode_path(path: str) -> bytes:
+    encoded = path.encode("utf-8")
+    if _SEP in encoded or _EOL in encoded:
+        raise ValueError(f"Invalid path for manifest: {path!r}")
+    return encoded
+
+
+def _path_key(encoded: bytes) -> int:
+    """Digest de 64 bits de una ruta codificada (deduplicación del escritor)"""
+    return int.from_bytes(hashlib.blake2b(encoded, digest_size=8).digest(), "little")
+
+
+def _file_digest(path: str) -> ManifestEntry:
+    try:
+        digest = hashlib.sha256()
+        size = 0
+        with open(path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(1 << 16), b""):
+                digest.update(chunk)
+                size += len(chunk)
+        return ManifestEntry(path, size, digest.hexdigest())
+    except OSError:
+        return ManifestEntry(path, -1, "")
+
+
+class ManifestWriter:
+    """
+    Escritor append-only; ignora rutas ya registradas (también las de un
+    manifest previo en la misma ruta)
+
+    add_files hace I/O bloqueante (hash de contenido): desde código async
+    llamarlo vía asyncio.to_thread.
+    """
+
+    def __init__(self, path: str, root: Optional[str] = None):
+        self.path = path
+        self.root = root
+        self._seen: Set[int] = set()
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if os.path.exists(path):
+            self._seen.update(self._recover(path))
+        self._fh = open(path, "ab")
+        if self._fh.tell() == 0:
+            self._fh.write(MANIFEST_HEADER)
+
+    @staticmethod
+    def _recover(path: str) -> Set[int]:
+        """Digests de rutas de un manifest previo; descarta un registro truncado"""
+        with open(path, "r+b") as fh:
+            size = os.fstat(fh.fileno()).st_size
+            if size < len(MANIFEST_HEADER):
+                head = fh.read()
+                if not MANIFEST_HEADER.startswith(head):
+                    raise ValueError(f"Not a genesis manifest: {path}")
+                fh.truncate(0)
+                return set()
+            seen: Set[int] = set()
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm[:len(MANIFEST_HEADER)] != MANIFEST_HEADER:
+                    raise ValueError(f"Not a genesis manifest: {path}")
+                end = mm.rfind(_EOL) + 1
+                for record in FileManifest._records(mm, len(MANIFEST_HEADER)):
+                    seen.add(_path_key(record[:record.find(_SEP)]))
+            if end < size:
+                fh.truncate(end)
+        return seen
+
+    def append(self, path: str, size: int, sha256: str):
+        """Registrar un archivo con tamaño y hash ya conocidos"""
+        encoded = _encode_path(path)
+        key = _path_key(encoded)
+        record = encoded + _SEP + str(size).encode() + _SEP + sha256.encode() + _EOL
+        with self._lock:
+            if self._fh.closed or key in self._seen:
+                return
+            self._seen.add(key)
+            self._fh.write(record)
+
+    def add_files(self, paths: Iterable[str]) -> int:
+        """Registrar archivos calculando tamaño y hash desde root"""
+        added = 0
+        for path in paths:
+            if _path_key(_encode_path(path)) in self._seen:
+                continue
+            location = os.path.join(self.root, path) if self.root else path
+            entry = _file_digest(location)
+            self.append(path, entry.size, entry.sha256)
+            added += 1
+        return added
+
+    def close(self):
+        with self._lock:
+            if not self._fh.closed:
+                self._fh.close()
+        self._seen.clear()
+
+
+class FileManifest:
+    """
+    Lector perezoso de un manifest
+
+    Cada consulta mapea el archivo, recorre los registros y lo libera:
+    no se mantienen descriptores abiertos ni la lista en memoria, y las
+    consultas ven lo que se haya añadido desde la anterior.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @contextmanager
+    def _mapped(self) -> Iterator[mmap.mmap]:
+        with open(self.path, "rb") as fh:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm[:len(MANIFEST_HEADER)] != MANIFEST_HEADER:
+                    raise ValueError(f"Not a genesis manifest: {self.path}")
+                yield mm
+
+    @staticmethod
+    def _records(mm: mmap.mmap, start: int, prefix: bytes = b"") -> Iterator[bytes]:
+        # Cada registro empieza justo después de un "\n"
+        pos = start
+        while True:
+            if prefix:
+                hit = mm.find(_EOL + prefix, pos - 1)
+                if hit < 0:
+                    return
+                pos = hit + 1
+            end = mm.find(_EOL, pos)
+            if end < 0:
+                return
+            yield mm[pos:end]
+            pos = end + 1
+
+    def entries(self, prefix: str = "") -> Iterator[ManifestEntry]:
+        """Registros completos, opcionalmente filtrados por prefijo de ruta"""
+        with self._mapped() as mm:
+            for record in self._records(mm, len(MANIFEST_HEADER), _encode_path(prefix)):
+                path, size, sha256 = record.split(_SEP)
+                yield ManifestEntry(path.decode("utf-8"), int(size), sha256.decode())
+
+    def with_prefix(self, prefix: str) -> Iterator[str]:
+        """Rutas bajo prefix (p. ej. "backend/")"""
+        for entry in self.entries(prefix):
+            yield entry.path
+
+    def __iter__(self) -> Iterator[str]:
+        return self.with_prefix("")
+
+    def __contains__(self, path: object) -> bool:
+        if not isinstance(path, str):
+            return False
+        needle = _EOL + _encode_path(path) + _SEP
+        with self._mapped() as mm:
+            return mm.find(needle, len(MANIFEST_HEADER) - 1) >= 0
+
+    def __len__(self) -> int:
+        count = 0
+        with self._mapped() as mm:
+            pos = mm.find(_EOL, len(MANIFEST_HEADER))
+            while pos >= 0:
+                count += 1
+                pos = mm.find(_EOL, pos + 1)
+        return count
+
+    def __repr__(self) -> str:
+        return f"FileManifest({self.path!r})"
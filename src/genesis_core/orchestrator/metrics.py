@@ -0,0 +1,157 @@
+# src/genesis_core/orchestrator/metrics.py
+"""
+Métricas de latencia y resultado de generaciones
+
+Histogramas de buckets fijos (end-to-end, por fase, por tarea y por
+agente) y contadores por resultado, exportables en formato texto de
+Prometheus.
+
+Los valores solo se mutan desde el event loop, con incrementos simples
+sobre listas y dicts: el exportador los lee sin locks y, como mucho, ve
+una observación a medio registrar (count ya incrementado, sum no).
+"""
+
+import math
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+# Segundos; cubre desde tareas triviales hasta generaciones de una hora
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+    30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0,
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class LatencyHistogram:
+    """Histograma de buckets fijos (límites superiores inclusivos)"""
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Estimación por interpolación lineal dentro del bucket"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                lower = self.bounds[index - 1] if index > 0 else 0.0
+                if index == len(self.bounds):
+                    return lower
+                upper = self.bounds[index]
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.bounds[-1]
+
+    def cumulative(self) -> Iterable[Tuple[float, int]]:
+        """(límite, acumulado) por bucket, terminando en +Inf"""
+        total = 0
+        for bound, bucket_count in zip(self.bounds + (math.inf,), list(self.counts)):
+            total += bucket_count
+            yield bound, total
+
+
+def _labels(labels: Mapping[str, str]) -> Labels:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(labels: Labels, extra: str = "") -> str:
+    parts = [
+        '%s="%s"' % (name, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in labels
+    ]
+    if extra:
+        parts.append(extra)
+    return "{%s}" % ",".join(parts) if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, bool):
+        return str(int(value))
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsRegistry:
+    """Contadores e histogramas etiquetados"""
+
+    def __init__(self, namespace: str = "genesis", buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.namespace = namespace
+        self.buckets = tuple(buckets)
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, LatencyHistogram]] = {}
+        self._help: Dict[str, str] = {}
+
+    def describe(self, name: str, help_text: str):
+        self._help[name] = help_text
+
+    def inc(self, name: str, amount: float = 1, **labels: str):
+        series = self._counters.setdefault(name, {})
+        key = _labels(labels)
+        series[key] = series.get(key, 0) + amount
+
+    def counter(self, name: str, **labels: str) -> float:
+        return self._counters.get(name, {}).get(_labels(labels), 0)
+
+    def observe(self, name: str, value: float, **labels: str):
+        self.histogram(name, **labels).observe(value)
+
+    def histogram(self, name: str, **labels: str) -> LatencyHistogram:
+        series = self._histograms.setdefault(name, {})
+        key = _labels(labels)
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = LatencyHistogram(self.buckets)
+        return histogram
+
+    def histograms(self, name: str) -> Dict[Labels, LatencyHistogram]:
+        return dict(self._histograms.get(name, {}))
+
+    def render_prometheus(self, gauges: Optional[Mapping[str, float]] = None) -> str:
+        """Formato de exposición de texto de Prometheus (0.0.4)"""
+        lines: List[str] = []
+
+        def header(name: str, kind: str):
+            full = f"{self.namespace}_{name}"
+            if name in self._help:
+                lines.append(f"# HELP {full} {self._help[name]}")
+            lines.append(f"# TYPE {full} {kind}")
+            return full
+
+        for name, series in list(self._counters.items()):
+            full = header(name, "counter")
+            for labels, value in list(series.items()):
+                lines.append(f"{full}{_format_labels(labels)} {_format_value(value)}")
+
+        for name, series in list(self._histograms.items()):
+            full = header(name, "histogram")
+            for labels, histogram in list(series.items()):
+                for bound, total in histogram.cumulative():
+                    le = 'le="%s"' % _format_value(bound)
+                    lines.append(f"{full}_bucket{_format_labels(labels, le)} {total}")
+                lines.append(f"{full}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
+                lines.append(f"{full}_count{_format_labels(labels)} {histogram.count}")
+
+        for name, value in (gauges or {}).items():
+            full = header(name, "gauge")
+            lines.append(f"{full} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,375 @@
+# src/genesis_core/orchestrator/output_sink.py
+"""
+Sink de salida con deduplicación por contenido
+
+Los proyectos generados desde el mismo template y stack comparten muchos
+archivos idénticos byte a byte (Dockerfiles, CI, lockfiles). El sink
+guarda cada contenido una sola vez en un store direccionado por sha256:
+
+    <store>/<sha[:2]>/<sha>
+
+y el árbol de cada proyecto queda enlazado a esos blobs:
+
+- hardlink: el archivo del proyecto y el blob son el mismo inodo (editar
+  un archivo en sitio cambia todos los proyectos que lo comparten)
+- reflink: copia con clonado de bloques (FICLONE) donde el sistema de
+  archivos lo soporta; si no, copia normal
+
+Si el enlace no es posible (otro dispositivo, límite de enlaces) se copia.
+Si prune() borra un blob entre la comprobación y el enlace, el blob se
+restaura desde el contenido que se está escribiendo.
+
+Las escrituras se agrupan en lotes: cada directorio se crea una vez por
+lote y los fsync (blobs nuevos y directorios tocados) se hacen al final
+del lote en lugar de por archivo.
+
+Todo es I/O bloqueante: desde código async usar asyncio.to_thread.
+"""
+
+import errno
+import hashlib
+import os
+import shutil
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Set, Tuple
+
+LINK_MODES = ("hardlink", "reflink")
+
+# ioctl de Linux para clonar un archivo (reflink)
+_FICLONE = 0x40049409
+
+_CHUNK = 1 << 16
+
+
+@dataclass
+class SinkReport:
+    """Resultado de un ingest/write del sink"""
+    files: int = 0
+    deduplicated: int = 0
+    missing: int = 0
+    bytes: int = 0
+    stored_bytes: int = 0
+    seconds: float = 0.0
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Fracción de los bytes recibidos que ya estaban en el store"""
+        return 1 - self.stored_bytes / self.bytes if self.bytes else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Bytes por segundo"""
+        return self.bytes / self.seconds if self.seconds else 0.0
+
+    def add(self, other: "SinkReport"):
+        self.files += other.files
+        self.deduplicated += other.deduplicated
+        self.missing += other.missing
+        self.bytes += other.bytes
+        self.stored_bytes += other.stored_bytes
+        self.seconds += other.seconds
+
+
+def _digest_file(path: str) -> Tuple[int, str]:
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(_CHUNK), b""):
+            digest.update(chunk)
+            size += len(chunk)
+    return size, digest.hexdigest()
+
+
+def _fsync_path(path: str, directory: bool = False):
+    flags = os.O_RDONLY | (getattr(os, "O_DIRECTORY", 0) if directory else 0)
+    try:
+        fd = os.open(path, flags)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _reflink(source: str, target: str):
+    """Clonar source en target (FICLONE); copia normal si no se soporta"""
+    try:
+        import fcntl
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        return
+    except (ImportError, OSError):
+        pass
+    shutil.copyfile(source, target)
+
+
+class _Batch:
+    """Directorios creados y pendientes de fsync dentro de un lote"""
+
+    def __init__(self):
+        self.created: Set[str] = set()
+        self.dirty_dirs: Set[str] = set()
+        self.new_blobs: List[str] = []
+
+    def ensure_dir(self, directory: str):
+        if directory and directory not in self.created:
+            os.makedirs(directory, exist_ok=True)
+            self.created.add(directory)
+
+
+class OutputSink:
+    """
+    Store de contenido + materialización de árboles de proyecto
+
+    - directory: raíz del store (mismo sistema de archivos que las
+      salidas para poder enlazar)
+    - link: hardlink | reflink
+    - batch_size: archivos por lote de fsync
+    - fsync: sincronizar blobs nuevos y directorios al cerrar cada lote
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        link: str = "hardlink",
+        batch_size: int = 256,
+        fsync: bool = True,
+    ):
+        if link not in LINK_MODES:
+            raise ValueError(f"Unknown link mode: {link}")
+        self.directory = directory
+        self.link = link
+        self.batch_size = max(1, batch_size)
+        self.fsync = fsync
+
+        self._lock = threading.Lock()
+        self._totals = SinkReport()
+        self._stats = {"linked": 0, "copied": 0, "restored": 0, "batches": 0, "fsyncs": 0}
+
+        os.makedirs(directory, exist_ok=True)
+
+    def blob_path(self, sha256: str) -> str:
+        return os.path.join(self.directory, sha256[:2], sha256)
+
+    # Entrada
+
+    def ingest(self, root: str, paths: Iterable[str]) -> Dict[str, Tuple[int, str]]:
+        """
+        Deduplicar archivos ya escritos bajo root (rutas relativas o absolutas)
+
+        Devuelve path -> (size, sha256) de los archivos procesados; los que
+        no existen se omiten.
+        """
+        digests: Dict[str, Tuple[int, str]] = {}
+        pending = list(dict.fromkeys(paths))
+        for start in range(0, len(pending), self.batch_size):
+            report = SinkReport()
+            started = time.monotonic()
+            batch = _Batch()
+            for path in pending[start:start + self.batch_size]:
+                location = os.path.join(root, path)
+                if not os.path.isfile(location) or os.path.islink(location):
+                    report.missing += 1
+                    continue
+                size, sha256 = _digest_file(location)
+                digests[path] = (size, sha256)
+                self._ingest_one(location, size, sha256, report, batch)
+            self._close_batch(batch, report, started)
+        return digests
+
+    def write(self, root: str, files: Mapping[str, bytes]) -> SinkReport:
+        """Escribir archivos (ruta relativa -> contenido) bajo root vía el store"""
+        total = SinkReport()
+        items = list(files.items())
+        for start in range(0, len(items), self.batch_size):
+            report = SinkReport()
+            started = time.monotonic()
+            batch = _Batch()
+            for path, content in items[start:start + self.batch_size]:
+                sha256 = hashlib.sha256(content).hexdigest()
+                blob = self.blob_path(sha256)
+                report.files += 1
+                report.bytes += len(content)
+                if os.path.exists(blob):
+                    report.deduplicated += 1
+                else:
+                    self._store_bytes(blob, content, batch)
+                    report.stored_bytes += len(content)
+                target = os.path.join(root, path)
+                try:
+                    self._materialize(blob, target, batch)
+                except FileNotFoundError:
+                    # prune() borró el blob entre la comprobación y el enlace
+                    self._store_bytes(blob, content, batch)
+                    self._count("restored")
+                    self._materialize(blob, target, batch)
+            self._close_batch(batch, report, started)
+            total.add(report)
+        return total
+
+    # Blobs
+
+    def _ingest_one(self, location: str, size: int, sha256: str, report: SinkReport, batch: _Batch):
+        blob = self.blob_path(sha256)
+        report.files += 1
+        report.bytes += size
+        if not os.path.exists(blob):
+            # Primer archivo con este contenido: pasa a ser el blob
+            batch.ensure_dir(os.path.dirname(blob))
+            try:
+                self._adopt(location, blob)
+                report.stored_bytes += size
+                batch.new_blobs.append(blob)
+                batch.dirty_dirs.add(os.path.dirname(blob))
+                return
+            except FileExistsError:
+                pass
+        report.deduplicated += 1
+        try:
+            if os.path.samefile(location, blob):
+                return
+        except OSError:
+            pass
+        try:
+            self._materialize(blob, location, batch)
+        except FileNotFoundError:
+            # prune() borró el blob: el archivo del proyecto vuelve a serlo
+            self._restore(location, blob, batch)
+
+    def _restore(self, location: str, blob: str, batch: _Batch):
+        try:
+            self._adopt(location, blob)
+            batch.new_blobs.append(blob)
+            batch.dirty_dirs.add(os.path.dirname(blob))
+        except FileExistsError:
+            # Otro ingest lo restauró antes
+            self._materialize(blob, location, batch)
+        self._count("restored")
+
+    def _adopt(self, location: str, blob: str):
+        if self.link == "hardlink":
+            try:
+                os.link(location, blob)
+                return
+            except FileExistsError:
+                raise
+            except OSError:
+                pass
+        tmp = f"{blob}.{uuid.uuid4().hex}.tmp"
+        try:
+            _reflink(location, tmp)
+            os.link(tmp, blob)
+        finally:
+            if os.path.lexists(tmp):
+                os.unlink(tmp)
+
+    def _store_bytes(self, blob: str, content: bytes, batch: _Batch):
+        batch.ensure_dir(os.path.dirname(blob))
+        tmp = f"{blob}.{uuid.uuid4().hex}.tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(content)
+        try:
+            os.link(tmp, blob)
+            batch.new_blobs.append(blob)
+            batch.dirty_dirs.add(os.path.dirname(blob))
+        except FileExistsError:
+            pass
+        finally:
+            os.unlink(tmp)
+
+    def _materialize(self, blob: str, target: str, batch: _Batch):
+        """Sustituir target (atómicamente) por un enlace o clon de blob"""
+        directory = os.path.dirname(target)
+        batch.ensure_dir(directory)
+        tmp = os.path.join(directory, f".{os.path.basename(target)}.{uuid.uuid4().hex}.tmp")
+        linked = False
+        if self.link == "hardlink":
+            try:
+                os.link(blob, tmp)
+                linked = True
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.EMLINK, errno.EPERM, errno.ENOTSUP):
+                    raise
+        try:
+            if not linked:
+                _reflink(blob, tmp)
+            os.replace(tmp, target)
+        except BaseException:
+            if os.path.lexists(tmp):
+                os.unlink(tmp)
+            raise
+        batch.dirty_dirs.add(directory)
+        self._count("linked" if linked else "copied")
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def _close_batch(self, batch: _Batch, report: SinkReport, started: float):
+        fsyncs = 0
+        if self.fsync:
+            for path in batch.new_blobs:
+                _fsync_path(path)
+            for directory in sorted(batch.dirty_dirs):
+                _fsync_path(directory, directory=True)
+            fsyncs = len(batch.new_blobs) + len(batch.dirty_dirs)
+        report.seconds = time.monotonic() - started
+        with self._lock:
+            self._totals.add(report)
+            self._stats["batches"] += 1
+            self._stats["fsyncs"] += fsyncs
+
+    # Mantenimiento
+
+    def prune(self) -> int:
+        """
+        Borrar blobs que ya no enlaza ningún proyecto
+
+        Solo en modo hardlink: con reflink los proyectos son copias y el
+        contador de enlaces no dice si un blob se usa, así que no se borra
+        nada. Los .tmp son escrituras en curso y se ignoran.
+        """
+        if self.link != "hardlink":
+            return 0
+        removed = 0
+        for dirpath, _, filenames in os.walk(self.directory):
+            for name in filenames:
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    if os.stat(path).st_nlink == 1:
+                        os.unlink(path)
+                        removed += 1
+                except FileNotFoundError:
+                    pass
+        return removed
+
+    # Métricas
+
+    def report(self) -> SinkReport:
+        with self._lock:
+            totals = SinkReport()
+            totals.add(self._totals)
+            return totals
+
+    def stats(self) -> Dict[str, float]:
+        totals = self.report()
+        with self._lock:
+            counters = dict(self._stats)
+        return {
+            **counters,
+            "files": totals.files,
+            "deduplicated": totals.deduplicated,
+            "missing": totals.missing,
+            "bytes": totals.bytes,
+            "stored_bytes": totals.stored_bytes,
+            "dedup_ratio": totals.dedup_ratio,
+            "throughput_bytes_per_second": totals.throughput,
+        }
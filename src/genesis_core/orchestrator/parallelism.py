@@ -0,0 +1,108 @@
+# src/genesis_core/orchestrator/parallelism.py
+"""
+Paralelismo efectivo por workflow
+
+En lugar de un max_parallel_tasks fijo, cada workflow recibe:
+
+    min(ancho del DAG, presupuesto global libre, capacidad libre de sus agentes)
+
+con un mínimo de 1 para garantizar progreso. La decisión se guarda con
+todos sus factores para poder explicar por qué un workflow obtuvo el
+paralelismo que obtuvo.
+"""
+
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Mapping, Optional
+
+
+@dataclass
+class ParallelismDecision:
+    """Paralelismo concedido a un workflow y los límites que lo determinaron"""
+    effective: int
+    dag_width: int
+    global_budget: int
+    global_in_use: int
+    agent_demand: Dict[str, int] = field(default_factory=dict)
+    agent_headroom: Dict[str, Optional[int]] = field(default_factory=dict)
+    limited_by: str = "dag_width"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class ParallelismPlanner:
+    """
+    Reparte un presupuesto global de tareas concurrentes entre workflows
+
+    - global_budget: tareas simultáneas entre todos los workflows activos
+    - agent_capacity: tareas simultáneas por tipo de agente (sin entrada =
+      sin límite propio)
+    """
+
+    def __init__(self, global_budget: int = 64, agent_capacity: Optional[Mapping[str, int]] = None):
+        self.global_budget = global_budget
+        self.agent_capacity = dict(agent_capacity or {})
+
+        self._granted: Dict[str, ParallelismDecision] = {}
+        self._in_use = 0
+        self._agent_load: Counter = Counter()
+
+    def plan(self, workflow_id: str, dag_width: int, agent_demand: Mapping[str, int]) -> ParallelismDecision:
+        """Calcular y reservar el paralelismo de un workflow"""
+        self.release(workflow_id)
+
+        headroom: Dict[str, Optional[int]] = {}
+        for agent_id in agent_demand:
+            capacity = self.agent_capacity.get(agent_id)
+            headroom[agent_id] = (
+                None if capacity is None else max(0, capacity - self._agent_load[agent_id])
+            )
+
+        # Tareas que los agentes del workflow pueden absorber ahora mismo
+        agent_bound = sum(
+            demand if headroom[agent_id] is None else min(demand, headroom[agent_id])
+            for agent_id, demand in agent_demand.items()
+        )
+        global_free = max(0, self.global_budget - self._in_use)
+
+        bounds = {"dag_width": dag_width, "global_budget": global_free, "agent_capacity": agent_bound}
+        limited_by = min(bounds, key=bounds.get)
+        effective = max(1, bounds[limited_by])
+
+        decision = ParallelismDecision(
+            effective=effective,
+            dag_width=dag_width,
+            global_budget=self.global_budget,
+            global_in_use=self._in_use,
+            agent_demand=dict(agent_demand),
+            agent_headroom=headroom,
+            limited_by=limited_by,
+        )
+
+        self._granted[workflow_id] = decision
+        self._in_use += effective
+        for agent_id, demand in agent_demand.items():
+            self._agent_load[agent_id] += min(demand, effective)
+
+        return decision
+
+    def release(self, workflow_id: str):
+        """Devolver la reserva de un workflow terminado"""
+        decision = self._granted.pop(workflow_id, None)
+        if decision is None:
+            return
+
+        self._in_use -= decision.effective
+        for agent_id, demand in decision.agent_demand.items():
+            self._agent_load[agent_id] -= min(demand, decision.effective)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "budget": self.global_budget,
+            "in_use": self._in_use,
+            "workflows": len(self._granted),
+        }
+
+    def agent_load(self) -> Dict[str, int]:
+        return {agent_id: load for agent_id, load in self._agent_load.items() if load}
@@ -0,0 +1,180 @@
+# src/genesis_core/orchestrator/result_cache.py
+"""
+Cache de resultados de la fase de arquitectura
+
+Dos niveles (LRU en memoria + directorio en disco) indexados por el hash
+canónico de ProjectConfig.to_dict(). Solo guarda lo que devolvió
+architect_agent; nunca produce arquitectura por sí mismo.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+def canonical_hash(data: Dict[str, Any]) -> str:
+    """Hash estable de un diccionario (independiente del orden de claves)"""
+    payload = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedArchitecture:
+    """Resultados cacheados de analyze_architecture + design_architecture"""
+    analysis: Any
+    design: Any
+    created_at: float
+
+
+class ArchitectureCache:
+    """
+    Cache LRU en memoria con respaldo opcional en disco
+
+    - Expiración por TTL en ambos niveles
+    - Desalojo por tamaño: LRU en memoria, más antiguo (mtime) en disco
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl: float = 24 * 3600.0,
+        directory: Optional[str] = None,
+        max_disk_entries: int = 4096,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.directory = directory
+        self.max_disk_entries = max_disk_entries
+
+        self._memory: "OrderedDict[str, CachedArchitecture]" = OrderedDict()
+        self._stats = {
+            "hits": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+        }
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    async def lookup(self, key: str) -> Optional[CachedArchitecture]:
+        """Buscar entrada; el nivel de disco se consulta fuera del event loop"""
+        entry = self._memory.get(key)
+        if entry is not None:
+            if self._expired(entry):
+                del self._memory[key]
+            else:
+                self._memory.move_to_end(key)
+                self._stats["hits"] += 1
+                self._stats["memory_hits"] += 1
+                return entry
+
+        if self.directory:
+            entry = await asyncio.to_thread(self._read_disk, key)
+            if entry is not None:
+                self._remember(key, entry)
+                self._stats["hits"] += 1
+                self._stats["disk_hits"] += 1
+                return entry
+
+        self._stats["misses"] += 1
+        return None
+
+    async def store(self, key: str, analysis: Any, design: Any) -> CachedArchitecture:
+        """Guardar resultados de arquitectura en ambos niveles"""
+        entry = CachedArchitecture(analysis=analysis, design=design, created_at=time.time())
+        self._remember(key, entry)
+
+        if self.directory:
+            evicted = await asyncio.to_thread(self._write_disk, key, entry)
+            self._stats["evictions"] += evicted
+
+        return entry
+
+    def invalidate(self, key: str):
+        """Eliminar una entrada de ambos niveles"""
+        self._memory.pop(key, None)
+        if self.directory:
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        """Contadores de hits/misses y tamaño actual"""
+        return {**self._stats, "entries": len(self._memory)}
+
+    def _expired(self, entry: CachedArchitecture) -> bool:
+        return time.time() - entry.created_at > self.ttl
+
+    def _remember(self, key: str, entry: CachedArchitecture):
+        if self.max_entries <= 0:
+            return
+
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _read_disk(self, key: str) -> Optional[CachedArchitecture]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                entry = CachedArchitecture(**json.load(fh))
+        except (FileNotFoundError, ValueError, TypeError):
+            return None
+
+        if self._expired(entry):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            return None
+        return entry
+
+    def _write_disk(self, key: str, entry: CachedArchitecture) -> int:
+        if self.max_disk_entries <= 0:
+            return 0
+
+        # Escritura atómica: archivo temporal + rename
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(
+                {"analysis": entry.analysis, "design": entry.design,
+                 "created_at": entry.created_at},
+                fh,
+                default=str,
+            )
+        os.replace(tmp_path, self._path(key))
+        return self._evict_disk()
+
+    def _evict_disk(self) -> int:
+        entries = [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith(".json")
+        ]
+        overflow = len(entries) - self.max_disk_entries
+        if overflow <= 0:
+            return 0
+
+        evicted = 0
+        entries.sort(key=os.path.getmtime)
+        for path in entries[:overflow]:
+            try:
+                os.remove(path)
+                evicted += 1
+            except FileNotFoundError:
+                pass
+        return evicted
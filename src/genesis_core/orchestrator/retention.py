@@ -0,0 +1,273 @@
+# src/genesis_core/orchestrator/retention.py
+"""
+Retención acotada de estado de workflows
+
+Los workflows terminados se degradan a un ArchivedWorkflow compacto
+(__slots__, sin ProjectConfig ni WorkflowDefinition). Cuando el archivo
+supera su límite, las entradas más antiguas se descartan o se vuelcan
+a un archivo JSONL si hay uno configurado. El índice del volcado vive en
+memoria, así que el archivo se vacía al crear la política: lo que dejó
+un proceso anterior ya no es consultable.
+"""
+
+import json
+import os
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Container, Dict, Iterable, Optional, Tuple
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+class ArchivedWorkflow:
+    """Resumen inmutable de un workflow terminado"""
+
+    __slots__ = (
+        "workflow_id",
+        "status",
+        "started_at",
+        "completed_at",
+        "error",
+        "progress",
+        "name",
+        "template",
+        "output_path",
+        "created_at",
+        "components",
+        "features",
+    )
+
+    def __init__(
+        self,
+        workflow_id: str,
+        status: Optional[str],
+        started_at: Optional[str],
+        completed_at: Optional[str],
+        error: Optional[str],
+        progress: Any,
+        name: str,
+        template: str,
+        output_path: str,
+        created_at: Optional[str],
+        components: Tuple[str, ...],
+        features: Tuple[str, ...],
+    ):
+        self.workflow_id = workflow_id
+        self.status = status
+        self.started_at = started_at
+        self.completed_at = completed_at
+        self.error = error
+        self.progress = progress
+        self.name = name
+        self.template = template
+        self.output_path = output_path
+        self.created_at = created_at
+        self.components = components
+        self.features = features
+
+    @classmethod
+    def from_states(
+        cls, workflow_id: str, workflow_state: Any = None, project_state: Any = None
+    ) -> "ArchivedWorkflow":
+        """Construir resumen a partir del estado vivo"""
+        if project_state is None and workflow_state is not None:
+            project_state = workflow_state.project_state
+
+        config = project_state.config
+        return cls(
+            workflow_id=workflow_id,
+            status=workflow_state.status if workflow_state else None,
+            started_at=_iso(workflow_state.started_at) if workflow_state else None,
+            completed_at=_iso(workflow_state.completed_at) if workflow_state else None,
+            error=workflow_state.error if workflow_state else None,
+            progress=workflow_state.get_progress() if workflow_state else None,
+            name=project_state.name,
+            template=str(getattr(project_state.template, "value", project_state.template)),
+            output_path=project_state.output_path,
+            created_at=_iso(project_state.created_at),
+            components=tuple(str(getattr(c, "value", c)) for c in config.components),
+            features=tuple(str(getattr(f, "value", f)) for f in config.features),
+        )
+
+    def workflow_status(self) -> Optional[Dict[str, Any]]:
+        """Mismo formato que CoreOrchestrator.get_workflow_status"""
+        if self.status is None:
+            return None
+
+        return {
+            "workflow_id": self.workflow_id,
+            "status": self.status,
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
+            "project_name": self.name,
+            "progress": self.progress,
+            "error": self.error,
+            "archived": True,
+        }
+
+    def project_status(self) -> Dict[str, Any]:
+        """Mismo formato que CoreOrchestrator.get_project_status"""
+        return {
+            "name": self.name,
+            "template": self.template,
+            "output_path": self.output_path,
+            "created_at": self.created_at,
+            "components": list(self.components),
+            "features": list(self.features),
+            "archived": True,
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(
+            [getattr(self, slot) for slot in self.__slots__], default=str
+        )
+
+    @classmethod
+    def from_json(cls, line: str) -> "ArchivedWorkflow":
+        values = json.loads(line)
+        record = cls(*values)
+        record.components = tuple(record.components)
+        record.features = tuple(record.features)
+        return record
+
+
+class WorkflowRetention:
+    """
+    Política de retención para project_states / workflow_states
+
+    - max_live: máximo de entradas vivas (solo se degradan las terminadas)
+    - max_age: segundos tras los cuales una entrada terminada se archiva
+    - max_archived: máximo de resúmenes en memoria; el exceso se vuelca a
+      spill_path (si existe) o se descarta
+    - max_spilled: máximo de resúmenes volcados; los más antiguos se
+      descartan y el archivo se compacta cuando la mitad está muerta
+    """
+
+    def __init__(
+        self,
+        max_live: int = 1000,
+        max_age: float = 3600.0,
+        max_archived: int = 100_000,
+        spill_path: Optional[str] = None,
+        max_spilled: int = 1_000_000,
+    ):
+        self.max_live = max_live
+        self.max_age = max_age
+        self.max_archived = max_archived
+        self.spill_path = spill_path
+        self.max_spilled = max_spilled
+
+        self._archive: "OrderedDict[str, ArchivedWorkflow]" = OrderedDict()
+        self._spilled: Dict[str, int] = {}
+        # Líneas del volcado que ya no están en el índice
+        self._spill_dead = 0
+        self._stats = {"archived": 0, "spilled": 0, "evicted": 0, "compactions": 0}
+
+        if spill_path and os.path.exists(spill_path):
+            open(spill_path, "w").close()
+
+    def enforce(
+        self,
+        workflow_states: Dict[str, Any],
+        project_states: Dict[str, Any],
+        active: Container[str],
+        now: Optional[datetime] = None,
+        companions: Iterable[Dict[str, Any]] = (),
+    ) -> int:
+        """
+        Degradar entradas terminadas que excedan el límite o la edad
+
+        Los dicts se recorren en orden de inserción (más antiguas primero),
+        así que el recorrido se corta en cuanto no queda nada que degradar.
+        active son los workflows que no se pueden degradar (en ejecución o
+        aún arrancando). companions son otros dicts por workflow_id que se podan a la vez.
+        """
+        companions = tuple(companions)
+        now = now or datetime.utcnow()
+        demoted = 0
+
+        for workflow_id in list(project_states):
+            over_cap = len(project_states) > self.max_live
+            project_state = project_states[workflow_id]
+            too_old = (now - project_state.created_at).total_seconds() > self.max_age
+
+            if not over_cap and not too_old:
+                break
+            if workflow_id in active:
+                continue
+
+            self.archive(
+                workflow_id,
+                workflow_states.pop(workflow_id, None),
+                project_states.pop(workflow_id),
+            )
+            for companion in companions:
+                companion.pop(workflow_id, None)
+            demoted += 1
+
+        return demoted
+
+    def archive(self, workflow_id: str, workflow_state: Any, project_state: Any):
+        """Archivar un workflow terminado"""
+        self._archive[workflow_id] = ArchivedWorkflow.from_states(
+            workflow_id, workflow_state, project_state
+        )
+        self._stats["archived"] += 1
+
+        while len(self._archive) > self.max_archived:
+            old_id, record = self._archive.popitem(last=False)
+            if self.spill_path:
+                self._spill(old_id, record)
+            else:
+                self._stats["evicted"] += 1
+
+    def get(self, workflow_id: str) -> Optional[ArchivedWorkflow]:
+        """Buscar resumen archivado (memoria o volcado en disco)"""
+        record = self._archive.get(workflow_id)
+        if record is not None:
+            return record
+
+        offset = self._spilled.get(workflow_id)
+        if offset is None:
+            return None
+
+        with open(self.spill_path, "r", encoding="utf-8") as fh:
+            fh.seek(offset)
+            return ArchivedWorkflow.from_json(fh.readline())
+
+    def __len__(self) -> int:
+        return len(self._archive) + len(self._spilled)
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._stats, "archive_size": len(self._archive)}
+
+    def _spill(self, workflow_id: str, record: ArchivedWorkflow):
+        with open(self.spill_path, "a", encoding="utf-8") as fh:
+            fh.seek(0, os.SEEK_END)
+            self._spilled[workflow_id] = fh.tell()
+            fh.write(record.to_json() + "\n")
+        self._stats["spilled"] += 1
+
+        while len(self._spilled) > self.max_spilled:
+            del self._spilled[next(iter(self._spilled))]
+            self._spill_dead += 1
+            self._stats["evicted"] += 1
+        if self._spill_dead > len(self._spilled):
+            self._compact()
+
+    def _compact(self):
+        """Reescribir el volcado solo con las entradas del índice"""
+        tmp_path = f"{self.spill_path}.tmp"
+        offsets: Dict[str, int] = {}
+        with open(self.spill_path, "r", encoding="utf-8") as src, \
+                open(tmp_path, "w", encoding="utf-8") as dst:
+            for workflow_id, offset in self._spilled.items():
+                src.seek(offset)
+                offsets[workflow_id] = dst.tell()
+                dst.write(src.readline())
+        os.replace(tmp_path, self.spill_path)
+        self._spilled = offsets
+        self._spill_dead = 0
+        self._stats["compactions"] += 1
@@ -0,0 +1,66 @@
+# src/genesis_core/orchestrator/single_flight.py
+"""
+Coalescencia de llamadas idénticas en curso (single-flight)
+
+Mientras una llamada con cierta clave está en curso, las siguientes con la
+misma clave esperan su resultado en lugar de repetir el trabajo: todas
+reciben el mismo objeto (o la misma excepción). La ejecución compartida
+solo se cancela cuando no queda ningún llamador esperándola.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Flight(Generic[T]):
+    task: "asyncio.Future[T]"
+    waiters: int = 0
+
+
+class SingleFlight(Generic[T]):
+    """Una ejecución por clave; los duplicados concurrentes se adjuntan"""
+
+    def __init__(self):
+        self._flights: Dict[str, _Flight[T]] = {}
+        self._stats = {"leaders": 0, "coalesced": 0}
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(factory()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+            self._stats["leaders"] += 1
+        else:
+            self._stats["coalesced"] += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            # El último llamador que se va cancela la ejecución compartida
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _forget(self, key: str, flight: _Flight[T]):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    @property
+    def coalescing_rate(self) -> float:
+        """Fracción de llamadas servidas por una ejecución ajena"""
+        calls = self._stats["leaders"] + self._stats["coalesced"]
+        return self._stats["coalesced"] / calls if calls else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._stats, "in_flight": len(self), "coalescing_rate": self.coalescing_rate}
@@ -0,0 +1,262 @@
+# src/genesis_core/orchestrator/tracing.py
+"""
+Trazas por workflow: un span por tarea con tiempos de encolado, inicio y fin
+
+Los tiempos salen de los broadcasts task.* de MCPturbo (reloj monotónico
+local). Si MCPturbo no emite task.queued, el encolado se deduce como el
+fin de la última dependencia (o el inicio del workflow).
+
+Exporta a Chrome trace (chrome://tracing, Perfetto) y a JSON de OTLP, y
+calcula la ruta crítica con la holgura de cada tarea.
+"""
+
+import hashlib
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class TaskSpan:
+    """Ciclo de vida de una tarea del workflow"""
+    task_id: str
+    agent_id: str
+    dependencies: Tuple[str, ...] = ()
+    enqueued_at: Optional[float] = None
+    started_at: Optional[float] = None
+    ended_at: Optional[float] = None
+    status: str = "pending"
+
+    @property
+    def queued(self) -> float:
+        """Espera entre encolado e inicio (p. ej. por max_parallel_tasks)"""
+        if self.enqueued_at is None or self.started_at is None:
+            return 0.0
+        return max(0.0, self.started_at - self.enqueued_at)
+
+    @property
+    def running(self) -> float:
+        if self.started_at is None or self.ended_at is None:
+            return 0.0
+        return self.ended_at - self.started_at
+
+
+@dataclass
+class WorkflowTrace:
+    """Spans de un workflow; tiempos en segundos de time.monotonic()"""
+    workflow_id: str
+    started_at: float
+    wall_started_at: float
+    spans: Dict[str, TaskSpan] = field(default_factory=dict)
+    ended_at: Optional[float] = None
+
+    @classmethod
+    def from_definition(cls, workflow_def: Any) -> "WorkflowTrace":
+        trace = cls(workflow_def.id, time.monotonic(), time.time())
+        for task in workflow_def.tasks:
+            trace.spans[task.id] = TaskSpan(
+                task.id, task.agent_id, tuple(task.dependencies)
+            )
+        return trace
+
+    def enqueue(self, task_id: str, at: float):
+        span = self.spans.get(task_id)
+        if span is not None and span.enqueued_at is None:
+            span.enqueued_at = at
+
+    def start(self, task_id: str, at: float):
+        span = self.spans.get(task_id)
+        if span is None:
+            return
+        span.started_at = at
+        span.status = "running"
+        if span.enqueued_at is None:
+            span.enqueued_at = self._ready_at(span)
+
+    def end(self, task_id: str, at: float, status: str = "completed"):
+        span = self.spans.get(task_id)
+        if span is None:
+            return
+        span.ended_at = at
+        span.status = status
+
+    def finish(self, at: float):
+        self.ended_at = at
+
+    def _ready_at(self, span: TaskSpan) -> float:
+        ends = [
+            self.spans[dep].ended_at for dep in span.dependencies
+            if dep in self.spans and self.spans[dep].ended_at is not None
+        ]
+        return max(ends, default=self.started_at)
+
+    # Análisis
+
+    def critical_path(self) -> Dict[str, Any]:
+        """
+        Cadena de tareas que determinó la duración del workflow
+
+        Se parte de la tarea que terminó última y se retrocede por la
+        dependencia que terminó más tarde. La holgura de cada tarea es
+        cuánto podría haber terminado más tarde sin retrasar el workflow.
+        """
+        finished = {
+            task_id: span for task_id, span in self.spans.items()
+            if span.ended_at is not None
+        }
+        end = self.ended_at
+        if end is None:
+            end = max((span.ended_at for span in finished.values()), default=self.started_at)
+
+        path: List[TaskSpan] = []
+        current = max(finished.values(), key=lambda span: span.ended_at, default=None)
+        while current is not None:
+            path.append(current)
+            current = max(
+                (finished[dep] for dep in current.dependencies if dep in finished),
+                key=lambda span: span.ended_at,
+                default=None,
+            )
+        path.reverse()
+
+        return {
+            "workflow_id": self.workflow_id,
+            "duration": end - self.started_at,
+            "path": [
+                {
+                    "task_id": span.task_id,
+                    "agent_id": span.agent_id,
+                    "queued": span.queued,
+                    "running": span.running,
+                }
+                for span in path
+            ],
+            "queued_on_path": sum(span.queued for span in path),
+            "running_on_path": sum(span.running for span in path),
+            "slack": self._slack(finished, end),
+        }
+
+    def _slack(self, finished: Dict[str, TaskSpan], end: float) -> Dict[str, float]:
+        # Pasada hacia atrás: fin más tardío admisible de cada tarea
+        dependents: Dict[str, List[str]] = {task_id: [] for task_id in finished}
+        for span in finished.values():
+            for dep in span.dependencies:
+                if dep in dependents:
+                    dependents[dep].append(span.task_id)
+
+        latest_end: Dict[str, float] = {}
+
+        def _latest(task_id: str) -> float:
+            if task_id not in latest_end:
+                latest_end[task_id] = min(
+                    (_latest(child) - finished[child].running for child in dependents[task_id]),
+                    default=end,
+                )
+            return latest_end[task_id]
+
+        return {
+            task_id: max(0.0, _latest(task_id) - span.ended_at)
+            for task_id, span in finished.items()
+        }
+
+    # Exportación
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Formato Trace Event (eventos completos "X", µs relativos al inicio)"""
+        threads: Dict[str, int] = {}
+        events: List[Dict[str, Any]] = []
+
+        def _us(at: float) -> float:
+            return round((at - self.started_at) * 1e6, 3)
+
+        for span in self.spans.values():
+            tid = threads.setdefault(span.agent_id, len(threads) + 1)
+            if span.enqueued_at is not None and span.started_at is not None and span.queued:
+                events.append({
+                    "name": f"{span.task_id} (queued)",
+                    "cat": "queue",
+                    "ph": "X",
+                    "ts": _us(span.enqueued_at),
+                    "dur": round(span.queued * 1e6, 3),
+                    "pid": 1,
+                    "tid": tid,
+                })
+            if span.started_at is not None:
+                ended = span.ended_at if span.ended_at is not None else span.started_at
+                events.append({
+                    "name": span.task_id,
+                    "cat": "task",
+                    "ph": "X",
+                    "ts": _us(span.started_at),
+                    "dur": round((ended - span.started_at) * 1e6, 3),
+                    "pid": 1,
+                    "tid": tid,
+                    "args": {
+                        "agent_id": span.agent_id,
+                        "status": span.status,
+                        "dependencies": list(span.dependencies),
+                    },
+                })
+
+        metadata = [
+            {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": self.workflow_id}}
+        ] + [
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": agent_id}}
+            for agent_id, tid in threads.items()
+        ]
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """JSON de OTLP (ExportTraceServiceRequest): un span raíz y uno por tarea"""
+        trace_id = hashlib.sha256(self.workflow_id.encode()).hexdigest()[:32]
+
+        def _span_id(name: str) -> str:
+            return hashlib.sha256(f"{self.workflow_id}/{name}".encode()).hexdigest()[:16]
+
+        def _nanos(at: Optional[float]) -> str:
+            at = self.started_at if at is None else at
+            return str(int((self.wall_started_at + at - self.started_at) * 1e9))
+
+        def _attrs(values: Dict[str, Any]) -> List[Dict[str, Any]]:
+            return [
+                {"key": key, "value": {"stringValue": str(value)}}
+                for key, value in values.items()
+            ]
+
+        root_id = _span_id("workflow")
+        spans = [{
+            "traceId": trace_id,
+            "spanId": root_id,
+            "name": "project_generation",
+            "kind": 1,
+            "startTimeUnixNano": _nanos(self.started_at),
+            "endTimeUnixNano": _nanos(self.ended_at),
+            "attributes": _attrs({"genesis.workflow_id": self.workflow_id}),
+        }]
+        for span in self.spans.values():
+            if span.started_at is None:
+                continue
+            spans.append({
+                "traceId": trace_id,
+                "spanId": _span_id(span.task_id),
+                "parentSpanId": root_id,
+                "name": span.task_id,
+                "kind": 1,
+                "startTimeUnixNano": _nanos(span.started_at),
+                "endTimeUnixNano": _nanos(span.ended_at or span.started_at),
+                "attributes": _attrs({
+                    "genesis.agent_id": span.agent_id,
+                    "genesis.status": span.status,
+                    "genesis.queued_seconds": round(span.queued, 6),
+                }),
+            })
+
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": _attrs({"service.name": "genesis-core"})},
+                "scopeSpans": [{
+                    "scope": {"name": "genesis_core.orchestrator"},
+                    "spans": spans,
+                }],
+            }]
+        }
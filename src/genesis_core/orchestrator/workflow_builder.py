@@ -0,0 +1,342 @@
+# src/genesis_core/orchestrator/workflow_builder.py
+"""
+Constructor de workflows de generación
+
+La topología del DAG (tareas, dependencias, orden topológico y niveles)
+se compila una sola vez por (template, frozenset(components)) y se cachea.
+Por request solo se enlazan los parámetros concretos (config, rutas y
+resultados ya conocidos de tareas previas).
+
+MANDAMIENTO: el DAG se entrega a MCPturbo como WorkflowDefinition; aquí
+no se ejecuta ni se planifica nada.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+if TYPE_CHECKING:
+    from mcpturbo.workflows import WorkflowDefinition
+
+
+@dataclass(frozen=True)
+class OutputPath:
+    """Parámetro: ruta de salida del request (con sufijo opcional)"""
+    suffix: str = ""
+
+
+@dataclass(frozen=True)
+class ProjectConfigParam:
+    """Parámetro: ProjectConfig serializado del request"""
+
+
+@dataclass(frozen=True)
+class ResultRef:
+    """Parámetro: resultado de otra tarea del workflow"""
+    task_id: str
+    placeholder: str = field(init=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "placeholder", "{{%s.result}}" % self.task_id)
+
+
+@dataclass(frozen=True)
+class TaskSpec:
+    """Tarea compilada: todo excepto los parámetros del request"""
+    id: str
+    agent_id: str
+    action: str
+    params: Tuple[Tuple[str, Any], ...]
+    dependencies: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class _BindPlan:
+    """Parámetros de una tarea clasificados para enlazarlos sin inspección"""
+    spec: TaskSpec
+    base_params: Dict[str, Any]
+    output_params: Tuple[Tuple[str, str], ...]
+    config_params: Tuple[str, ...]
+    result_params: Tuple[Tuple[str, str], ...]
+
+
+def _plan(spec: TaskSpec) -> _BindPlan:
+    base, outputs, configs, results = {}, [], [], []
+    for name, binding in spec.params:
+        if isinstance(binding, OutputPath):
+            outputs.append((name, binding.suffix))
+        elif isinstance(binding, ProjectConfigParam):
+            configs.append(name)
+        elif isinstance(binding, ResultRef):
+            base[name] = binding.placeholder
+            results.append((name, binding.task_id))
+        else:
+            base[name] = binding
+    return _BindPlan(spec, base, tuple(outputs), tuple(configs), tuple(results))
+
+
+@dataclass(frozen=True)
+class CompiledWorkflow:
+    """DAG compilado, con orden topológico y estructura por niveles"""
+    template: str
+    components: FrozenSet[str]
+    tasks: Tuple[TaskSpec, ...]
+    levels: Tuple[Tuple[str, ...], ...]
+    _plans: Tuple[_BindPlan, ...] = field(init=False, repr=False, compare=False)
+    _widths: Dict[FrozenSet[str], int] = field(init=False, repr=False, compare=False)
+    _depths: Dict[FrozenSet[str], Mapping[str, int]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        object.__setattr__(self, "_plans", tuple(_plan(spec) for spec in self.tasks))
+        object.__setattr__(self, "_widths", {})
+        # En el DAG completo la profundidad es el nivel
+        object.__setattr__(self, "_depths", {
+            frozenset(self.topological_order): {
+                task_id: depth for depth, level in enumerate(self.levels) for task_id in level
+            }
+        })
+
+    def width(self, task_ids: Optional[Iterable[str]] = None) -> int:
+        """
+        Máxima anticadena del DAG (o del subconjunto task_ids): el mayor
+        número de tareas que pueden llegar a ejecutarse a la vez
+        """
+        subset = frozenset(task_ids) if task_ids is not None else frozenset(self.topological_order)
+        if subset not in self._widths:
+            self._widths[subset] = _max_antichain(self.tasks, subset)
+        return self._widths[subset]
+
+    def agent_demand(self, task_ids: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """Máximo de tareas simultáneas por agente dentro de task_ids"""
+        selected = set(task_ids) if task_ids is not None else set(self.topological_order)
+        by_agent: Dict[str, List[str]] = {}
+        for spec in self.tasks:
+            if spec.id in selected:
+                by_agent.setdefault(spec.agent_id, []).append(spec.id)
+        return {agent_id: self.width(ids) for agent_id, ids in by_agent.items()}
+
+    def depths(self, task_ids: Optional[Iterable[str]] = None) -> Mapping[str, int]:
+        """
+        Profundidad de cada tarea dentro de task_ids: 0 si no depende de
+        ninguna otra del subconjunto (puede empezar ya), si no 1 + la de su
+        dependencia más profunda. Memoizada por subconjunto; no modificar
+        """
+        subset = frozenset(task_ids) if task_ids is not None else frozenset(self.topological_order)
+        if subset not in self._depths:
+            depths: Dict[str, int] = {}
+            for spec in self.tasks:
+                if spec.id in subset:
+                    depths[spec.id] = max(
+                        (depths[dep] + 1 for dep in spec.dependencies if dep in depths),
+                        default=0,
+                    )
+            self._depths[subset] = depths
+        return self._depths[subset]
+
+    @property
+    def topological_order(self) -> Tuple[str, ...]:
+        return tuple(spec.id for spec in self.tasks)
+
+    def dependents(self, task_id: str) -> Tuple[str, ...]:
+        """Tareas que dependen directamente de task_id"""
+        return tuple(spec.id for spec in self.tasks if task_id in spec.dependencies)
+
+    def bind(
+        self,
+        config_dict: Mapping[str, Any],
+        output_path: str,
+        workflow_id: str,
+        seeded_results: Optional[Mapping[str, Any]] = None,
+        task_params: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        max_parallel_tasks: int = 3,
+        timeout: int = 1800,
+        only: Optional[Iterable[str]] = None,
+        agents: Optional[Mapping[str, str]] = None,
+    ) -> "WorkflowDefinition":
+        """
+        Enlazar parámetros del request y producir la WorkflowDefinition
+
+        Las tareas presentes en seeded_results no se ejecutan: su resultado
+        se inyecta como literal en los params de las tareas que lo usan.
+        task_params añade params extra por tarea (p. ej. regeneración
+        incremental). only limita las tareas emitidas y agents sustituye
+        el agente de algunas (duplicados de hedging).
+        """
+        # MCPturbo se importa en el primer bind, no al importar el módulo
+        from mcpturbo.workflows import WorkflowDefinition, Task
+
+        seeded = seeded_results or {}
+        selected = frozenset(only) if only is not None else None
+        tasks = []
+
+        for plan in self._plans:
+            spec = plan.spec
+            if seeded and spec.id in seeded:
+                continue
+            if selected is not None and spec.id not in selected:
+                continue
+
+            params = plan.base_params.copy()
+            for name, suffix in plan.output_params:
+                params[name] = output_path + suffix
+            for name in plan.config_params:
+                params[name] = config_dict
+
+            dependencies = list(spec.dependencies)
+            if seeded:
+                for name, task_id in plan.result_params:
+                    if task_id in seeded:
+                        params[name] = seeded[task_id]
+                dependencies = [dep for dep in dependencies if dep not in seeded]
+            if task_params and spec.id in task_params:
+                params.update(task_params[spec.id])
+
+            tasks.append(Task(
+                id=spec.id,
+                agent_id=agents.get(spec.id, spec.agent_id) if agents else spec.agent_id,
+                action=spec.action,
+                params=params,
+                dependencies=dependencies
+            ))
+
+        # MANDAMIENTO: Usar WorkflowDefinition de MCPturbo
+        return WorkflowDefinition(
+            id=workflow_id,
+            name="project_generation",
+            tasks=tasks,
+            max_parallel_tasks=max_parallel_tasks,
+            timeout=timeout
+        )
+
+
+def _max_antichain(specs: Tuple[TaskSpec, ...], subset: FrozenSet[str]) -> int:
+    """
+    Ancho del orden parcial inducido por las dependencias (Dilworth):
+    n - emparejamiento máximo en el grafo bipartito de alcanzabilidad
+    """
+    # Alcanzabilidad transitiva; specs viene en orden topológico
+    reaches: Dict[str, set] = {}
+    for spec in specs:
+        ancestors = set()
+        for dep in spec.dependencies:
+            ancestors.add(dep)
+            ancestors |= reaches[dep]
+        reaches[spec.id] = ancestors
+
+    nodes = [spec.id for spec in specs if spec.id in subset]
+    successors = {
+        node: [other for other in nodes if node in reaches[other]] for node in nodes
+    }
+    match: Dict[str, str] = {}
+
+    def _augment(node: str, seen: set) -> bool:
+        for other in successors[node]:
+            if other in seen:
+                continue
+            seen.add(other)
+            if other not in match or _augment(match[other], seen):
+                match[other] = node
+                return True
+        return False
+
+    matched = sum(1 for node in nodes if _augment(node, set()))
+    return len(nodes) - matched
+
+
+def _levels(specs: Iterable[TaskSpec]) -> Tuple[List[TaskSpec], Tuple[Tuple[str, ...], ...]]:
+    """Orden topológico (Kahn) agrupado por niveles de dependencia"""
+    pending = {spec.id: spec for spec in specs}
+    done: Dict[str, int] = {}
+    ordered: List[TaskSpec] = []
+    levels: List[Tuple[str, ...]] = []
+
+    while pending:
+        ready = [
+            spec for spec in pending.values()
+            if all(dep in done for dep in spec.dependencies)
+        ]
+        if not ready:
+            raise ValueError(f"Workflow has a dependency cycle: {sorted(pending)}")
+
+        for spec in ready:
+            done[spec.id] = len(levels)
+            del pending[spec.id]
+        ordered.extend(ready)
+        levels.append(tuple(spec.id for spec in ready))
+
+    return ordered, tuple(levels)
+
+
+@lru_cache(maxsize=128)
+def compile_workflow(template: str, components: FrozenSet[str]) -> CompiledWorkflow:
+    """Compilar (y cachear) el DAG de generación para un conjunto de componentes"""
+    architecture = ResultRef("design_architecture")
+    specs = [
+        # 1. Análisis de arquitectura
+        TaskSpec(
+            id="analyze_architecture",
+            agent_id="architect_agent",
+            action="analyze_requirements",
+            params=(("config", ProjectConfigParam()), ("output_path", OutputPath())),
+            dependencies=()
+        ),
+        # 2. Diseño de arquitectura
+        TaskSpec(
+            id="design_architecture",
+            agent_id="architect_agent",
+            action="design_architecture",
+            params=(("requirements", ResultRef("analyze_architecture")),),
+            dependencies=("analyze_architecture",)
+        ),
+    ]
+
+    # 3. Generación de backend
+    if "backend" in components:
+        specs.append(TaskSpec(
+            id="generate_backend",
+            agent_id="backend_agent",
+            action="generate_backend",
+            params=(("architecture", architecture), ("output_path", OutputPath("/backend"))),
+            dependencies=("design_architecture",)
+        ))
+
+    # 4. Generación de frontend
+    if "frontend" in components:
+        specs.append(TaskSpec(
+            id="generate_frontend",
+            agent_id="frontend_agent",
+            action="generate_frontend",
+            params=(("architecture", architecture), ("output_path", OutputPath("/frontend"))),
+            dependencies=("design_architecture",)
+        ))
+
+    # 5. Configuración DevOps
+    generators = tuple(
+        task_id for task_id in ("generate_backend", "generate_frontend")
+        if task_id.split("_", 1)[1] in components
+    )
+    specs.append(TaskSpec(
+        id="setup_devops",
+        agent_id="devops_agent",
+        action="setup_devops",
+        params=(("architecture", architecture), ("output_path", OutputPath())),
+        dependencies=("design_architecture",) + generators
+    ))
+
+    ordered, levels = _levels(specs)
+    return CompiledWorkflow(
+        template=template,
+        components=components,
+        tasks=tuple(ordered),
+        levels=levels,
+    )
+
+
+def workflow_key(project_config: Any) -> Tuple[str, FrozenSet[str]]:
+    """Clave de compilación (template, componentes) de un ProjectConfig"""
+    return (
+        project_config.template.value,
+        frozenset([component.value for component in project_config.components]),
+    )
@@ -0,0 +1,229 @@
+# src/genesis_core/state/checkpoint.py
+"""
+Checkpoints de resultados por tarea para reanudar workflows
+
+Un archivo JSONL por workflow: la primera línea es la cabecera (request
+serializado, params por tarea y archivos previos) y cada línea siguiente
+el resultado de una tarea completada junto con los archivos que generó.
+Cada escritura hace fsync antes de devolver, así que un resultado
+confirmado sobrevive a la caída del proceso; una última línea truncada
+por un crash se ignora al leer.
+
+Los checkpoints de workflows que nadie reanuda (fallidos, abandonados)
+caducan tras ttl segundos sin escrituras.
+
+Los resultados se guardan en JSON (default=str), igual que la cache de
+arquitectura.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+CHECKPOINT_VERSION = 1
+
+
+@dataclass
+class WorkflowCheckpoint:
+    """Lo necesario para relanzar un workflow sin repetir tareas hechas"""
+    workflow_id: str
+    request: Dict[str, Any]
+    task_results: Dict[str, Any] = field(default_factory=dict)
+    task_params: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    base_files: List[str] = field(default_factory=list)
+    # task_id -> archivos de las tareas completadas tras el begin
+    task_files: Dict[str, List[str]] = field(default_factory=dict)
+
+
+class CheckpointStore:
+    """
+    Directorio de checkpoints, uno por workflow en curso o interrumpido
+
+    - fsync: sincronizar cada escritura (desactivar solo en pruebas)
+    - ttl: segundos sin escrituras tras los que un checkpoint caduca
+      (None: nunca). La limpieza se hace con expire() y, como mucho una
+      vez por ttl, al abrir un checkpoint nuevo
+    """
+
+    def __init__(self, directory: str, fsync: bool = True, ttl: Optional[float] = None):
+        self.directory = directory
+        self.fsync = fsync
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._last_expiry: Optional[float] = None
+        self._stats = {"begun": 0, "tasks_recorded": 0, "discarded": 0, "expired": 0}
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, workflow_id: str) -> str:
+        return os.path.join(self.directory, f"{workflow_id}.jsonl")
+
+    # API asíncrona: el I/O va fuera del event loop
+
+    async def begin(
+        self,
+        workflow_id: str,
+        request: Dict[str, Any],
+        task_results: Optional[Dict[str, Any]] = None,
+        task_params: Optional[Dict[str, Dict[str, Any]]] = None,
+        base_files: Iterable[str] = (),
+    ):
+        """Crear (o reescribir) el checkpoint con los resultados ya conocidos"""
+        checkpoint = WorkflowCheckpoint(
+            workflow_id=workflow_id,
+            request=request,
+            task_results=dict(task_results or {}),
+            task_params=dict(task_params or {}),
+            base_files=list(base_files),
+        )
+        await asyncio.to_thread(self._begin, checkpoint)
+        self._stats["begun"] += 1
+        if self.ttl is not None and (
+            self._last_expiry is None or time.monotonic() - self._last_expiry >= self.ttl
+        ):
+            await self.expire()
+
+    async def record(
+        self, workflow_id: str, task_id: str, result: Any, generated_files: Iterable[str] = ()
+    ) -> bool:
+        """Añadir el resultado de una tarea; False si no hay checkpoint abierto"""
+        recorded = await asyncio.to_thread(
+            self._append, workflow_id, task_id, result, list(generated_files)
+        )
+        if recorded:
+            self._stats["tasks_recorded"] += 1
+        return recorded
+
+    async def load(self, workflow_id: str) -> Optional[WorkflowCheckpoint]:
+        return await asyncio.to_thread(self._load, workflow_id)
+
+    async def discard(self, workflow_id: str):
+        """Borrar el checkpoint de un workflow terminado"""
+        removed = await asyncio.to_thread(self._remove, workflow_id)
+        if removed:
+            self._stats["discarded"] += 1
+
+    async def expire(self) -> int:
+        """Borrar los checkpoints sin escrituras desde hace más de ttl"""
+        if self.ttl is None:
+            return 0
+        self._last_expiry = time.monotonic()
+        expired = await asyncio.to_thread(self._expire, time.time() - self.ttl)
+        self._stats["expired"] += expired
+        return expired
+
+    def workflow_ids(self) -> List[str]:
+        """Workflows con checkpoint (interrumpidos o en curso)"""
+        return sorted(
+            name[: -len(".jsonl")]
+            for name in os.listdir(self.directory)
+            if name.endswith(".jsonl")
+        )
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats)
+
+    # Disco
+
+    def _sync(self, fh):
+        fh.flush()
+        if self.fsync:
+            os.fsync(fh.fileno())
+
+    def _begin(self, checkpoint: WorkflowCheckpoint):
+        header = {
+            "version": CHECKPOINT_VERSION,
+            "workflow_id": checkpoint.workflow_id,
+            "request": checkpoint.request,
+            "task_params": checkpoint.task_params,
+            "base_files": checkpoint.base_files,
+        }
+        lines = [json.dumps(header, default=str)]
+        lines.extend(
+            json.dumps({"task_id": task_id, "result": result}, default=str)
+            for task_id, result in checkpoint.task_results.items()
+        )
+
+        # Escritura atómica: archivo temporal + rename
+        with self._lock:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write("\n".join(lines) + "\n")
+                self._sync(fh)
+            os.replace(tmp_path, self._path(checkpoint.workflow_id))
+
+    def _append(self, workflow_id: str, task_id: str, result: Any, files: List[str]) -> bool:
+        line = json.dumps({"task_id": task_id, "result": result, "files": files}, default=str)
+        path = self._path(workflow_id)
+        with self._lock:
+            # Sin cabecera (workflow ya terminado) no se crea nada
+            if not os.path.exists(path):
+                return False
+            with open(path, "a", encoding="utf-8") as fh:
+                fh.write(line + "\n")
+                self._sync(fh)
+        return True
+
+    def _load(self, workflow_id: str) -> Optional[WorkflowCheckpoint]:
+        try:
+            with open(self._path(workflow_id), "r", encoding="utf-8") as fh:
+                lines = fh.read().splitlines()
+        except FileNotFoundError:
+            return None
+
+        try:
+            header = json.loads(lines[0])
+        except (IndexError, ValueError):
+            return None
+        if header.get("version") != CHECKPOINT_VERSION:
+            return None
+
+        task_results = {}
+        task_files = {}
+        base_files = list(header.get("base_files") or [])
+        for line in lines[1:]:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Última línea a medio escribir cuando cayó el proceso
+                break
+            task_results[record["task_id"]] = record["result"]
+            if "files" in record:
+                task_files[record["task_id"]] = record["files"]
+                base_files.extend(record["files"])
+
+        return WorkflowCheckpoint(
+            workflow_id=workflow_id,
+            request=header["request"],
+            task_results=task_results,
+            task_params=header.get("task_params") or {},
+            base_files=list(dict.fromkeys(base_files)),
+            task_files=task_files,
+        )
+
+    def _remove(self, workflow_id: str) -> bool:
+        with self._lock:
+            try:
+                os.remove(self._path(workflow_id))
+            except FileNotFoundError:
+                return False
+        return True
+
+    def _expire(self, cutoff: float) -> int:
+        expired = 0
+        with self._lock:
+            for name in os.listdir(self.directory):
+                if not name.endswith(".jsonl"):
+                    continue
+                path = os.path.join(self.directory, name)
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        os.remove(path)
+                        expired += 1
+                except FileNotFoundError:
+                    pass
+        return expired
@@ -0,0 +1,254 @@
+# src/genesis_core/state/distributed.py
+"""
+Modo distribuido: leases de workflows y estado compartido en Redis
+
+Cada nodo orquestador tiene un heartbeat (genesis:node:<id>) y posee sus
+workflows mediante un lease con TTL (genesis:lease:<workflow_id>) que
+renueva periódicamente. Los workflows activos se indexan en sets
+repartidos en shards (genesis:active:<n>) junto con el request necesario
+para relanzarlos.
+
+Cuando un lease caduca (el nodo murió), el workflow queda huérfano: lo
+reclama el nodo vivo preferido por rendezvous hashing, de modo que los
+huérfanos se reparten entre los nodos en lugar de competir todos por
+ellos. El SET NX del lease garantiza un único dueño en cualquier caso.
+
+El estado (formato de get_workflow_status) se publica en
+genesis:status:<workflow_id> para consultarlo desde cualquier nodo.
+Requiere un cliente redis.asyncio con decode_responses=True (o
+InMemoryRedis para pruebas locales).
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import zlib
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Renovar/liberar solo si el lease sigue siendo nuestro
+RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# Workflow terminado: sacarlo del índice y borrar su request en la misma
+# operación que suelta el lease (si no, otro nodo lo vería huérfano)
+FINISH_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    redis.call('srem', KEYS[2], ARGV[2])
+    redis.call('del', KEYS[3])
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def connect(url: str) -> Any:
+    """Cliente redis.asyncio para el modo distribuido"""
+    import redis.asyncio as redis_asyncio
+
+    return redis_asyncio.from_url(url, decode_responses=True)
+
+
+def _rendezvous(workflow_id: str, node_id: str) -> int:
+    digest = hashlib.blake2b(f"{node_id}/{workflow_id}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class DistributedCoordinator:
+    """
+    Leases, índice de workflows activos y estado compartido de un nodo
+
+    - lease_ttl: segundos sin renovar tras los que un workflow es huérfano
+    - shards: número de sets en que se reparte el índice de activos
+    - on_lease_lost: callback si otro nodo se queda con un lease nuestro
+    """
+
+    def __init__(
+        self,
+        redis: Any,
+        node_id: str,
+        lease_ttl: float = 15.0,
+        shards: int = 16,
+        status_ttl: float = 3600.0,
+        prefix: str = "genesis",
+        on_lease_lost: Optional[Callable[[str], Awaitable[None]]] = None,
+    ):
+        self.redis = redis
+        self.node_id = node_id
+        self.lease_ttl = lease_ttl
+        self.shards = shards
+        self.status_ttl = status_ttl
+        self.prefix = prefix
+        self.on_lease_lost = on_lease_lost
+
+        self.owned: Set[str] = set()
+        self._renew = redis.register_script(RENEW_SCRIPT)
+        self._release = redis.register_script(RELEASE_SCRIPT)
+        self._finish = redis.register_script(FINISH_SCRIPT)
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._stats = {"acquired": 0, "lost": 0, "taken_over": 0, "renewals": 0}
+
+    # Claves
+
+    def _key(self, *parts: str) -> str:
+        return ":".join((self.prefix,) + parts)
+
+    def shard_of(self, workflow_id: str) -> int:
+        return zlib.crc32(workflow_id.encode()) % self.shards
+
+    def _active_key(self, workflow_id: str) -> str:
+        return self._key("active", str(self.shard_of(workflow_id)))
+
+    @property
+    def _ttl_ms(self) -> int:
+        return int(self.lease_ttl * 1000)
+
+    # Ciclo de vida
+
+    async def start(self):
+        if self._heartbeat_task is not None:
+            return
+        await self.heartbeat()
+        self._heartbeat_task = asyncio.ensure_future(self._heartbeat_loop())
+
+    async def stop(self):
+        """Liberar leases propios y dar de baja el nodo"""
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            await asyncio.gather(self._heartbeat_task, return_exceptions=True)
+            self._heartbeat_task = None
+        for workflow_id in list(self.owned):
+            await self.release(workflow_id, finished=False)
+        await self.redis.delete(self._key("node", self.node_id))
+
+    async def _heartbeat_loop(self):
+        # Renovar con margen: tres renovaciones por TTL
+        while True:
+            await asyncio.sleep(self.lease_ttl / 3)
+            try:
+                await self.heartbeat()
+            except Exception as e:
+                logger.warning("Lease renewal failed on %s: %s", self.node_id, e)
+
+    async def heartbeat(self):
+        """Renovar heartbeat del nodo y leases propios"""
+        await self.redis.set(self._key("node", self.node_id), "1", px=self._ttl_ms)
+        for workflow_id in list(self.owned):
+            renewed = await self._renew(
+                keys=[self._key("lease", workflow_id)], args=[self.node_id, self._ttl_ms]
+            )
+            if renewed:
+                self._stats["renewals"] += 1
+                continue
+            # Otro nodo lo reclamó (p. ej. tras una pausa larga de este)
+            self.owned.discard(workflow_id)
+            self._stats["lost"] += 1
+            if self.on_lease_lost is not None:
+                await self.on_lease_lost(workflow_id)
+
+    # Leases
+
+    async def acquire(self, workflow_id: str, payload: Optional[Dict[str, Any]] = None) -> bool:
+        """Tomar el lease de workflow_id (idempotente para el mismo nodo)"""
+        key = self._key("lease", workflow_id)
+        acquired = await self.redis.set(key, self.node_id, nx=True, px=self._ttl_ms)
+        if not acquired and await self.redis.get(key) != self.node_id:
+            return False
+
+        if acquired:
+            self._stats["acquired"] += 1
+        self.owned.add(workflow_id)
+        if payload is not None:
+            await self.redis.set(self._key("request", workflow_id), json.dumps(payload, default=str))
+        await self.redis.sadd(self._active_key(workflow_id), workflow_id)
+        return True
+
+    async def release(self, workflow_id: str, finished: bool = True):
+        """
+        Soltar el lease; con finished el workflow sale del índice de activos
+        (sin finished queda huérfano y otro nodo puede relanzarlo)
+        """
+        if workflow_id not in self.owned:
+            return
+        self.owned.discard(workflow_id)
+        lease = self._key("lease", workflow_id)
+        if finished:
+            await self._finish(
+                keys=[lease, self._active_key(workflow_id), self._key("request", workflow_id)],
+                args=[self.node_id, workflow_id],
+            )
+        else:
+            await self._release(keys=[lease], args=[self.node_id])
+
+    async def owner(self, workflow_id: str) -> Optional[str]:
+        return await self.redis.get(self._key("lease", workflow_id))
+
+    # Estado compartido
+
+    async def publish_status(self, workflow_id: str, status: Dict[str, Any]):
+        await self.redis.set(
+            self._key("status", workflow_id),
+            json.dumps({**status, "node_id": self.node_id}, default=str),
+            px=int(self.status_ttl * 1000),
+        )
+
+    async def fetch_status(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        raw = await self.redis.get(self._key("status", workflow_id))
+        return json.loads(raw) if raw else None
+
+    # Nodos y huérfanos
+
+    async def live_nodes(self) -> List[str]:
+        prefix = self._key("node", "")
+        nodes = [key[len(prefix):] async for key in self.redis.scan_iter(match=prefix + "*")]
+        return sorted(nodes)
+
+    async def orphaned(self) -> List[str]:
+        """Workflows activos sin lease vigente"""
+        orphans = []
+        for shard in range(self.shards):
+            for workflow_id in await self.redis.smembers(self._key("active", str(shard))):
+                if not await self.redis.exists(self._key("lease", workflow_id)):
+                    orphans.append(workflow_id)
+        return orphans
+
+    async def claim_orphans(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Reclamar los huérfanos que este nodo prefiere por rendezvous
+
+        Devuelve (workflow_id, request) de los workflows reclamados.
+        """
+        nodes = await self.live_nodes()
+        if self.node_id not in nodes:
+            nodes.append(self.node_id)
+
+        claimed = []
+        for workflow_id in await self.orphaned():
+            preferred = max(nodes, key=lambda node: _rendezvous(workflow_id, node))
+            if preferred != self.node_id:
+                continue
+            raw = await self.redis.get(self._key("request", workflow_id))
+            if raw is None:
+                # Sin request no se puede relanzar: sacarlo del índice
+                await self.redis.srem(self._active_key(workflow_id), workflow_id)
+                continue
+            if await self.acquire(workflow_id):
+                self._stats["taken_over"] += 1
+                claimed.append((workflow_id, json.loads(raw)))
+        return claimed
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._stats, "owned": len(self.owned)}
@@ -0,0 +1,153 @@
+# src/genesis_core/state/memory_redis.py
+"""
+Sustituto en proceso de redis.asyncio para el modo distribuido
+
+Implementa solo los comandos que usa DistributedCoordinator, con la
+semántica de un cliente con decode_responses=True. Los scripts Lua se
+emulan con su equivalente en Python. Varias instancias de
+DistributedCoordinator pueden compartir un InMemoryRedis para simular
+varios nodos en un mismo proceso.
+"""
+
+import fnmatch
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set
+
+from genesis_core.state.distributed import FINISH_SCRIPT, RELEASE_SCRIPT, RENEW_SCRIPT
+
+
+class _Script:
+    def __init__(self, redis: "InMemoryRedis", handler: Callable[[List[str], List[Any]], int]):
+        self._redis = redis
+        self._handler = handler
+
+    async def __call__(self, keys: List[str], args: List[Any]) -> int:
+        return self._handler(keys, args)
+
+
+class InMemoryRedis:
+    """Strings con expiración y sets, en un dict"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._data: Dict[str, Any] = {}
+        self._expires: Dict[str, float] = {}
+
+    # Internos
+
+    def _alive(self, key: str) -> bool:
+        deadline = self._expires.get(key)
+        if deadline is not None and self.clock() >= deadline:
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+        return key in self._data
+
+    def _get(self, key: str) -> Optional[Any]:
+        return self._data.get(key) if self._alive(key) else None
+
+    def _expire_in(self, key: str, px: Optional[int]):
+        if px is None:
+            self._expires.pop(key, None)
+        else:
+            self._expires[key] = self.clock() + px / 1000
+
+    # Strings
+
+    async def set(
+        self, key: str, value: Any, nx: bool = False, px: Optional[int] = None,
+        ex: Optional[float] = None,
+    ) -> Optional[bool]:
+        if nx and self._alive(key):
+            return None
+        self._data[key] = str(value)
+        self._expire_in(key, px if px is not None else (int(ex * 1000) if ex else None))
+        return True
+
+    async def get(self, key: str) -> Optional[str]:
+        value = self._get(key)
+        return value if isinstance(value, str) else None
+
+    async def delete(self, *keys: str) -> int:
+        deleted = 0
+        for key in keys:
+            if self._alive(key):
+                deleted += 1
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+        return deleted
+
+    async def exists(self, *keys: str) -> int:
+        return sum(1 for key in keys if self._alive(key))
+
+    async def pexpire(self, key: str, px: int) -> bool:
+        if not self._alive(key):
+            return False
+        self._expire_in(key, px)
+        return True
+
+    # Sets
+
+    async def sadd(self, key: str, *members: str) -> int:
+        current: Set[str] = self._get(key) or set()
+        added = len(set(members) - current)
+        self._data[key] = current | set(members)
+        return added
+
+    async def srem(self, key: str, *members: str) -> int:
+        current: Set[str] = self._get(key) or set()
+        removed = len(current & set(members))
+        current = current - set(members)
+        if current:
+            self._data[key] = current
+        else:
+            self._data.pop(key, None)
+        return removed
+
+    async def smembers(self, key: str) -> Set[str]:
+        return set(self._get(key) or ())
+
+    # Recorrido
+
+    async def scan_iter(self, match: str = "*") -> AsyncIterator[str]:
+        for key in list(self._data):
+            if self._alive(key) and fnmatch.fnmatchcase(key, match):
+                yield key
+
+    # Scripts
+
+    def register_script(self, script: str) -> _Script:
+        handlers = {
+            RENEW_SCRIPT: self._renew_lease,
+            RELEASE_SCRIPT: self._release_lease,
+            FINISH_SCRIPT: self._finish_lease,
+        }
+        if script not in handlers:
+            raise NotImplementedError("InMemoryRedis cannot emulate this script")
+        return _Script(self, handlers[script])
+
+    def _renew_lease(self, keys: List[str], args: List[Any]) -> int:
+        if self._get(keys[0]) != str(args[0]):
+            return 0
+        self._expire_in(keys[0], int(args[1]))
+        return 1
+
+    def _release_lease(self, keys: List[str], args: List[Any]) -> int:
+        if self._get(keys[0]) != str(args[0]):
+            return 0
+        self._data.pop(keys[0], None)
+        self._expires.pop(keys[0], None)
+        return 1
+
+    def _finish_lease(self, keys: List[str], args: List[Any]) -> int:
+        if self._get(keys[0]) != str(args[0]):
+            return 0
+        members: Set[str] = self._get(keys[1]) or set()
+        members.discard(str(args[1]))
+        if not members:
+            self._data.pop(keys[1], None)
+        self._data.pop(keys[2], None)
+        self._expires.pop(keys[2], None)
+        return self._release_lease(keys[:1], args[:1])
+
+    async def aclose(self):
+        pass
@@ -0,0 +1,312 @@
+# src/genesis_core/state/persistence.py
+"""
+Persistencia write-behind del estado del orquestador
+
+ProjectState, WorkflowState y las transiciones de tareas se acumulan en
+memoria y se vuelcan en transacciones por lotes cuando el lote alcanza
+batch_size o pasa flush_interval. Las actualizaciones del mismo workflow
+se fusionan (gana la última); las transiciones de tareas son historial y
+se conservan todas.
+
+El camino del request solo toca dicts en memoria: las escrituras van en
+un hilo aparte (asyncio.to_thread) y nunca se esperan desde ahí.
+
+Si la base de datos no responde, lo pendiente se reencola hasta
+max_pending filas; por encima se descartan las transiciones más antiguas
+(el estado actual de proyectos y workflows se conserva) y se cuentan en
+dropped_rows.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    create_engine,
+    delete,
+    insert,
+    select,
+)
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+metadata = MetaData()
+
+projects = Table(
+    "genesis_projects",
+    metadata,
+    Column("workflow_id", String(64), primary_key=True),
+    Column("name", String(50), nullable=False),
+    Column("template", String(64)),
+    Column("output_path", Text),
+    Column("created_at", DateTime),
+    Column("config", JSON),
+)
+
+workflows = Table(
+    "genesis_workflows",
+    metadata,
+    Column("workflow_id", String(64), primary_key=True),
+    Column("status", String(32), nullable=False),
+    Column("started_at", DateTime),
+    Column("completed_at", DateTime),
+    Column("error", Text),
+)
+
+task_transitions = Table(
+    "genesis_task_transitions",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("workflow_id", String(64), nullable=False, index=True),
+    Column("task_id", String(128), nullable=False),
+    Column("status", String(32), nullable=False),
+    Column("at", DateTime, nullable=False),
+)
+
+
+def project_row(workflow_id: str, project_state: Any) -> Dict[str, Any]:
+    """Fila de genesis_projects a partir de un ProjectState"""
+    config = project_state.config
+    return {
+        "workflow_id": workflow_id,
+        "name": project_state.name,
+        "template": str(getattr(project_state.template, "value", project_state.template)),
+        "output_path": project_state.output_path,
+        "created_at": project_state.created_at,
+        "config": config.to_dict() if hasattr(config, "to_dict") else config,
+    }
+
+
+def workflow_row(workflow_id: str, workflow_state: Any) -> Dict[str, Any]:
+    """Fila de genesis_workflows a partir de un WorkflowState"""
+    return {
+        "workflow_id": workflow_id,
+        "status": workflow_state.status,
+        "started_at": workflow_state.started_at,
+        "completed_at": workflow_state.completed_at,
+        "error": workflow_state.error,
+    }
+
+
+def _upsert(conn: Connection, table: Table, rows: List[Dict[str, Any]]):
+    if not rows:
+        return
+    key = table.c.workflow_id
+    dialect = conn.dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        statement = dialect_insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=[key],
+            set_={
+                column.name: statement.excluded[column.name]
+                for column in table.columns if column is not key
+            },
+        )
+        conn.execute(statement, rows)
+    else:
+        conn.execute(delete(table).where(key.in_([row["workflow_id"] for row in rows])))
+        conn.execute(insert(table), rows)
+
+
+class StatePersistence:
+    """
+    Escritura por lotes del estado de proyectos, workflows y tareas
+
+    - batch_size: filas pendientes que disparan un volcado inmediato
+    - flush_interval: segundos máximos que una actualización espera
+    - max_pending: filas retenidas mientras los volcados fallan
+    """
+
+    def __init__(
+        self,
+        url: str = "sqlite:///genesis_state.db",
+        batch_size: int = 500,
+        flush_interval: float = 0.5,
+        engine: Optional[Engine] = None,
+        max_pending: int = 100_000,
+    ):
+        self.url = url
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.engine = engine or create_engine(url)
+
+        self._projects: Dict[str, Dict[str, Any]] = {}
+        self._workflows: Dict[str, Dict[str, Any]] = {}
+        self._transitions: List[Dict[str, Any]] = []
+
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._stats = {
+            "flushes": 0,
+            "rows_written": 0,
+            "coalesced": 0,
+            "failed_flushes": 0,
+            "max_batch": 0,
+            "dropped_rows": 0,
+        }
+
+    async def start(self):
+        """Crear tablas y arrancar el volcado periódico"""
+        if self._flusher is not None:
+            return
+        await asyncio.to_thread(metadata.create_all, self.engine)
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flusher = asyncio.ensure_future(self._flush_loop())
+
+    async def stop(self):
+        """Volcar lo pendiente y detener"""
+        if self._flusher is None:
+            return
+        self._flusher.cancel()
+        await asyncio.gather(self._flusher, return_exceptions=True)
+        self._flusher = None
+        await self.flush()
+        await asyncio.to_thread(self.engine.dispose)
+
+    # Registro (camino del request: sin I/O)
+
+    def record_project(self, workflow_id: str, project_state: Any):
+        self._put(self._projects, workflow_id, project_row(workflow_id, project_state))
+
+    def record_workflow(self, workflow_id: str, workflow_state: Any):
+        self._put(self._workflows, workflow_id, workflow_row(workflow_id, workflow_state))
+
+    def record_task(
+        self, workflow_id: str, task_id: str, status: str, at: Optional[datetime] = None
+    ):
+        self._transitions.append({
+            "workflow_id": workflow_id,
+            "task_id": task_id,
+            "status": status,
+            "at": at or datetime.utcnow(),
+        })
+        self._maybe_wake()
+
+    def _put(self, pending: Dict[str, Dict[str, Any]], workflow_id: str, row: Dict[str, Any]):
+        if workflow_id in pending:
+            self._stats["coalesced"] += 1
+        pending[workflow_id] = row
+        self._maybe_wake()
+
+    @property
+    def pending(self) -> int:
+        return len(self._projects) + len(self._workflows) + len(self._transitions)
+
+    def _maybe_wake(self):
+        if self._wakeup is not None and self.pending >= self.batch_size:
+            self._wakeup.set()
+
+    # Volcado
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Escribir todo lo pendiente en una transacción; devuelve filas escritas"""
+        if not self.pending:
+            return 0
+
+        lock = self._flush_lock or asyncio.Lock()
+        async with lock:
+            batch = (self._projects, self._workflows, self._transitions)
+            self._projects, self._workflows, self._transitions = {}, {}, []
+            rows = sum(len(part) for part in batch)
+            try:
+                await asyncio.to_thread(self._write_batch, *batch)
+            except Exception as e:
+                logger.warning("State flush of %d rows failed: %s", rows, e)
+                self._stats["failed_flushes"] += 1
+                self._requeue(*batch)
+                return 0
+
+        self._stats["flushes"] += 1
+        self._stats["rows_written"] += rows
+        self._stats["max_batch"] = max(self._stats["max_batch"], rows)
+        return rows
+
+    def _write_batch(
+        self,
+        project_rows: Dict[str, Dict[str, Any]],
+        workflow_rows: Dict[str, Dict[str, Any]],
+        transitions: List[Dict[str, Any]],
+    ):
+        with self.engine.begin() as conn:
+            _upsert(conn, projects, list(project_rows.values()))
+            _upsert(conn, workflows, list(workflow_rows.values()))
+            if transitions:
+                conn.execute(insert(task_transitions), transitions)
+
+    def _requeue(
+        self,
+        project_rows: Dict[str, Dict[str, Any]],
+        workflow_rows: Dict[str, Dict[str, Any]],
+        transitions: List[Dict[str, Any]],
+    ):
+        # Lo registrado durante el intento fallido es más reciente
+        self._projects = {**project_rows, **self._projects}
+        self._workflows = {**workflow_rows, **self._workflows}
+        self._transitions = transitions + self._transitions
+
+        excess = min(self.pending - self.max_pending, len(self._transitions))
+        if excess > 0:
+            del self._transitions[:excess]
+            self._stats["dropped_rows"] += excess
+            logger.warning(
+                "State persistence is behind: dropped %d oldest task transitions", excess
+            )
+
+    # Lectura
+
+    async def load_workflow(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        """Estado persistido de un workflow (proyecto, estado y transiciones)"""
+        return await asyncio.to_thread(self._load_workflow, workflow_id)
+
+    def _load_workflow(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        with self.engine.connect() as conn:
+            workflow = conn.execute(
+                select(workflows).where(workflows.c.workflow_id == workflow_id)
+            ).mappings().first()
+            project = conn.execute(
+                select(projects).where(projects.c.workflow_id == workflow_id)
+            ).mappings().first()
+            if workflow is None and project is None:
+                return None
+            transitions = conn.execute(
+                select(task_transitions)
+                .where(task_transitions.c.workflow_id == workflow_id)
+                .order_by(task_transitions.c.id)
+            ).mappings().all()
+        return {
+            "workflow": dict(workflow) if workflow else None,
+            "project": dict(project) if project else None,
+            "task_transitions": [
+                {"task_id": row["task_id"], "status": row["status"], "at": row["at"]}
+                for row in transitions
+            ],
+        }
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._stats, "pending": self.pending}
@@ -0,0 +1,132 @@
+# tests/unit/test_admission.py
+import asyncio
+import pytest
+
+from genesis_core.exceptions import AdmissionRejectedError, OrchestratorDrainingError
+from genesis_core.orchestrator.admission import AdmissionController, Priority
+
+
+class TestAdmissionController:
+    """Test suite for the priority admission queue"""
+
+    @pytest.mark.asyncio
+    async def test_admits_immediately_under_limit(self):
+        """Test requests are admitted without waiting when slots are free"""
+        controller = AdmissionController(max_in_flight=2)
+
+        assert await controller.acquire() == 0.0
+        assert controller.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self):
+        """Test fast rejection reports queue depth"""
+        controller = AdmissionController(max_in_flight=1, max_queue_depth=1)
+        await controller.acquire()
+        waiter = asyncio.ensure_future(controller.acquire())
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejectedError) as exc_info:
+            await controller.acquire()
+
+        assert exc_info.value.queue_depth == 1
+        assert controller.stats()["rejected"] == 1
+        waiter.cancel()
+
+    @pytest.mark.asyncio
+    async def test_interactive_served_before_bulk(self):
+        """Test higher priority waiters are dispatched first"""
+        controller = AdmissionController(max_in_flight=1)
+        await controller.acquire()
+        order = []
+
+        async def request(name, priority):
+            await controller.acquire(priority)
+            order.append(name)
+
+        bulk = asyncio.ensure_future(request("bulk", Priority.BULK))
+        await asyncio.sleep(0)
+        interactive = asyncio.ensure_future(request("interactive", Priority.INTERACTIVE))
+        await asyncio.sleep(0)
+
+        controller.release()
+        await asyncio.sleep(0)
+        controller.release()
+        await asyncio.gather(bulk, interactive)
+
+        assert order == ["interactive", "bulk"]
+
+    @pytest.mark.asyncio
+    async def test_aging_prevents_bulk_starvation(self):
+        """Test a long-waiting bulk request overtakes fresh interactive ones"""
+        controller = AdmissionController(max_in_flight=1, aging_interval=0.01)
+        await controller.acquire()
+        order = []
+
+        async def request(name, priority):
+            await controller.acquire(priority)
+            order.append(name)
+
+        bulk = asyncio.ensure_future(request("bulk", Priority.BULK))
+        await asyncio.sleep(0.05)
+        interactive = asyncio.ensure_future(request("interactive", Priority.INTERACTIVE))
+        await asyncio.sleep(0)
+
+        controller.release()
+        await asyncio.sleep(0)
+        controller.release()
+        await asyncio.gather(bulk, interactive)
+
+        assert order == ["bulk", "interactive"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        """Test cancelling a queued request frees its queue position"""
+        controller = AdmissionController(max_in_flight=1)
+        await controller.acquire()
+        waiter = asyncio.ensure_future(controller.acquire())
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert controller.queue_depth == 0
+        controller.release()
+        assert controller.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_close_rejects_queued_and_new_requests(self):
+        """Test closing admission fails waiters without leaking slots"""
+        controller = AdmissionController(max_in_flight=1)
+        await controller.acquire()
+        waiter = asyncio.ensure_future(controller.acquire())
+        await asyncio.sleep(0)
+
+        assert controller.close() == 1
+        with pytest.raises(OrchestratorDrainingError):
+            await waiter
+        with pytest.raises(OrchestratorDrainingError):
+            await controller.acquire()
+
+        controller.release()
+        assert controller.in_flight == 0
+        assert controller.queue_depth == 0
+        controller.reopen()
+        assert await controller.acquire() == 0.0
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_rejects_when_saturated(self, orchestrator, sample_generation_request):
+        """Test execute_project_generation fails fast with a queue signal"""
+        orchestrator.agent_registry.list_agents.return_value = [
+            "architect_agent", "backend_agent", "frontend_agent", "devops_agent"
+        ]
+        orchestrator.admission.max_in_flight = 0
+        orchestrator.admission.max_queue_depth = 0
+
+        result = await orchestrator.execute_project_generation(sample_generation_request)
+
+        assert not result.success
+        assert "Admission queue full" in result.error
+        assert result.metadata["queue_depth"] == 0
+        orchestrator.mcp_orchestrator.execute_workflow.assert_not_called()
+        assert orchestrator.get_metrics()["admission_rejected"] == 1
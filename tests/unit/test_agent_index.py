@@ -0,0 +1,67 @@
+# tests/unit/test_agent_index.py
+import pytest
+
+from genesis_core.orchestrator.agent_index import AgentAvailabilityIndex
+
+
+class TestAgentAvailabilityIndex:
+    """Test suite for the local agent availability index"""
+
+    def test_reconcile_reports_drift(self):
+        """Test reconciliation counts entries that changed"""
+        index = AgentAvailabilityIndex()
+        index.reconcile(["architect_agent", "backend_agent"])
+
+        drift = index.reconcile(["architect_agent", "devops_agent"])
+
+        assert drift == 2
+        assert "devops_agent" in index
+        assert "backend_agent" not in index
+
+    def test_events_update_membership(self):
+        """Test register/deregister events keep the index current"""
+        index = AgentAvailabilityIndex()
+        index.add("backend_agent")
+        index.add("frontend_agent")
+        index.discard("backend_agent")
+
+        assert index.missing(["backend_agent", "frontend_agent"]) == ["backend_agent"]
+        assert index.stats()["registrations"] == 2
+        assert index.stats()["deregistrations"] == 1
+
+    def test_instances_are_grouped_by_type(self):
+        """Test replicas are tracked per agent type through events and reconciliation"""
+        index = AgentAvailabilityIndex()
+        index.reconcile(["backend_agent:1", "backend_agent:2", "devops_agent"])
+        index.add("frontend_agent")
+        index.discard("backend_agent:1")
+        index.discard("devops_agent")
+
+        assert set(index.instances("backend_agent")) == {"backend_agent:2"}
+        assert index.has_type("frontend_agent")
+        assert not index.has_type("devops_agent")
+        assert not index.instances("devops_agent")
+        assert index.stats()["types"] == 2
+
+    @pytest.mark.asyncio
+    async def test_validation_uses_index_without_registry_calls(self, orchestrator, sample_generation_request):
+        """Test warmed index answers validation with no registry round-trip"""
+        orchestrator.agent_index.reconcile(["architect_agent", "backend_agent", "devops_agent"])
+        orchestrator.agent_registry.list_agents.reset_mock()
+
+        with pytest.raises(Exception, match="frontend_agent"):
+            await orchestrator._validate_generation_request(sample_generation_request)
+
+        await orchestrator._handle_agent_registered({"agent_id": "frontend_agent"})
+        await orchestrator._validate_generation_request(sample_generation_request)
+
+        orchestrator.agent_registry.list_agents.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_deregistration_event_removes_agent(self, orchestrator):
+        """Test agent.deregistered removes the agent from the index"""
+        orchestrator.agent_index.reconcile(["architect_agent", "backend_agent"])
+
+        await orchestrator._handle_agent_deregistered({"agent_id": "backend_agent"})
+
+        assert orchestrator.get_available_agents() == ["architect_agent"]
@@ -0,0 +1,135 @@
+# tests/unit/test_agent_pool.py
+import asyncio
+import pytest
+from dataclasses import replace
+from unittest.mock import AsyncMock
+
+from genesis_core.orchestrator.agent_index import AgentAvailabilityIndex
+from genesis_core.orchestrator.agent_pool import AgentPool
+
+
+def _pool(agents, **options):
+    index = AgentAvailabilityIndex()
+    index.reconcile(agents)
+    return AgentPool(index, **options)
+
+
+class TestAgentPool:
+    """Test suite for routing tasks across agent instances"""
+
+    def test_least_loaded_spreads_in_flight_tasks(self):
+        """Test reservations steer new tasks to idle instances"""
+        pool = _pool(["backend_agent", "backend_agent:2", "frontend_agent"])
+
+        first = pool.route("wf-1", {"generate_backend": "backend_agent"})
+        second = pool.route("wf-2", {"generate_backend": "backend_agent"})
+
+        assert {first["generate_backend"], second["generate_backend"]} == {
+            "backend_agent", "backend_agent:2"
+        }
+        pool.complete("wf-1", "generate_backend", latency=0.1)
+        pool.release("wf-2")
+        assert pool.stats()["in_flight"] == 0
+
+    def test_latency_ewma_penalises_slow_instances(self):
+        """Test a slow instance only gets work once the fast one is loaded"""
+        pool = _pool(["backend_agent", "backend_agent:2"], alpha=0.5)
+        for latency, instance in ((1.0, "backend_agent"), (0.1, "backend_agent:2")):
+            pool.reserve("history", instance, instance)
+            pool.complete("history", instance, latency)
+
+        routes = [pool.route(f"wf-{i}", {"task": "backend_agent"})["task"] for i in range(4)]
+
+        assert routes[:3] == ["backend_agent:2"] * 3
+        assert pool.ranked("backend_agent")[0] == "backend_agent:2"
+        assert pool.load("backend_agent").ewma == 1.0
+
+    def test_power_of_two_choices_never_picks_the_worst(self):
+        """Test p2c compares two random instances and keeps the better one"""
+        agents = [f"backend_agent:{n}" for n in range(1, 5)]
+        pool = _pool(agents, strategy="p2c", seed=7)
+        for index in range(10):
+            pool.reserve("busy", f"task-{index}", "backend_agent:4")
+
+        chosen = {pool.choose("backend_agent") for _ in range(50)}
+
+        assert "backend_agent:4" not in chosen
+        assert len(chosen) > 1
+
+    def test_tasks_waiting_on_dependencies_weigh_less_until_started(self):
+        """Test far-off tasks barely load an instance and count fully once started"""
+        pool = _pool(["devops_agent:1", "devops_agent:2"])
+
+        pool.route("wf-1", {"setup_devops": "devops_agent"}, readiness={"setup_devops": 0.25})
+        assert pool.load("devops_agent:1").queued == 0.25
+        assert pool.load("devops_agent:1").in_flight == 0
+        assert pool.route("wf-2", {"setup_devops": "devops_agent"})["setup_devops"] == "devops_agent:2"
+
+        pool.start("wf-1", "setup_devops")
+        assert pool.load("devops_agent:1").queued == 0
+        assert pool.load("devops_agent:1").in_flight == 1
+
+        pool.complete("wf-1", "setup_devops", latency=0.5)
+        pool.release("wf-2")
+        stats = pool.stats()
+        assert stats["in_flight"] == 0
+        assert stats["queued"] == 0
+
+    def test_types_without_instances(self):
+        """Test missing types are reported and unknown types keep their agent id"""
+        pool = _pool(["architect_agent", "backend_agent:1"])
+
+        assert pool.missing(["architect_agent", "backend_agent", "devops_agent"]) == ["devops_agent"]
+        assert pool.route("wf", {"deploy": "devops_agent"}) == {"deploy": "devops_agent"}
+        assert pool.stats()["unrouted"] == 1
+
+    def test_removed_instances_drop_their_load(self):
+        """Test load entries go away once an instance leaves the index and goes idle"""
+        pool = _pool(["backend_agent:1", "backend_agent:2", "frontend_agent"])
+        pool.reserve("wf-1", "generate_backend", "backend_agent:1")
+        pool.reserve("wf-1", "generate_frontend", "frontend_agent")
+        pool.complete("wf-1", "generate_frontend", latency=0.2)
+
+        pool.index.discard("frontend_agent")
+        pool.index.reconcile(["backend_agent:2"])
+
+        assert "frontend_agent" not in pool._load
+        assert pool.load("backend_agent:1").in_flight == 1
+
+        pool.complete("wf-1", "generate_backend", latency=0.1)
+        assert set(pool._load) <= {"backend_agent:2"}
+
+
+class TestOrchestratorRouting:
+    """Test suite for agent routing in the orchestrator"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_workflows_use_different_replicas(
+        self, orchestrator, sample_generation_request
+    ):
+        """Test replicas share the load and routing shows up in workflow status"""
+        orchestrator.agent_registry.list_agents.return_value = [
+            "architect_agent", "architect_agent:2", "backend_agent:1", "backend_agent:2",
+            "frontend_agent", "devops_agent"
+        ]
+        dispatched = {}
+
+        async def execute_workflow(workflow_id, workflow_def):
+            dispatched[workflow_id] = {task.id: task.agent_id for task in workflow_def.tasks}
+            await asyncio.sleep(0.01)
+            return AsyncMock(success=True, generated_files=[], metadata={})
+
+        orchestrator.mcp_orchestrator.execute_workflow.side_effect = execute_workflow
+        results = await asyncio.gather(*(
+            orchestrator.execute_project_generation(
+                replace(sample_generation_request, output_path=f"/tmp/routing-{index}")
+            )
+            for index in range(2)
+        ))
+
+        backends = {dispatched[result.workflow_id]["generate_backend"] for result in results}
+        assert backends == {"backend_agent:1", "backend_agent:2"}
+        status = orchestrator.get_workflow_status(results[0].workflow_id)
+        assert status["routing"] == dispatched[results[0].workflow_id]
+        assert orchestrator.get_metrics()["agent_pool_in_flight"] == 0
+        assert set(orchestrator.get_agent_load()) >= {"backend_agent:1", "backend_agent:2"}
@@ -0,0 +1,89 @@
+# tests/unit/test_batch.py
+import asyncio
+import pytest
+from dataclasses import replace
+from unittest.mock import AsyncMock
+
+from genesis_core.orchestrator.batch import iterate_bounded
+
+
+async def _drain(results):
+    return [result async for result in results]
+
+
+class TestIterateBounded:
+    """Test suite for bounded batch iteration"""
+
+    @pytest.mark.asyncio
+    async def test_respects_max_concurrency(self):
+        """Test no more than max_concurrency workers run at once"""
+        running = 0
+        peak = 0
+
+        async def worker(item):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return item * 2
+
+        results = [r async for r in iterate_bounded(list(range(20)), worker, 3)]
+
+        assert sorted(results) == [i * 2 for i in range(20)]
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_yields_in_completion_order(self):
+        """Test faster items are yielded first"""
+        async def worker(delay):
+            await asyncio.sleep(delay)
+            return delay
+
+        results = [r async for r in iterate_bounded([0.03, 0.0], worker, 2)]
+
+        assert results == [0.0, 0.03]
+
+
+    @pytest.mark.asyncio
+    async def test_cancelled_item_does_not_hang_the_batch(self):
+        """Test an item whose work is cancelled still reaches the consumer"""
+        async def worker(item):
+            if item == 1:
+                raise asyncio.CancelledError()
+            return item
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(
+                asyncio.ensure_future(_drain(iterate_bounded([0, 1, 2], worker, 1))), 1
+            )
+
+
+class TestBatchGeneration:
+    """Test suite for CoreOrchestrator.execute_batch_generation"""
+
+    @pytest.mark.asyncio
+    async def test_batch_runs_all_and_reports_summary(self, orchestrator, sample_generation_request):
+        """Test every request yields a result and summary is aggregated"""
+        mock_result = AsyncMock()
+        mock_result.success = True
+        mock_result.generated_files = []
+        mock_result.metadata = {}
+
+        orchestrator.mcp_orchestrator.execute_workflow.return_value = mock_result
+        orchestrator.agent_registry.list_agents.return_value = [
+            "architect_agent", "backend_agent", "frontend_agent", "devops_agent"
+        ]
+        orchestrator.agent_registry.list_agents.reset_mock()
+        invalid = replace(sample_generation_request, output_path="")
+        requests = [sample_generation_request] * 5 + [invalid]
+
+        batch = orchestrator.execute_batch_generation(requests, max_concurrency=2)
+        results = [result async for result in batch]
+
+        assert len(results) == 6
+        assert len({result.workflow_id for result in results}) == 6
+        assert batch.summary.succeeded == 5
+        assert batch.summary.rejected == 1
+        assert batch.summary.wall_time > 0
+        orchestrator.agent_registry.list_agents.assert_called_once()
@@ -0,0 +1,144 @@
+# tests/unit/test_blob_store.py
+import asyncio
+import os
+import time
+import pytest
+from dataclasses import replace
+from unittest.mock import AsyncMock, Mock
+
+from genesis_core.config.orchestrator_config import OrchestratorConfig
+from genesis_core.orchestrator.blob_store import BlobStore, is_handle
+from genesis_core.orchestrator.core_orchestrator import CoreOrchestrator
+
+DESIGN = {"layers": ["api", "web"], "notes": "x" * 4096}
+
+
+class TestBlobStore:
+    """Test suite for the workflow-scoped blob store"""
+
+    @pytest.mark.asyncio
+    async def test_small_values_stay_literal(self):
+        """Test values under the threshold are not replaced by handles"""
+        store = BlobStore(threshold=1024)
+
+        assert await store.reference("wf-1", {"layers": []}) == {"layers": []}
+        assert len(store) == 0
+
+    @pytest.mark.asyncio
+    async def test_same_content_is_stored_once(self):
+        """Test equal results share one blob across workflows"""
+        store = BlobStore(threshold=1024)
+
+        first = await store.reference("wf-1", DESIGN)
+        second = await store.reference("wf-2", dict(DESIGN))
+
+        assert is_handle(first)
+        assert first == second
+        assert store.load(first) == DESIGN
+        stats = store.stats()
+        assert stats["blobs"] == 1
+        assert stats["reused"] == 1
+        assert stats["bytes_deduplicated"] == first["size"]
+
+    @pytest.mark.asyncio
+    async def test_read_returns_memoryview(self):
+        """Test consumers get a zero-copy view of the serialized result"""
+        store = BlobStore(threshold=16)
+        handle = await store.reference("wf-1", "y" * 64)
+
+        view = store.read(handle)
+
+        assert isinstance(view, memoryview)
+        assert view[:4].tobytes() == b"yyyy"
+        assert store.load(handle) == "y" * 64
+
+    @pytest.mark.asyncio
+    async def test_release_keeps_blobs_still_referenced(self, tmp_path):
+        """Test a blob lives until the last workflow using it finishes"""
+        store = BlobStore(threshold=1024, directory=str(tmp_path))
+        handle = await store.reference("wf-1", DESIGN)
+        await store.reference("wf-2", DESIGN)
+
+        assert os.path.exists(handle["path"])
+        assert bytes(store.read(handle)) == open(handle["path"], "rb").read()
+        assert await store.release("wf-1") == 0
+        assert await store.release("wf-2") == 1
+        assert not os.path.exists(handle["path"])
+        assert store.stats()["blobs"] == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_references_share_one_blob(self, tmp_path):
+        """Test concurrent first references of a value register both workflows on one blob"""
+        store = BlobStore(threshold=1024, directory=str(tmp_path))
+        value = dict(DESIGN)
+
+        first, second = await asyncio.gather(
+            store.reference("wf-1", value), store.reference("wf-2", value)
+        )
+
+        assert first == second
+        assert store.stats()["stored"] == 1
+        assert await store.release("wf-1") == 0
+        assert os.path.exists(first["path"])
+        assert store.load(second) == DESIGN
+        assert await store.release("wf-2") == 1
+        assert not os.path.exists(first["path"])
+
+
+    @pytest.mark.asyncio
+    async def test_reference_during_release_rewrites_the_file(self, tmp_path):
+        """Test content referenced again while its file is being unlinked stays on disk"""
+        store = BlobStore(threshold=1024, directory=str(tmp_path))
+        handle = await store.reference("wf-1", DESIGN)
+        unlink = store._unlink
+
+        def slow_unlink(paths):
+            time.sleep(0.05)
+            unlink(paths)
+
+        store._unlink = slow_unlink
+        releasing = asyncio.ensure_future(store.release("wf-1"))
+        await asyncio.sleep(0.01)
+        again = await store.reference("wf-2", dict(DESIGN))
+        await releasing
+
+        assert again == handle
+        assert os.path.exists(again["path"])
+        assert store.load(again) == DESIGN
+
+
+class TestOrchestratorBlobs:
+    """Test suite for blob handles in generated workflows"""
+
+    @pytest.mark.asyncio
+    async def test_cached_architecture_travels_as_handle(self, sample_generation_request):
+        """Test seeded results become handles and are released with the workflow"""
+        orchestrator = CoreOrchestrator(OrchestratorConfig(
+            blob_handles_enabled=True, blob_threshold=1024
+        ))
+        orchestrator.mcp_protocol = AsyncMock()
+        orchestrator.mcp_orchestrator = AsyncMock()
+        orchestrator.agent_registry = Mock()
+        orchestrator.agent_registry.list_agents.return_value = [
+            "architect_agent", "backend_agent", "frontend_agent", "devops_agent"
+        ]
+        orchestrator.mcp_orchestrator.execute_workflow.return_value = AsyncMock(
+            success=True, generated_files=[], metadata={},
+            task_results={"analyze_architecture": {"requirements": []}, "design_architecture": DESIGN},
+        )
+        await orchestrator.start()
+
+        for index in range(2):
+            await orchestrator.execute_project_generation(
+                replace(sample_generation_request, output_path=f"/tmp/blobs-{index}")
+            )
+        metrics = orchestrator.get_metrics()
+        await orchestrator.stop()
+
+        second_def = orchestrator.mcp_orchestrator.execute_workflow.call_args_list[1].args[1]
+        backend = next(task for task in second_def.tasks if task.id == "generate_backend")
+        assert is_handle(backend.params["architecture"])
+        assert backend.params["architecture"]["encoding"] == "json"
+        assert metrics["blobs_stored"] == 1
+        assert metrics["blobs_blobs"] == 0
+        assert metrics["blobs_released"] == 1
@@ -0,0 +1,158 @@
+# tests/unit/test_checkpoint.py
+import os
+import pytest
+import time
+from unittest.mock import AsyncMock
+
+from genesis_core.config.orchestrator_config import OrchestratorConfig
+from genesis_core.orchestrator.core_orchestrator import CoreOrchestrator
+from genesis_core.state.checkpoint import CheckpointStore
+
+
+class TestCheckpointStore:
+    """Test suite for per-task checkpoints"""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, tmp_path):
+        """Test seeded and recorded results are loaded back"""
+        store = CheckpointStore(str(tmp_path), fsync=False)
+        await store.begin(
+            "wf-1", {"output_path": "/tmp/out"}, {"analyze_architecture": "req"},
+            {"generate_backend": {"changed_fields": ["name"]}}, ["/tmp/out/README.md"]
+        )
+        assert await store.record("wf-1", "design_architecture", {"services": ["api"]})
+
+        checkpoint = await store.load("wf-1")
+
+        assert checkpoint.request == {"output_path": "/tmp/out"}
+        assert checkpoint.task_results == {
+            "analyze_architecture": "req",
+            "design_architecture": {"services": ["api"]},
+        }
+        assert checkpoint.task_params == {"generate_backend": {"changed_fields": ["name"]}}
+        assert checkpoint.base_files == ["/tmp/out/README.md"]
+        assert store.workflow_ids() == ["wf-1"]
+
+    @pytest.mark.asyncio
+    async def test_torn_tail_is_ignored(self, tmp_path):
+        """Test a half-written last line from a crash does not hide earlier results"""
+        store = CheckpointStore(str(tmp_path), fsync=False)
+        await store.begin("wf-1", {})
+        await store.record("wf-1", "analyze_architecture", "req")
+        with open(tmp_path / "wf-1.jsonl", "a", encoding="utf-8") as fh:
+            fh.write('{"task_id": "design_archi')
+
+        checkpoint = await store.load("wf-1")
+
+        assert checkpoint.task_results == {"analyze_architecture": "req"}
+
+    @pytest.mark.asyncio
+    async def test_record_after_discard_is_dropped(self, tmp_path):
+        """Test late task events cannot recreate a finished checkpoint"""
+        store = CheckpointStore(str(tmp_path), fsync=False)
+        await store.begin("wf-1", {})
+        await store.discard("wf-1")
+
+        assert not await store.record("wf-1", "setup_devops", "done")
+        assert await store.load("wf-1") is None
+        assert store.workflow_ids() == []
+
+    @pytest.mark.asyncio
+    async def test_recorded_files_become_base_files(self, tmp_path):
+        """Test files of completed tasks are carried over on load"""
+        store = CheckpointStore(str(tmp_path), fsync=False)
+        await store.begin("wf-1", {}, base_files=["README.md"])
+        await store.record("wf-1", "generate_backend", "ok", ["backend/main.py", "README.md"])
+
+        checkpoint = await store.load("wf-1")
+
+        assert checkpoint.base_files == ["README.md", "backend/main.py"]
+
+    @pytest.mark.asyncio
+    async def test_stale_checkpoints_expire(self, tmp_path):
+        """Test checkpoints nobody resumed are removed after the ttl"""
+        store = CheckpointStore(str(tmp_path), fsync=False, ttl=3600)
+        await store.begin("wf-old", {})
+        await store.begin("wf-new", {})
+        stale = time.time() - 7200
+        os.utime(tmp_path / "wf-old.jsonl", (stale, stale))
+
+        assert await store.expire() == 1
+        assert store.workflow_ids() == ["wf-new"]
+        assert store.stats()["expired"] == 1
+
+
+def _orchestrator(checkpoint_dir):
+    orchestrator = CoreOrchestrator(OrchestratorConfig(
+        checkpoint_dir=str(checkpoint_dir), checkpoint_fsync=False
+    ))
+    orchestrator.mcp_protocol = AsyncMock()
+    orchestrator.mcp_orchestrator = AsyncMock()
+    orchestrator.agent_registry = AsyncMock()
+    orchestrator.agent_registry.list_agents.return_value = [
+        "architect_agent", "backend_agent", "frontend_agent", "devops_agent"
+    ]
+    return orchestrator
+
+
+class TestOrchestratorResume:
+    """Test suite for resuming workflows after a restart"""
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_completed_tasks(self, tmp_path, sample_generation_request):
+        """Test a restarted orchestrator only runs the tasks left unfinished"""
+        first = _orchestrator(tmp_path)
+
+        async def interrupted(workflow_id, workflow_def):
+            for task_id, result in (
+                ("analyze_architecture", "req"),
+                ("design_architecture", {"services": ["api"]}),
+                ("generate_backend", "backend ok"),
+            ):
+                await first._handle_task_completed({
+                    "workflow_id": workflow_id, "task_id": task_id, "result": result,
+                    "generated_files": ["backend/main.py"] if task_id == "generate_backend" else [],
+                })
+            return AsyncMock(success=False, error="node crashed", generated_files=[])
+
+        first.mcp_orchestrator.execute_workflow.side_effect = interrupted
+        await first.start()
+        failed = await first.execute_project_generation(sample_generation_request)
+        await first.stop()
+        assert not failed.success
+
+        # Proceso nuevo con el mismo directorio de checkpoints
+        second = _orchestrator(tmp_path)
+        second.mcp_orchestrator.execute_workflow.return_value = AsyncMock(
+            success=True, generated_files=["frontend/app.tsx"], metadata={}
+        )
+        await second.start()
+        assert second.get_resumable_workflows() == [failed.workflow_id]
+
+        result = await second.resume_workflow(failed.workflow_id)
+        await second.stop()
+
+        workflow_id, workflow_def = second.mcp_orchestrator.execute_workflow.call_args.args
+        tasks = {task.id: task for task in workflow_def.tasks}
+        assert result.success
+        assert workflow_id == failed.workflow_id
+        assert set(tasks) == {"generate_frontend", "setup_devops"}
+        assert tasks["generate_frontend"].params["architecture"] == {"services": ["api"]}
+        assert "generate_backend" not in tasks["setup_devops"].dependencies
+        assert result.metadata["resumed_tasks"] == [
+            "analyze_architecture", "design_architecture", "generate_backend"
+        ]
+        assert sorted(result.generated_files) == ["backend/main.py", "frontend/app.tsx"]
+        assert second.get_resumable_workflows() == []
+
+    @pytest.mark.asyncio
+    async def test_resume_without_checkpoint_is_rejected(self, tmp_path):
+        """Test resuming an unknown workflow fails without running anything"""
+        orchestrator = _orchestrator(tmp_path)
+        await orchestrator.start()
+        result = await orchestrator.resume_workflow("missing")
+        await orchestrator.stop()
+
+        assert not result.success
+        assert "No checkpoint" in result.error
+        orchestrator.mcp_orchestrator.execute_workflow.assert_not_called()
@@ -1,5 +1,7 @@
 # tests/unit/test_core_orchestrator.py
+import asyncio
 import pytest
+from dataclasses import replace
 from unittest.mock import AsyncMock, patch
 from datetime import datetime
 
@@ -113,6 +115,100 @@ class TestCoreOrchestrator:
         assert success
         assert workflow_id not in orchestrator.active_workflows
         orchestrator.mcp_orchestrator.cancel_workflow.assert_called_once_with(workflow_id)
+    
+    @pytest.mark.asyncio
+    async def test_architecture_cache_skips_architect_tasks(self, orchestrator, sample_generation_request):
+        """Test a repeated config reuses the cached architecture"""
+        mock_result = AsyncMock()
+        mock_result.success = True
+        mock_result.generated_files = []
+        mock_result.metadata = {}
+        mock_result.task_results = {
+            "analyze_architecture": {"requirements": []},
+            "design_architecture": {"layers": ["api", "web"]}
+        }
+        
+        orchestrator.mcp_orchestrator.execute_workflow.return_value = mock_result
+        orchestrator.agent_registry.list_agents.return_value = [
+            "architect_agent", "backend_agent", "frontend_agent", "devops_agent"
+        ]
+        
+        await orchestrator.execute_project_generation(sample_generation_request)
+        await orchestrator.execute_project_generation(sample_generation_request)
+        
+        first_def = orchestrator.mcp_orchestrator.execute_workflow.call_args_list[0].args[1]
+        second_def = orchestrator.mcp_orchestrator.execute_workflow.call_args_list[1].args[1]
+        first_ids = [task.id for task in first_def.tasks]
+        second_ids = [task.id for task in second_def.tasks]
+        
+        assert "design_architecture" in first_ids
+        assert "analyze_architecture" not in second_ids
+        assert "design_architecture" not in second_ids
+        backend = next(task for task in second_def.tasks if task.id == "generate_backend")
+        assert backend.params["architecture"] == {"layers": ["api", "web"]}
+        assert backend.dependencies == []
+        
+        metrics = orchestrator.get_metrics()
+        assert metrics["architecture_cache_hits"] == 1
+        assert metrics["architecture_cache_misses"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_status_available_after_archival(self, orchestrator, sample_generation_request):
+        """Test archived workflows still answer status queries"""
+        mock_result = AsyncMock()
+        mock_result.success = True
+        mock_result.generated_files = []
+        mock_result.metadata = {}
+        
+        orchestrator.mcp_orchestrator.execute_workflow.return_value = mock_result
+        orchestrator.agent_registry.list_agents.return_value = [
+            "architect_agent", "backend_agent", "frontend_agent", "devops_agent"
+        ]
+        orchestrator.retention.max_live = 0
+        
+        result = await orchestrator.execute_project_generation(sample_generation_request)
+        
+        assert result.workflow_id not in orchestrator.workflow_states
+        assert orchestrator.get_workflow_status(result.workflow_id)["status"] == "completed"
+        assert orchestrator.get_project_status(result.workflow_id)["name"] == "test-project"
+        assert orchestrator.get_metrics()["archived_workflows"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_starting_workflow_is_not_archived(self, orchestrator, sample_generation_request):
+        """Test a run finishing does not archive a workflow that is still starting"""
+        mock_result = AsyncMock()
+        mock_result.success = True
+        mock_result.generated_files = []
+        mock_result.metadata = {}
+        
+        orchestrator.mcp_orchestrator.execute_workflow.return_value = mock_result
+        orchestrator.agent_registry.list_agents.return_value = [
+            "architect_agent", "backend_agent", "frontend_agent", "devops_agent"
+        ]
+        orchestrator.retention.max_live = 0
+        build = orchestrator._build_generation_workflow
+        building = asyncio.Event()
+        
+        async def slow_build(*args, **kwargs):
+            if not building.is_set():
+                building.set()
+                await asyncio.sleep(0.05)
+            return await build(*args, **kwargs)
+        
+        orchestrator._build_generation_workflow = slow_build
+        starting = asyncio.ensure_future(
+            orchestrator.execute_project_generation(sample_generation_request)
+        )
+        await building.wait()
+        finished = await orchestrator.execute_project_generation(
+            replace(sample_generation_request, output_path="/tmp/other-project")
+        )
+        
+        assert finished.workflow_id not in orchestrator.project_states
+        assert len(orchestrator.project_states) == 1
+        result = await starting
+        assert result.success
+        assert orchestrator.get_workflow_status(result.workflow_id)["status"] == "completed"
 
 
 # tests/unit/test_project_config.py
@@ -161,4 +257,4 @@ class TestProjectConfig:
                 stack=StackConfig(backend=None)  # Backend required but not specified
             )
         
-        assert "Backend stack required" in str(exc_info.value)
\ No newline at end of file
+        assert "Backend stack required" in str(exc_info.value)
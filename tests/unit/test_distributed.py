@@ -0,0 +1,229 @@
+# tests/unit/test_distributed.py
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+from genesis_core.config.orchestrator_config import OrchestratorConfig
+from genesis_core.orchestrator.core_orchestrator import CoreOrchestrator
+from genesis_core.state.distributed import DistributedCoordinator
+from genesis_core.state.memory_redis import InMemoryRedis
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _node(redis, node_id, **kwargs):
+    return DistributedCoordinator(redis, node_id, lease_ttl=10, shards=4, **kwargs)
+
+
+class TestDistributedCoordinator:
+    """Test suite for workflow leases and orphan takeover"""
+
+    @pytest.mark.asyncio
+    async def test_lease_is_exclusive(self):
+        """Test only one node can own a workflow at a time"""
+        redis = InMemoryRedis()
+        node_a, node_b = _node(redis, "node-a"), _node(redis, "node-b")
+
+        assert await node_a.acquire("wf-1", {"output_path": "/tmp"})
+        assert await node_a.acquire("wf-1")
+        assert not await node_b.acquire("wf-1")
+        assert await node_b.owner("wf-1") == "node-a"
+
+        await node_a.release("wf-1")
+        assert await node_b.acquire("wf-1")
+        assert await node_a.orphaned() == []
+
+    @pytest.mark.asyncio
+    async def test_finished_workflow_never_looks_orphaned(self):
+        """Test the active entry and request are gone before the lease is dropped"""
+        seen_when_released = []
+
+        class ObservedRedis(InMemoryRedis):
+            def _release_lease(self, keys, args):
+                active = self._get(node._active_key("wf-1")) or set()
+                seen_when_released.append(("wf-1" in active, self._get("genesis:request:wf-1")))
+                return super()._release_lease(keys, args)
+
+        node = _node(ObservedRedis(), "node-a")
+        await node.acquire("wf-1", {"output_path": "/tmp"})
+
+        await node.release("wf-1")
+
+        assert seen_when_released == [(False, None)]
+        assert await node.orphaned() == []
+        assert await node.owner("wf-1") is None
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_taken_over(self):
+        """Test a dead node's workflows are claimed by a live node"""
+        clock = FakeClock()
+        redis = InMemoryRedis(clock=clock)
+        dead, survivor = _node(redis, "node-dead"), _node(redis, "node-live")
+        await dead.heartbeat()
+        await dead.acquire("wf-1", {"output_path": "/tmp/out"})
+
+        clock.now = 5
+        assert await survivor.orphaned() == []
+
+        # El nodo muerto deja de renovar; el vivo sí
+        clock.now = 11
+        await survivor.heartbeat()
+        assert await survivor.live_nodes() == ["node-live"]
+        assert await survivor.orphaned() == ["wf-1"]
+
+        claimed = await survivor.claim_orphans()
+
+        assert claimed == [("wf-1", {"output_path": "/tmp/out"})]
+        assert await survivor.owner("wf-1") == "node-live"
+        assert survivor.stats()["taken_over"] == 1
+
+    @pytest.mark.asyncio
+    async def test_orphans_are_spread_across_live_nodes(self):
+        """Test rendezvous hashing gives each orphan to exactly one node"""
+        clock = FakeClock()
+        redis = InMemoryRedis(clock=clock)
+        dead = _node(redis, "node-dead")
+        for index in range(40):
+            await dead.acquire(f"wf-{index}", {"index": index})
+
+        clock.now = 11
+        nodes = [_node(redis, f"node-{name}") for name in "abc"]
+        for node in nodes:
+            await node.heartbeat()
+
+        claimed = [await node.claim_orphans() for node in nodes]
+
+        assert sum(len(batch) for batch in claimed) == 40
+        assert all(batch for batch in claimed)
+        assert await nodes[0].orphaned() == []
+
+    @pytest.mark.asyncio
+    async def test_lease_lost_callback(self):
+        """Test a node is told when another node took its workflow"""
+        clock = FakeClock()
+        redis = InMemoryRedis(clock=clock)
+        lost = []
+
+        async def on_lease_lost(workflow_id):
+            lost.append(workflow_id)
+
+        paused = _node(redis, "node-a", on_lease_lost=on_lease_lost)
+        await paused.acquire("wf-1", {"output_path": "/tmp"})
+
+        clock.now = 11
+        other = _node(redis, "node-b")
+        await other.heartbeat()
+        assert [wid for wid, _ in await other.claim_orphans()] == ["wf-1"]
+
+        await paused.heartbeat()
+
+        assert lost == ["wf-1"]
+        assert paused.stats()["lost"] == 1
+        assert "wf-1" not in paused.owned
+
+    @pytest.mark.asyncio
+    async def test_stop_leaves_workflows_for_takeover(self):
+        """Test stopping a node orphans its unfinished workflows"""
+        redis = InMemoryRedis()
+        node = _node(redis, "node-a")
+        await node.start()
+        await node.acquire("wf-1", {"output_path": "/tmp"})
+
+        await node.stop()
+        # Un release posterior del workflow ya soltado no lo saca del índice
+        await node.release("wf-1")
+
+        assert await node.orphaned() == ["wf-1"]
+        assert await node.live_nodes() == []
+
+
+def _orchestrator(redis, node_id):
+    orchestrator = CoreOrchestrator(OrchestratorConfig(takeover_interval=0))
+    orchestrator.mcp_protocol = AsyncMock()
+    orchestrator.mcp_orchestrator = AsyncMock()
+    orchestrator.agent_registry = AsyncMock()
+    orchestrator.agent_registry.list_agents.return_value = [
+        "architect_agent", "backend_agent", "frontend_agent", "devops_agent"
+    ]
+    orchestrator.distributed = DistributedCoordinator(
+        redis, node_id, on_lease_lost=orchestrator._handle_lease_lost
+    )
+    return orchestrator
+
+
+class TestOrchestratorDistributed:
+    """Test suite for multi-node orchestration"""
+
+    @pytest.mark.asyncio
+    async def test_status_is_visible_from_other_node(self, sample_generation_request):
+        """Test a workflow run on one node can be queried from another"""
+        redis = InMemoryRedis()
+        node_a, node_b = _orchestrator(redis, "node-a"), _orchestrator(redis, "node-b")
+        release = asyncio.Event()
+
+        async def execute_workflow(workflow_id, workflow_def):
+            await release.wait()
+            return AsyncMock(success=True, generated_files=[], metadata={})
+
+        node_a.mcp_orchestrator.execute_workflow.side_effect = execute_workflow
+        await node_a.start()
+        await node_b.start()
+
+        run = asyncio.ensure_future(node_a.execute_project_generation(sample_generation_request))
+        await asyncio.sleep(0.05)
+        workflow_id = next(iter(node_a.active_workflows))
+
+        running = await node_b.fetch_workflow_status(workflow_id)
+        assert running["status"] == "running"
+        assert running["node_id"] == "node-a"
+
+        # El otro nodo no puede ejecutar el mismo workflow
+        sample_generation_request.workflow_id = workflow_id
+        duplicate = await node_b.execute_project_generation(sample_generation_request)
+        assert not duplicate.success
+        assert "owned by another node" in duplicate.error
+
+        release.set()
+        result = await run
+        finished = await node_b.fetch_workflow_status(workflow_id)
+
+        await node_a.stop()
+        await node_b.stop()
+
+        assert result.success
+        assert finished["status"] == "completed"
+        assert await node_b.distributed.orphaned() == []
+
+    @pytest.mark.asyncio
+    async def test_orphaned_workflow_is_resubmitted(self, sample_generation_request):
+        """Test takeover re-runs the stored request on the surviving node"""
+        redis = InMemoryRedis()
+        dead = DistributedCoordinator(redis, "node-dead")
+        sample_generation_request.workflow_id = "wf-orphan"
+        await dead.acquire("wf-orphan", sample_generation_request.to_payload())
+        await dead.stop()
+
+        survivor = _orchestrator(redis, "node-live")
+        survivor.mcp_orchestrator.execute_workflow.return_value = AsyncMock(
+            success=True, generated_files=[], metadata={}
+        )
+        await survivor.start()
+
+        assert await survivor.take_over_orphans() == ["wf-orphan"]
+        for _ in range(100):
+            if not survivor._taken_over:
+                break
+            await asyncio.sleep(0.01)
+        status = await survivor.fetch_workflow_status("wf-orphan")
+        await survivor.stop()
+
+        workflow_id, _ = survivor.mcp_orchestrator.execute_workflow.call_args.args
+        assert workflow_id == "wf-orphan"
+        assert status["status"] == "completed"
+        assert survivor.get_metrics()["distributed_taken_over"] == 1
@@ -0,0 +1,201 @@
+# tests/unit/test_drain.py
+import asyncio
+import time
+import pytest
+from unittest.mock import AsyncMock
+
+from genesis_core.config.orchestrator_config import OrchestratorConfig
+from genesis_core.orchestrator.core_orchestrator import CoreOrchestrator, GenerationRequest
+
+
+def _orchestrator(**config):
+    orchestrator = CoreOrchestrator(OrchestratorConfig(**config))
+    orchestrator.mcp_protocol = AsyncMock()
+    orchestrator.mcp_orchestrator = AsyncMock()
+    orchestrator.agent_registry = AsyncMock()
+    orchestrator.agent_registry.list_agents.return_value = [
+        "architect_agent", "backend_agent", "frontend_agent", "devops_agent"
+    ]
+    return orchestrator
+
+
+def _hanging_backend(orchestrator, cancel_delay=0.0, finish_after=None):
+    """execute_workflow runs until cancelled (or finish_after seconds)"""
+    cancelled = {}
+
+    async def execute_workflow(workflow_id, workflow_def):
+        cancelled[workflow_id] = asyncio.Event()
+        try:
+            await asyncio.wait_for(cancelled[workflow_id].wait(), finish_after)
+        except asyncio.TimeoutError:
+            return AsyncMock(success=True, generated_files=[], metadata={})
+        return AsyncMock(success=False, error="cancelled", generated_files=[])
+
+    async def cancel_workflow(workflow_id):
+        await asyncio.sleep(cancel_delay)
+        cancelled[workflow_id].set()
+        return True
+
+    orchestrator.mcp_orchestrator.execute_workflow.side_effect = execute_workflow
+    orchestrator.mcp_orchestrator.cancel_workflow.side_effect = cancel_workflow
+
+
+def _requests(config, count):
+    return [
+        GenerationRequest(project_config=config, output_path=f"/tmp/drain-{index}")
+        for index in range(count)
+    ]
+
+
+class TestGracefulDrain:
+    """Test suite for draining active workflows in stop()"""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_workflows_finishing_before_deadline(self, sample_project_config):
+        """Test near-complete workflows are allowed to finish"""
+        orchestrator = _orchestrator()
+        _hanging_backend(orchestrator, finish_after=0.05)
+        await orchestrator.start()
+        run = asyncio.ensure_future(
+            orchestrator.execute_project_generation(_requests(sample_project_config, 1)[0])
+        )
+        await asyncio.sleep(0.01)
+
+        report = await orchestrator.stop(drain_timeout=5)
+        result = await run
+
+        assert result.success
+        assert report.outcomes == {result.workflow_id: "completed"}
+        orchestrator.mcp_orchestrator.cancel_workflow.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cancels_remaining_concurrently(self, sample_project_config):
+        """Test shutdown time does not grow with the number of active workflows"""
+        orchestrator = _orchestrator()
+        _hanging_backend(orchestrator, cancel_delay=0.05)
+        await orchestrator.start()
+        runs = [
+            asyncio.ensure_future(orchestrator.execute_project_generation(request))
+            for request in _requests(sample_project_config, 20)
+        ]
+        await asyncio.sleep(0.01)
+
+        started = time.monotonic()
+        report = await orchestrator.stop(drain_timeout=0.05)
+        elapsed = time.monotonic() - started
+        results = await asyncio.gather(*runs)
+
+        # Secuencial serían 20 * 0.05s
+        assert elapsed < 0.5
+        assert report.summary() == {"cancelled": 20}
+        assert not any(result.success for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_workflows_with_checkpoint_are_resumable(
+        self, tmp_path, sample_project_config
+    ):
+        """Test drained workflows keep their checkpoint for resume_workflow"""
+        orchestrator = _orchestrator(checkpoint_dir=str(tmp_path), checkpoint_fsync=False)
+        _hanging_backend(orchestrator)
+        await orchestrator.start()
+        run = asyncio.ensure_future(
+            orchestrator.execute_project_generation(_requests(sample_project_config, 1)[0])
+        )
+        await asyncio.sleep(0.01)
+
+        report = await orchestrator.stop(drain_timeout=0)
+        result = await run
+
+        assert report.outcomes == {result.workflow_id: "checkpointed"}
+        assert orchestrator.get_resumable_workflows() == [result.workflow_id]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("coalesce", [True, False])
+    async def test_starting_runs_are_cancelled_locally(self, sample_project_config, coalesce):
+        """Test runs not yet handed to MCPturbo end as cancelled results, not abandoned"""
+        orchestrator = _orchestrator(coalesce_identical_requests=coalesce)
+        _hanging_backend(orchestrator)
+
+        async def slow_build(*args, **kwargs):
+            await asyncio.Event().wait()
+
+        orchestrator._build_generation_workflow = slow_build
+        await orchestrator.start()
+        run = asyncio.ensure_future(
+            orchestrator.execute_project_generation(_requests(sample_project_config, 1)[0])
+        )
+        await asyncio.sleep(0.01)
+        assert not orchestrator.active_workflows
+
+        report = await orchestrator.stop(drain_timeout=0)
+        result = await asyncio.wait_for(run, 1)
+
+        assert list(report.outcomes.values()) == ["cancelled"]
+        assert not result.success
+        assert result.error == "Generation cancelled"
+        assert not orchestrator._runs
+        orchestrator.mcp_orchestrator.execute_workflow.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_receives_results_for_cancelled_items(self, sample_project_config):
+        """Test stop() during a batch still yields one result per request"""
+        orchestrator = _orchestrator()
+        _hanging_backend(orchestrator)
+
+        async def slow_build(*args, **kwargs):
+            await asyncio.Event().wait()
+
+        orchestrator._build_generation_workflow = slow_build
+        await orchestrator.start()
+        batch = orchestrator.execute_batch_generation(
+            _requests(sample_project_config, 3), max_concurrency=3
+        )
+
+        async def collect():
+            return [result async for result in batch]
+
+        results = asyncio.ensure_future(collect())
+        await asyncio.sleep(0.01)
+        await orchestrator.stop(drain_timeout=0)
+
+        assert [result.error for result in await asyncio.wait_for(results, 1)] == [
+            "Generation cancelled"
+        ] * 3
+
+    @pytest.mark.asyncio
+    async def test_unconfirmed_cancellation_is_abandoned(self, sample_project_config):
+        """Test a backend that never confirms cancellation cannot block shutdown"""
+        orchestrator = _orchestrator(drain_cancel_timeout=0.05)
+        _hanging_backend(orchestrator, cancel_delay=60)
+        await orchestrator.start()
+        run = asyncio.ensure_future(
+            orchestrator.execute_project_generation(_requests(sample_project_config, 1)[0])
+        )
+        await asyncio.sleep(0.01)
+
+        started = time.monotonic()
+        report = await orchestrator.stop(drain_timeout=0)
+
+        assert time.monotonic() - started < 0.5
+        assert list(report.outcomes.values()) == ["abandoned"]
+        run.cancel()
+
+    @pytest.mark.asyncio
+    async def test_stops_admitting_and_rejects_queued(self, sample_project_config):
+        """Test queued and new requests are rejected once draining starts"""
+        orchestrator = _orchestrator(max_in_flight_workflows=1)
+        _hanging_backend(orchestrator, finish_after=0.05)
+        await orchestrator.start()
+        first, queued = _requests(sample_project_config, 2)
+        running = asyncio.ensure_future(orchestrator.execute_project_generation(first))
+        waiting = asyncio.ensure_future(orchestrator.execute_project_generation(queued))
+        await asyncio.sleep(0.01)
+
+        report = await orchestrator.stop(drain_timeout=5)
+        late = await orchestrator.execute_project_generation(queued)
+
+        assert (await running).success
+        assert "shutting down" in (await waiting).error
+        assert "shutting down" in late.error
+        assert report.rejected_queued == 1
+        assert orchestrator.get_metrics()["generations_rejected"] == 2
@@ -0,0 +1,204 @@
+# tests/unit/test_event_ingestion.py
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from genesis_core.orchestrator.event_ingestion import EventIngestor
+
+
+def _recording(ingestor, *topics):
+    applied = []
+
+    def handler(topic):
+        async def handle(event, received_at=None):
+            applied.append((topic, event))
+        return handle
+
+    for topic in topics:
+        ingestor.register(topic, handler(topic))
+    return applied
+
+
+class TestEventIngestor:
+    """Test suite for batched broadcast ingestion"""
+
+    @pytest.mark.asyncio
+    async def test_applies_in_order_and_in_batches(self):
+        """Test events keep arrival order across batches"""
+        ingestor = EventIngestor(batch_size=4)
+        applied = _recording(ingestor, "task.started")
+        for index in range(10):
+            await ingestor.put("task.started", {"task_id": index})
+
+        assert await ingestor.flush() == 10
+        assert [event["task_id"] for _, event in applied] == list(range(10))
+        assert ingestor.stats()["batches"] == 3
+        assert ingestor.stats()["max_batch"] == 4
+
+    @pytest.mark.asyncio
+    async def test_superseded_progress_is_coalesced(self):
+        """Test only the latest pending progress per task is applied"""
+        ingestor = EventIngestor()
+        applied = _recording(ingestor, "task.progress", "task.started")
+        await ingestor.put("task.progress", {"workflow_id": "wf", "task_id": "a", "progress": 0.1})
+        await ingestor.put("task.started", {"workflow_id": "wf", "task_id": "b"})
+        await ingestor.put("task.progress", {"workflow_id": "wf", "task_id": "a", "progress": 0.5})
+        await ingestor.put("task.progress", {"workflow_id": "wf", "task_id": "b", "progress": 0.2})
+        await ingestor.flush()
+
+        assert [(topic, event.get("progress")) for topic, event in applied] == [
+            ("task.started", None), ("task.progress", 0.5), ("task.progress", 0.2)
+        ]
+        assert ingestor.stats()["coalesced"] == 1
+
+    @pytest.mark.asyncio
+    async def test_agent_churn_keeps_last_state(self):
+        """Test register/deregister of the same agent collapse to the last one"""
+        ingestor = EventIngestor()
+        applied = _recording(ingestor, "agent.registered", "agent.deregistered")
+        await ingestor.put("agent.registered", {"agent_id": "backend_agent"})
+        await ingestor.put("agent.deregistered", {"agent_id": "backend_agent"})
+        await ingestor.flush()
+
+        assert [topic for topic, _ in applied] == ["agent.deregistered"]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_blocks_events_without_pending_key(self):
+        """Test backpressure never loses transitions, progress or agent churn"""
+        ingestor = EventIngestor(max_queue=2)
+        applied = _recording(ingestor, "task.started", "task.progress", "agent.registered")
+        await ingestor.put("task.started", {"task_id": "a"})
+        await ingestor.put("task.started", {"task_id": "b"})
+
+        blocked = [
+            asyncio.ensure_future(ingestor.put("task.progress", {"workflow_id": "wf", "task_id": "a"})),
+            asyncio.ensure_future(ingestor.put("agent.registered", {"agent_id": "backend_agent:2"})),
+            asyncio.ensure_future(ingestor.put("task.started", {"task_id": "c"})),
+        ]
+        await asyncio.sleep(0.01)
+        assert not any(put.done() for put in blocked)
+
+        await ingestor.start()
+        await asyncio.wait_for(asyncio.gather(*blocked), 1)
+        await ingestor.stop()
+
+        assert sorted(topic for topic, _ in applied) == [
+            "agent.registered", "task.progress", "task.started", "task.started", "task.started"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_superseded_entries_do_not_grow_the_queue(self):
+        """Test a flood of coalesced events keeps the deque bounded"""
+        ingestor = EventIngestor(max_queue=4)
+        applied = _recording(ingestor, "task.progress")
+        for index in range(1000):
+            await ingestor.put("task.progress", {"workflow_id": "wf", "task_id": "a", "progress": index})
+
+        assert len(ingestor._queue) <= 2 * ingestor.max_queue
+        assert ingestor.queue_depth == 1
+        await ingestor.flush()
+        assert [event["progress"] for _, event in applied] == [999]
+
+    @pytest.mark.asyncio
+    async def test_flush_waits_for_batch_in_flight(self):
+        """Test flush returns only after the consumer's current batch is applied"""
+        ingestor = EventIngestor()
+        applying, release, applied = asyncio.Event(), asyncio.Event(), []
+
+        async def slow(event):
+            applying.set()
+            await release.wait()
+            applied.append(event["task_id"])
+
+        ingestor.register("task.completed", slow)
+        await ingestor.start()
+        await ingestor.put("task.completed", {"task_id": "a"})
+        await applying.wait()
+
+        flushed = asyncio.ensure_future(ingestor.flush())
+        await asyncio.sleep(0.01)
+        assert not flushed.done()
+
+        release.set()
+        await asyncio.wait_for(flushed, 1)
+        assert applied == ["a"]
+        await ingestor.stop()
+
+    @pytest.mark.asyncio
+    async def test_bursts_do_not_starve_the_loop(self):
+        """Test the consumer yields between batches"""
+        ingestor = EventIngestor(batch_size=10)
+        _recording(ingestor, "task.started")
+        for index in range(1000):
+            await ingestor.put("task.started", {"task_id": index})
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while ingestor.queue_depth:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        await ingestor.start()
+        await ticker()
+        await ingestor.stop()
+
+        assert ticks >= 50
+        assert ingestor.stats()["applied"] == 1000
+
+    @pytest.mark.asyncio
+    async def test_timed_handlers_get_receive_time(self):
+        """Test lag is measured from reception and passed to timed handlers"""
+        ingestor = EventIngestor()
+        seen = []
+
+        async def handler(event, received_at):
+            seen.append(received_at)
+
+        ingestor.register("task.completed", handler, timed=True)
+        await ingestor.put("task.completed", {"task_id": "a"})
+        await asyncio.sleep(0.02)
+        await ingestor.flush()
+        stats = ingestor.stats()
+
+        assert len(seen) == 1
+        assert stats["lag_max"] >= 0.02
+        assert stats["queue_depth"] == 0
+
+
+class TestOrchestratorIngestion:
+    """Test suite for broadcast ingestion in the orchestrator"""
+
+    @pytest.mark.asyncio
+    async def test_queued_task_events_are_applied_before_result(self, sample_generation_request):
+        """Test events still queued when the workflow returns are not lost"""
+        from genesis_core.orchestrator.core_orchestrator import CoreOrchestrator
+
+        orchestrator = CoreOrchestrator()
+        orchestrator.mcp_protocol = AsyncMock()
+        orchestrator.mcp_protocol.subscribe_to_broadcasts = Mock()
+        orchestrator.mcp_orchestrator = AsyncMock()
+        orchestrator.agent_registry = AsyncMock()
+        orchestrator.agent_registry.list_agents.return_value = [
+            "architect_agent", "backend_agent", "frontend_agent", "devops_agent"
+        ]
+        await orchestrator.start()
+        receivers = {
+            call.args[0]: call.args[1]
+            for call in orchestrator.mcp_protocol.subscribe_to_broadcasts.call_args_list
+        }
+
+        async def execute_workflow(workflow_id, workflow_def):
+            for topic in ("task.started", "task.completed"):
+                await receivers[topic]({"workflow_id": workflow_id, "task_id": "generate_backend"})
+            return AsyncMock(success=True, generated_files=[], metadata={})
+
+        orchestrator.mcp_orchestrator.execute_workflow.side_effect = execute_workflow
+        result = await orchestrator.execute_project_generation(sample_generation_request)
+        metrics = orchestrator.get_metrics()
+        await orchestrator.stop()
+
+        assert result.success
+        assert orchestrator.telemetry.counter("tasks_total", outcome="success") == 1
+        assert orchestrator.telemetry.histogram("task_seconds", task_id="generate_backend").count == 1
+        assert metrics["ingestion_applied"] == 2
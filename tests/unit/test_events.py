@@ -0,0 +1,94 @@
+# tests/unit/test_events.py
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+from genesis_core.orchestrator.events import (
+    GenerationFinished,
+    TaskCompleted,
+    TaskProgress,
+    TaskStarted,
+    WorkflowEventBus,
+    task_event_from_broadcast,
+)
+
+
+class TestWorkflowEventBus:
+    """Test suite for per-workflow event routing"""
+
+    def test_broadcast_conversion(self):
+        """Test task.* broadcasts become typed events"""
+        event = task_event_from_broadcast("task.completed", {
+            "workflow_id": "wf-1",
+            "task_id": "generate_backend",
+            "agent_id": "backend_agent",
+            "generated_files": ["backend/app.py"],
+        })
+
+        assert isinstance(event, TaskCompleted)
+        assert event.generated_files == ["backend/app.py"]
+        assert task_event_from_broadcast("task.started", {"task_id": "x"}) is None
+
+        progress = task_event_from_broadcast("task.progress", {
+            "workflow_id": "wf-1", "task_id": "generate_backend", "progress": 0.4,
+        })
+        assert isinstance(progress, TaskProgress)
+        assert progress.progress == 0.4
+
+    @pytest.mark.asyncio
+    async def test_routes_only_to_workflow_subscribers(self):
+        """Test events reach the subscribers of their workflow only"""
+        bus = WorkflowEventBus()
+        queue = bus.subscribe("wf-1")
+
+        bus.publish(TaskStarted("wf-1", "analyze_architecture"))
+        bus.publish(TaskStarted("wf-2", "analyze_architecture"))
+        bus.unsubscribe("wf-1", queue)
+        bus.publish(TaskStarted("wf-1", "design_architecture"))
+
+        assert queue.qsize() == 1
+        assert (await queue.get()).task_id == "analyze_architecture"
+        assert bus.stats()["unrouted"] == 2
+        assert bus.stats()["subscribed_workflows"] == 0
+
+
+class TestStreamProjectGeneration:
+    """Test suite for CoreOrchestrator.stream_project_generation"""
+
+    @pytest.mark.asyncio
+    async def test_yields_task_events_then_result(self, orchestrator, sample_generation_request):
+        """Test task events are streamed before the final result"""
+        mock_result = AsyncMock()
+        mock_result.success = True
+        mock_result.generated_files = ["backend/app.py", "frontend/index.tsx"]
+        mock_result.metadata = {}
+
+        async def execute_workflow(workflow_id, workflow_def):
+            await orchestrator._handle_task_started(
+                {"workflow_id": workflow_id, "task_id": "generate_backend"}
+            )
+            await asyncio.sleep(0)
+            await orchestrator._handle_task_completed({
+                "workflow_id": workflow_id,
+                "task_id": "generate_backend",
+                "generated_files": ["backend/app.py"],
+            })
+            return mock_result
+
+        orchestrator.mcp_orchestrator.execute_workflow.side_effect = execute_workflow
+        orchestrator.agent_registry.list_agents.return_value = [
+            "architect_agent", "backend_agent", "frontend_agent", "devops_agent"
+        ]
+
+        events = [
+            event async for event in
+            orchestrator.stream_project_generation(sample_generation_request)
+        ]
+
+        assert [type(event) for event in events] == [
+            TaskStarted, TaskCompleted, GenerationFinished
+        ]
+        assert events[1].generated_files == ["backend/app.py"]
+        assert events[-1].result.success
+        assert events[-1].result.workflow_id == events[0].workflow_id
+        assert orchestrator.events.stats()["subscribed_workflows"] == 0
@@ -0,0 +1,186 @@
+# tests/unit/test_hedging.py
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+from genesis_core.config.orchestrator_config import OrchestratorConfig
+from genesis_core.orchestrator.core_orchestrator import CoreOrchestrator
+from genesis_core.orchestrator.hedging import HedgingPolicy, agent_type
+from genesis_core.orchestrator.metrics import LatencyHistogram
+
+AGENTS = ["architect_agent", "backend_agent", "frontend_agent", "devops_agent"]
+
+
+class StragglingBackend:
+    """Runs tasks one by one; the straggler hangs on its primary instance"""
+
+    def __init__(self, straggler, straggle_for=None, hedge_delay=0.0):
+        self.straggler = straggler
+        self.straggle_for = straggle_for
+        self.hedge_delay = hedge_delay
+        self.receivers = {}
+        self.calls = []
+        self.cancelled = []
+        self._running = {}
+
+    def install(self, orchestrator):
+        orchestrator.mcp_protocol = AsyncMock()
+        orchestrator.mcp_protocol.subscribe_to_broadcasts = Mock(
+            side_effect=lambda topic, handler: self.receivers.__setitem__(topic, handler)
+        )
+        orchestrator.mcp_orchestrator = self
+
+    async def execute_workflow(self, workflow_id, workflow_def):
+        self.calls.append((workflow_id, [(task.id, task.agent_id) for task in workflow_def.tasks]))
+        run = self._running[workflow_id] = asyncio.ensure_future(self._run(workflow_id, workflow_def))
+        try:
+            return await asyncio.shield(run)
+        except asyncio.CancelledError:
+            run.cancel()
+            raise
+        finally:
+            self._running.pop(workflow_id, None)
+
+    async def cancel_workflow(self, workflow_id):
+        self.cancelled.append(workflow_id)
+        run = self._running.get(workflow_id)
+        if run is not None:
+            run.cancel()
+        return run is not None
+
+    async def _run(self, workflow_id, workflow_def):
+        results, files = {}, []
+        try:
+            for task in workflow_def.tasks:
+                event = {"workflow_id": workflow_id, "task_id": task.id, "agent_id": task.agent_id}
+                await self.receivers["task.started"](event)
+                if ":hedge:" in workflow_id:
+                    await asyncio.sleep(self.hedge_delay)
+                elif task.id == self.straggler:
+                    await asyncio.wait_for(asyncio.Event().wait(), self.straggle_for)
+                results[task.id] = f"{task.id}@{task.agent_id}"
+                files.append(f"{task.id}.py")
+                await self.receivers["task.completed"](
+                    {**event, "result": results[task.id], "generated_files": [f"{task.id}.py"]}
+                )
+        except asyncio.TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            return SimpleNamespace(success=False, error="cancelled", generated_files=[])
+        return SimpleNamespace(
+            success=True, error=None, generated_files=files, metadata={}, task_results=results
+        )
+
+
+async def _hedging_orchestrator(backend, agents):
+    orchestrator = CoreOrchestrator(OrchestratorConfig(
+        hedging_enabled=True, hedge_min_samples=3, hedge_budget=1.0
+    ))
+    backend.install(orchestrator)
+    orchestrator.agent_registry = Mock()
+    orchestrator.agent_registry.list_agents.return_value = agents
+    for _ in range(3):
+        orchestrator.telemetry.observe("task_seconds", 0.005, task_id="generate_backend")
+    await orchestrator.start()
+    return orchestrator
+
+
+class TestHedgingPolicy:
+    """Test suite for hedging thresholds, budget and instance choice"""
+
+    def test_threshold_needs_history(self):
+        """Test no hedging delay until enough samples were observed"""
+        policy = HedgingPolicy(quantile=0.5, min_samples=3, min_delay=0.001)
+        history = LatencyHistogram()
+        history.observe(0.2)
+        history.observe(0.2)
+
+        assert policy.delay(history) is None
+        history.observe(0.2)
+        assert 0.1 <= policy.delay(history) <= 0.25
+
+    def test_budget_bounds_extra_load(self):
+        """Test hedges per task stay within budget * executions"""
+        policy = HedgingPolicy(budget=0.1)
+        for _ in range(20):
+            policy.record_execution("generate_backend")
+
+        granted = [policy.acquire("generate_backend") for _ in range(5)]
+
+        assert granted == [True, True, False, False, False]
+        assert not policy.acquire("generate_frontend")
+        assert policy.stats()["skipped_budget"] == 4
+
+    def test_alternate_instance_of_same_type(self):
+        """Test duplicates go to another instance of the same agent type"""
+        policy = HedgingPolicy()
+        available = ["backend_agent", "backend_agent:2", "frontend_agent:2"]
+
+        assert agent_type("backend_agent:2") == "backend_agent"
+        assert policy.alternate("backend_agent", available) == "backend_agent:2"
+        assert policy.alternate("frontend_agent:2", available) is None
+        assert policy.stats()["skipped_no_instance"] == 1
+
+
+class TestOrchestratorHedging:
+    """Test suite for hedged execution of straggling tasks"""
+
+    @pytest.mark.asyncio
+    async def test_hedge_wins_and_workflow_continues(self, sample_generation_request):
+        """Test a winning duplicate replaces the straggler without repeating finished tasks"""
+        backend = StragglingBackend("generate_backend")
+        orchestrator = await _hedging_orchestrator(backend, AGENTS + ["backend_agent:2"])
+
+        result = await asyncio.wait_for(
+            orchestrator.execute_project_generation(sample_generation_request), 5
+        )
+        metrics = orchestrator.get_metrics()
+        await orchestrator.stop()
+
+        assert result.success
+        workflow_id = result.workflow_id
+        hedge_id = f"{workflow_id}:hedge:generate_backend"
+        assert [call[0] for call in backend.calls] == [workflow_id, hedge_id, workflow_id]
+        assert backend.calls[1][1] == [("generate_backend", "backend_agent:2")]
+        relaunched = [task_id for task_id, _ in backend.calls[2][1]]
+        assert "generate_backend" not in relaunched
+        assert "design_architecture" not in relaunched
+        assert "generate_backend.py" in result.generated_files
+        assert "design_architecture.py" in result.generated_files
+        assert metrics["hedging_won"] == 1
+        assert orchestrator.get_workflow_status(workflow_id)["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_primary_wins_and_hedge_is_cancelled(self, sample_generation_request):
+        """Test the duplicate is cancelled when the original finishes first"""
+        backend = StragglingBackend("generate_backend", straggle_for=0.05, hedge_delay=5)
+        orchestrator = await _hedging_orchestrator(backend, AGENTS + ["backend_agent:2"])
+
+        result = await asyncio.wait_for(
+            orchestrator.execute_project_generation(sample_generation_request), 5
+        )
+        await asyncio.sleep(0.01)
+        metrics = orchestrator.get_metrics()
+        await orchestrator.stop()
+
+        assert result.success
+        assert backend.cancelled == [f"{result.workflow_id}:hedge:generate_backend"]
+        assert [call[0] for call in backend.calls].count(result.workflow_id) == 1
+        assert metrics["hedging_lost"] == 1
+        assert metrics["hedging_won"] == 0
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_another_instance(self, sample_generation_request):
+        """Test a single instance per agent type is never duplicated"""
+        backend = StragglingBackend("generate_backend", straggle_for=0.05)
+        orchestrator = await _hedging_orchestrator(backend, AGENTS)
+
+        result = await orchestrator.execute_project_generation(sample_generation_request)
+        metrics = orchestrator.get_metrics()
+        await orchestrator.stop()
+
+        assert result.success
+        assert len(backend.calls) == 1
+        assert metrics["hedging_launched"] == 0
+        assert metrics["hedging_skipped_no_instance"] == 1
@@ -0,0 +1,184 @@
+# tests/unit/test_incremental.py
+import pytest
+from unittest.mock import AsyncMock
+
+from genesis_core.orchestrator.incremental import (
+    GenerationSnapshot,
+    diff_configs,
+    plan_incremental,
+)
+from genesis_core.orchestrator.workflow_builder import compile_workflow, workflow_key
+
+
+ALL_RESULTS = {
+    "analyze_architecture": "req",
+    "design_architecture": "arch",
+    "generate_backend": "backend",
+    "generate_frontend": "frontend",
+    "setup_devops": "devops",
+}
+
+
+def _with_stack(config, **stack):
+    return config.model_copy(update={"stack": config.stack.model_copy(update=stack)})
+
+
+class TestDiffConfigs:
+    """Test suite for ProjectConfig diffing"""
+
+    def test_nested_stack_fields(self, sample_project_config):
+        """Test stack changes are reported per field"""
+        old = sample_project_config.to_dict()
+        new = _with_stack(sample_project_config, cache="memcached").to_dict()
+
+        assert diff_configs(old, new) == {"stack.cache"}
+
+    def test_unordered_lists(self, sample_project_config):
+        """Test reordering features is not a change"""
+        old = sample_project_config.to_dict()
+        new = dict(old, features=list(reversed(old["features"])))
+
+        assert diff_configs(old, new) == set()
+
+
+class TestPlanIncremental:
+    """Test suite for incremental regeneration planning"""
+
+    def test_reruns_impacted_task_and_dependents(self, sample_project_config):
+        """Test a backend stack change reruns backend and devops only"""
+        compiled = compile_workflow(*workflow_key(sample_project_config))
+        snapshot = GenerationSnapshot(
+            sample_project_config.to_dict(), "/tmp/out", dict(ALL_RESULTS)
+        )
+        new = _with_stack(sample_project_config, database="mysql").to_dict()
+
+        plan = plan_incremental(compiled, snapshot, new)
+
+        assert plan.changed_fields == ("stack.database",)
+        assert plan.rerun == ("generate_backend", "setup_devops")
+        assert set(plan.reused) == {
+            "analyze_architecture", "design_architecture", "generate_frontend"
+        }
+        assert not plan.full
+
+    def test_unmapped_field_forces_full_regeneration(self, sample_project_config):
+        """Test fields that affect the architecture rerun everything"""
+        compiled = compile_workflow(*workflow_key(sample_project_config))
+        snapshot = GenerationSnapshot(
+            sample_project_config.to_dict(), "/tmp/out", dict(ALL_RESULTS)
+        )
+        new = dict(sample_project_config.to_dict(), name="renamed")
+
+        plan = plan_incremental(compiled, snapshot, new)
+
+        assert plan.full
+        assert plan.rerun == compiled.topological_order
+        assert plan.seeded_results == {}
+
+    def test_missing_previous_results_forces_full(self, sample_project_config):
+        """Test reuse requires results for every reused task"""
+        compiled = compile_workflow(*workflow_key(sample_project_config))
+        snapshot = GenerationSnapshot(sample_project_config.to_dict(), "/tmp/out", {})
+        new = _with_stack(sample_project_config, frontend="vue").to_dict()
+
+        plan = plan_incremental(compiled, snapshot, new)
+
+        assert plan.full
+
+    def test_metadata_change_needs_no_rerun(self, sample_project_config):
+        """Test metadata-only changes reuse everything"""
+        compiled = compile_workflow(*workflow_key(sample_project_config))
+        snapshot = GenerationSnapshot(
+            sample_project_config.to_dict(), "/tmp/out", dict(ALL_RESULTS)
+        )
+        new = dict(sample_project_config.to_dict(), metadata={"owner": "me"})
+
+        plan = plan_incremental(compiled, snapshot, new)
+
+        assert plan.rerun == ()
+
+
+class TestIncrementalGeneration:
+    """Test suite for CoreOrchestrator.execute_incremental_generation"""
+
+    @pytest.mark.asyncio
+    async def test_only_impacted_tasks_are_executed(self, orchestrator, sample_generation_request):
+        """Test the second run seeds unchanged results and merges files"""
+        mock_result = AsyncMock()
+        mock_result.success = True
+        mock_result.generated_files = ["backend/app.py", "frontend/index.tsx"]
+        mock_result.metadata = {}
+        mock_result.task_results = dict(ALL_RESULTS)
+
+        orchestrator.mcp_orchestrator.execute_workflow.return_value = mock_result
+        orchestrator.agent_registry.list_agents.return_value = [
+            "architect_agent", "backend_agent", "frontend_agent", "devops_agent"
+        ]
+
+        first = await orchestrator.execute_project_generation(sample_generation_request)
+        assert first.success
+
+        mock_result.generated_files = ["backend/app.py", "backend/db.py"]
+        mock_result.task_results = {"generate_backend": "backend2", "setup_devops": "devops2"}
+        new_config = _with_stack(sample_generation_request.project_config, database="mysql")
+
+        second = await orchestrator.execute_incremental_generation(first.workflow_id, new_config)
+
+        assert second.success
+        assert second.metadata["rerun_tasks"] == ["generate_backend", "setup_devops"]
+        assert second.generated_files == [
+            "backend/app.py", "frontend/index.tsx", "backend/db.py"
+        ]
+
+        workflow_def = orchestrator.mcp_orchestrator.execute_workflow.call_args[0][1]
+        tasks = {task.id: task for task in workflow_def.tasks}
+        assert set(tasks) == {"generate_backend", "setup_devops"}
+        assert tasks["generate_backend"].params["architecture"] == "arch"
+        assert tasks["generate_backend"].params["changed_fields"] == ["stack.database"]
+
+    @pytest.mark.asyncio
+    async def test_files_dropped_by_rerun_task_are_not_carried(
+        self, orchestrator, sample_generation_request
+    ):
+        """Test a rerun task that stops emitting a file no longer reports it"""
+        emitted = {
+            "generate_backend": ["backend/app.py", "backend/legacy.py"],
+            "generate_frontend": ["frontend/index.tsx"],
+        }
+
+        async def execute_workflow(workflow_id, workflow_def):
+            files = []
+            for task in workflow_def.tasks:
+                task_files = emitted.get(task.id, [])
+                files.extend(task_files)
+                await orchestrator._handle_task_completed({
+                    "workflow_id": workflow_id, "task_id": task.id,
+                    "result": ALL_RESULTS[task.id], "generated_files": task_files,
+                })
+            return AsyncMock(
+                success=True, generated_files=files, metadata={}, task_results=dict(ALL_RESULTS)
+            )
+
+        orchestrator.mcp_orchestrator.execute_workflow.side_effect = execute_workflow
+        orchestrator.agent_registry.list_agents.return_value = [
+            "architect_agent", "backend_agent", "frontend_agent", "devops_agent"
+        ]
+        first = await orchestrator.execute_project_generation(sample_generation_request)
+
+        emitted["generate_backend"] = ["backend/app.py"]
+        new_config = _with_stack(sample_generation_request.project_config, database="mysql")
+        second = await orchestrator.execute_incremental_generation(first.workflow_id, new_config)
+
+        assert second.success
+        assert sorted(second.generated_files) == ["backend/app.py", "frontend/index.tsx"]
+        snapshot = orchestrator.snapshots.get(second.workflow_id)
+        assert snapshot.task_files["generate_frontend"] == ("frontend/index.tsx",)
+        assert snapshot.task_files["generate_backend"] == ("backend/app.py",)
+
+    @pytest.mark.asyncio
+    async def test_unknown_previous_workflow(self, orchestrator, sample_project_config):
+        """Test incremental generation needs a recorded snapshot"""
+        result = await orchestrator.execute_incremental_generation("missing", sample_project_config)
+
+        assert not result.success
+        assert "No reusable results" in result.error
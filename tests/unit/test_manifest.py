@@ -0,0 +1,113 @@
+# tests/unit/test_manifest.py
+import pytest
+from unittest.mock import AsyncMock
+
+from genesis_core.config.orchestrator_config import OrchestratorConfig
+from genesis_core.orchestrator.core_orchestrator import CoreOrchestrator
+from genesis_core.orchestrator.manifest import FileManifest, ManifestWriter
+
+
+class TestFileManifest:
+    """Test suite for the on-disk file manifest"""
+
+    def test_write_and_query(self, tmp_path):
+        """Test iteration, membership, prefix queries and hashing"""
+        root = tmp_path / "project"
+        (root / "backend").mkdir(parents=True)
+        (root / "backend" / "app.py").write_text("print('hi')\n")
+
+        writer = ManifestWriter(str(tmp_path / "wf.manifest"), root=str(root))
+        writer.add_files(["backend/app.py", "frontend/index.tsx", "backend/app.py"])
+        writer.append("backend/db.py", 10, "ab" * 32)
+        writer.close()
+
+        manifest = FileManifest(writer.path)
+        entries = {entry.path: entry for entry in manifest.entries()}
+
+        assert list(manifest) == ["backend/app.py", "frontend/index.tsx", "backend/db.py"]
+        assert len(manifest) == 3
+        assert "frontend/index.tsx" in manifest
+        assert "frontend" not in manifest
+        assert list(manifest.with_prefix("backend/")) == ["backend/app.py", "backend/db.py"]
+        assert entries["backend/app.py"].size == 12
+        assert len(entries["backend/app.py"].sha256) == 64
+        assert entries["frontend/index.tsx"].size == -1
+
+    def test_reopen_continues_existing_manifest(self, tmp_path):
+        """Test reopening a workflow's manifest neither duplicates records nor headers"""
+        path = str(tmp_path / "wf.manifest")
+        writer = ManifestWriter(path)
+        writer.append("backend/app.py", 1, "aa" * 32)
+        writer.close()
+        with open(path, "ab") as fh:
+            fh.write(b"backend/half")
+
+        writer = ManifestWriter(path)
+        assert len(writer._seen) == 1
+        assert "backend/app.py" not in writer._seen
+        writer.append("backend/app.py", 1, "aa" * 32)
+        writer.append("frontend/index.tsx", 2, "bb" * 32)
+        writer.close()
+
+        manifest = FileManifest(path)
+        assert list(manifest) == ["backend/app.py", "frontend/index.tsx"]
+        assert len(manifest) == 2
+        with open(path, "rb") as fh:
+            assert fh.read().count(b"genesis-manifest") == 1
+
+    def test_rejects_invalid_paths(self, tmp_path):
+        """Test record separators cannot appear in paths"""
+        writer = ManifestWriter(str(tmp_path / "wf.manifest"))
+
+        with pytest.raises(ValueError):
+            writer.append("bad\npath", 0, "")
+        writer.close()
+
+    def test_rejects_foreign_files(self, tmp_path):
+        """Test reading a file without the manifest header fails"""
+        path = tmp_path / "other.txt"
+        path.write_text("not a manifest\n")
+
+        with pytest.raises(ValueError):
+            list(FileManifest(str(path)))
+
+
+class TestOrchestratorManifest:
+    """Test suite for manifest output in CoreOrchestrator"""
+
+    @pytest.mark.asyncio
+    async def test_result_exposes_manifest(self, tmp_path, sample_generation_request):
+        """Test task events and final files end up in the manifest"""
+        orchestrator = CoreOrchestrator(OrchestratorConfig(manifest_dir=str(tmp_path)))
+        orchestrator.mcp_protocol = AsyncMock()
+        orchestrator.mcp_orchestrator = AsyncMock()
+        orchestrator.agent_registry = AsyncMock()
+        orchestrator.agent_registry.list_agents.return_value = [
+            "architect_agent", "backend_agent", "frontend_agent", "devops_agent"
+        ]
+
+        mock_result = AsyncMock()
+        mock_result.success = True
+        mock_result.generated_files = ["backend/app.py", "frontend/index.tsx"]
+        mock_result.metadata = {}
+
+        async def execute_workflow(workflow_id, workflow_def):
+            await orchestrator._handle_task_completed({
+                "workflow_id": workflow_id,
+                "task_id": "generate_backend",
+                "generated_files": ["backend/app.py"],
+            })
+            return mock_result
+
+        orchestrator.mcp_orchestrator.execute_workflow.side_effect = execute_workflow
+
+        await orchestrator.start()
+        try:
+            result = await orchestrator.execute_project_generation(sample_generation_request)
+        finally:
+            await orchestrator.stop()
+
+        assert result.success
+        assert result.generated_files == []
+        assert list(result.manifest) == ["backend/app.py", "frontend/index.tsx"]
+        assert not orchestrator._manifest_writers
@@ -0,0 +1,88 @@
+# tests/unit/test_metrics.py
+import pytest
+from unittest.mock import AsyncMock
+
+from genesis_core.orchestrator.metrics import LatencyHistogram, MetricsRegistry
+
+
+class TestLatencyHistogram:
+    """Test suite for fixed-bucket latency histograms"""
+
+    def test_observe_and_quantiles(self):
+        """Test observations land in buckets and quantiles interpolate"""
+        histogram = LatencyHistogram((1.0, 2.0, 4.0))
+        for value in (0.5, 1.0, 1.5, 3.0, 10.0):
+            histogram.observe(value)
+
+        assert histogram.counts == [2, 1, 1, 1]
+        assert histogram.count == 5
+        assert histogram.mean == pytest.approx(3.2)
+        assert 1.0 <= histogram.quantile(0.5) <= 2.0
+        assert histogram.quantile(1.0) == 4.0
+        assert list(histogram.cumulative())[-1] == (float("inf"), 5)
+
+
+class TestMetricsRegistry:
+    """Test suite for labelled metrics and Prometheus export"""
+
+    def test_render_prometheus(self):
+        """Test counters, histograms and gauges use the text format"""
+        registry = MetricsRegistry(buckets=(1.0,))
+        registry.describe("generations_total", "Generations by outcome")
+        registry.inc("generations_total", outcome="success")
+        registry.inc("generations_total", outcome="success")
+        registry.observe("task_seconds", 0.5, task_id="generate_backend")
+
+        text = registry.render_prometheus(gauges={"active_workflows": 2, "running": True})
+
+        assert "# HELP genesis_generations_total Generations by outcome" in text
+        assert 'genesis_generations_total{outcome="success"} 2' in text
+        assert "# TYPE genesis_task_seconds histogram" in text
+        assert 'genesis_task_seconds_bucket{task_id="generate_backend",le="1.0"} 1' in text
+        assert 'genesis_task_seconds_bucket{task_id="generate_backend",le="+Inf"} 1' in text
+        assert 'genesis_task_seconds_count{task_id="generate_backend"} 1' in text
+        assert "genesis_active_workflows 2" in text
+        assert "genesis_running 1" in text
+
+
+class TestOrchestratorMetrics:
+    """Test suite for orchestrator latency and outcome metrics"""
+
+    @pytest.mark.asyncio
+    async def test_outcomes_and_task_latency(self, orchestrator, sample_generation_request):
+        """Test success, failure and per-task latencies are recorded"""
+        mock_result = AsyncMock()
+        mock_result.success = True
+        mock_result.generated_files = []
+        mock_result.metadata = {}
+
+        async def execute_workflow(workflow_id, workflow_def):
+            event = {"workflow_id": workflow_id, "task_id": "generate_backend"}
+            await orchestrator._handle_task_started(event)
+            await orchestrator._handle_task_completed(event)
+            return mock_result
+
+        orchestrator.mcp_orchestrator.execute_workflow.side_effect = execute_workflow
+        orchestrator.agent_registry.list_agents.return_value = [
+            "architect_agent", "backend_agent", "frontend_agent", "devops_agent"
+        ]
+
+        await orchestrator.execute_project_generation(sample_generation_request)
+        mock_result.success = False
+        mock_result.error = "boom"
+        await orchestrator.execute_project_generation(sample_generation_request)
+
+        metrics = orchestrator.get_metrics()
+        assert metrics["workflows_executed"] == 2
+        assert metrics["generations_success"] == 1
+        assert metrics["generations_failure"] == 1
+        assert metrics["success_rate"] == 0.5
+        assert metrics["average_execution_time"] > 0
+
+        agent_latency = orchestrator.telemetry.histograms("agent_seconds")
+        assert list(agent_latency) == [(("agent_id", "backend_agent"),)]
+        assert not orchestrator._task_started
+
+        text = orchestrator.export_prometheus()
+        assert 'genesis_phase_seconds_count{phase="execute"} 2' in text
+        assert "genesis_workflows_executed 2" in text
@@ -0,0 +1,156 @@
+# tests/unit/test_output_sink.py
+import hashlib
+import os
+import pytest
+from dataclasses import replace
+from unittest.mock import AsyncMock, Mock
+
+from genesis_core.config.orchestrator_config import OrchestratorConfig
+from genesis_core.orchestrator.core_orchestrator import CoreOrchestrator
+from genesis_core.orchestrator.output_sink import OutputSink
+
+DOCKERFILE = b"FROM python:3.11-slim\nCOPY . /app\n"
+
+
+def _write_tree(root, files):
+    for path, content in files.items():
+        location = os.path.join(root, path)
+        os.makedirs(os.path.dirname(location), exist_ok=True)
+        with open(location, "wb") as fh:
+            fh.write(content)
+
+
+class TestOutputSink:
+    """Test suite for the content-deduplicated output sink"""
+
+    def test_identical_files_share_one_blob(self, tmp_path):
+        """Test equal files across projects are hardlinked to a single blob"""
+        sink = OutputSink(str(tmp_path / "store"))
+        for name in ("one", "two"):
+            _write_tree(tmp_path / name, {"Dockerfile": DOCKERFILE, "app.py": name.encode()})
+            sink.ingest(str(tmp_path / name), ["Dockerfile", "app.py"])
+
+        first, second = tmp_path / "one" / "Dockerfile", tmp_path / "two" / "Dockerfile"
+        assert os.path.samefile(first, second)
+        assert second.read_bytes() == DOCKERFILE
+        assert not os.path.samefile(tmp_path / "one" / "app.py", tmp_path / "two" / "app.py")
+        stats = sink.stats()
+        assert stats["files"] == 4
+        assert stats["deduplicated"] == 1
+        assert stats["stored_bytes"] == len(DOCKERFILE) + 6
+        assert stats["dedup_ratio"] == pytest.approx(len(DOCKERFILE) / (2 * len(DOCKERFILE) + 6))
+
+    def test_ingest_returns_digests_and_skips_missing(self, tmp_path):
+        """Test digests are reported for the manifest and missing files are counted"""
+        sink = OutputSink(str(tmp_path / "store"), fsync=False)
+        _write_tree(tmp_path / "project", {"ci.yml": b"on: push\n"})
+
+        digests = sink.ingest(str(tmp_path / "project"), ["ci.yml", "gone.txt"])
+
+        size, sha256 = digests["ci.yml"]
+        assert size == 9
+        assert os.path.exists(sink.blob_path(sha256))
+        assert "gone.txt" not in digests
+        assert sink.stats()["missing"] == 1
+
+    def test_write_batches_directories_and_fsyncs(self, tmp_path):
+        """Test writes go through the store with one fsync pass per batch"""
+        sink = OutputSink(str(tmp_path / "store"), link="reflink", batch_size=2)
+        files = {f"svc{n}/Dockerfile": DOCKERFILE for n in range(3)}
+
+        report = sink.write(str(tmp_path / "project"), files)
+
+        assert report.files == 3
+        assert report.deduplicated == 2
+        assert report.throughput > 0
+        assert (tmp_path / "project" / "svc2" / "Dockerfile").read_bytes() == DOCKERFILE
+        stats = sink.stats()
+        assert stats["batches"] == 2
+        assert stats["linked"] == 0
+        assert stats["copied"] == 3
+
+    def test_prune_removes_unreferenced_blobs(self, tmp_path):
+        """Test blobs no project links to anymore are deleted"""
+        sink = OutputSink(str(tmp_path / "store"))
+        sink.write(str(tmp_path / "project"), {"Dockerfile": DOCKERFILE})
+
+        assert sink.prune() == 0
+        os.unlink(tmp_path / "project" / "Dockerfile")
+        assert sink.prune() == 1
+
+    def test_prune_keeps_reflinked_blobs_and_pending_writes(self, tmp_path):
+        """Test prune never deletes blobs in reflink mode or temporary files"""
+        reflinked = OutputSink(str(tmp_path / "clones"), link="reflink")
+        reflinked.write(str(tmp_path / "cloned"), {"Dockerfile": DOCKERFILE})
+        sink = OutputSink(str(tmp_path / "store"))
+        pending = tmp_path / "store" / "ab" / "ab.pending.tmp"
+        pending.parent.mkdir()
+        pending.write_bytes(DOCKERFILE)
+
+        assert reflinked.prune() == 0
+        assert len(list((tmp_path / "clones").rglob("*"))) == 2
+        assert sink.prune() == 0
+        assert pending.exists()
+
+
+    @pytest.mark.parametrize("mode", ["write", "ingest"])
+    def test_blob_pruned_before_linking_is_restored(self, tmp_path, mode):
+        """Test a blob deleted by a concurrent prune is restored instead of failing"""
+        sink = OutputSink(str(tmp_path / "store"), fsync=False)
+        sink.write(str(tmp_path / "one"), {"Dockerfile": DOCKERFILE})
+        os.unlink(tmp_path / "one" / "Dockerfile")
+        materialize, pruned = sink._materialize, []
+
+        def prune_then_materialize(blob, target, batch):
+            if not pruned:
+                pruned.append(sink.prune())
+            materialize(blob, target, batch)
+
+        sink._materialize = prune_then_materialize
+        if mode == "write":
+            sink.write(str(tmp_path / "two"), {"Dockerfile": DOCKERFILE})
+        else:
+            _write_tree(tmp_path / "two", {"Dockerfile": DOCKERFILE})
+            sink.ingest(str(tmp_path / "two"), ["Dockerfile"])
+
+        target = tmp_path / "two" / "Dockerfile"
+        assert pruned == [1]
+        assert target.read_bytes() == DOCKERFILE
+        assert os.path.samefile(target, sink.blob_path(hashlib.sha256(DOCKERFILE).hexdigest()))
+        assert sink.stats()["restored"] == 1
+
+
+class TestOrchestratorOutputSink:
+    """Test suite for output deduplication after generation"""
+
+    @pytest.mark.asyncio
+    async def test_generated_files_are_deduplicated(self, tmp_path, sample_generation_request):
+        """Test generated files go through the sink and feed the manifest"""
+        orchestrator = CoreOrchestrator(OrchestratorConfig(
+            output_sink_dir=str(tmp_path / "store"), manifest_dir=str(tmp_path / "manifests")
+        ))
+        orchestrator.mcp_protocol = AsyncMock()
+        orchestrator.mcp_orchestrator = AsyncMock()
+        orchestrator.agent_registry = Mock()
+        orchestrator.agent_registry.list_agents.return_value = [
+            "architect_agent", "backend_agent", "frontend_agent", "devops_agent"
+        ]
+        orchestrator.mcp_orchestrator.execute_workflow.return_value = AsyncMock(
+            success=True, generated_files=["Dockerfile", "backend/main.py"], metadata={}
+        )
+        await orchestrator.start()
+
+        for name in ("one", "two"):
+            output_path = str(tmp_path / name)
+            _write_tree(output_path, {"Dockerfile": DOCKERFILE, "backend/main.py": name.encode()})
+            result = await orchestrator.execute_project_generation(
+                replace(sample_generation_request, output_path=output_path)
+            )
+        metrics = orchestrator.get_metrics()
+        await orchestrator.stop()
+
+        assert os.path.samefile(tmp_path / "one" / "Dockerfile", tmp_path / "two" / "Dockerfile")
+        assert metrics["output_sink_files"] == 4
+        assert metrics["output_sink_deduplicated"] == 1
+        entries = {entry.path: entry for entry in result.manifest.entries()}
+        assert entries["Dockerfile"].size == len(DOCKERFILE)
@@ -0,0 +1,72 @@
+# tests/unit/test_parallelism.py
+import pytest
+from unittest.mock import AsyncMock
+
+from genesis_core.orchestrator.parallelism import ParallelismPlanner
+
+
+class TestParallelismPlanner:
+    """Test suite for adaptive workflow parallelism"""
+
+    def test_small_dag_gets_its_width(self):
+        """Test an idle planner grants the DAG width"""
+        planner = ParallelismPlanner(global_budget=64)
+
+        decision = planner.plan("wf-1", dag_width=2, agent_demand={"backend_agent": 1, "frontend_agent": 1})
+
+        assert decision.effective == 2
+        assert decision.limited_by == "dag_width"
+
+    def test_global_budget_limits_concurrent_workflows(self):
+        """Test later workflows share what is left of the global budget"""
+        planner = ParallelismPlanner(global_budget=3)
+        planner.plan("wf-1", dag_width=2, agent_demand={"a": 2})
+
+        decision = planner.plan("wf-2", dag_width=2, agent_demand={"a": 2})
+        exhausted = planner.plan("wf-3", dag_width=2, agent_demand={"a": 2})
+
+        assert decision.effective == 1
+        assert decision.limited_by == "global_budget"
+        assert exhausted.effective == 1
+        assert exhausted.global_in_use == 3
+
+    def test_agent_capacity_limits_parallelism(self):
+        """Test busy agent types reduce the grant"""
+        planner = ParallelismPlanner(global_budget=64, agent_capacity={"backend_agent": 1})
+        planner.plan("wf-1", dag_width=1, agent_demand={"backend_agent": 1})
+
+        decision = planner.plan("wf-2", dag_width=2, agent_demand={"backend_agent": 1, "frontend_agent": 1})
+
+        assert decision.agent_headroom["backend_agent"] == 0
+        assert decision.effective == 1
+        assert decision.limited_by == "agent_capacity"
+
+    def test_release_returns_budget(self):
+        """Test finished workflows give their share back"""
+        planner = ParallelismPlanner(global_budget=2)
+        planner.plan("wf-1", dag_width=2, agent_demand={"a": 2})
+        planner.release("wf-1")
+
+        assert planner.stats()["in_use"] == 0
+        assert planner.plan("wf-2", dag_width=2, agent_demand={"a": 2}).effective == 2
+
+    @pytest.mark.asyncio
+    async def test_workflow_definition_uses_decision(self, orchestrator, sample_generation_request):
+        """Test the MCPturbo workflow gets the computed parallelism"""
+        mock_result = AsyncMock()
+        mock_result.success = True
+        mock_result.generated_files = []
+        mock_result.metadata = {}
+
+        orchestrator.mcp_orchestrator.execute_workflow.return_value = mock_result
+        orchestrator.agent_registry.list_agents.return_value = [
+            "architect_agent", "backend_agent", "frontend_agent", "devops_agent"
+        ]
+
+        result = await orchestrator.execute_project_generation(sample_generation_request)
+        workflow_def = orchestrator.mcp_orchestrator.execute_workflow.call_args.args[1]
+        status = orchestrator.get_workflow_status(result.workflow_id)
+
+        assert workflow_def.max_parallel_tasks == 2
+        assert status["parallelism"]["dag_width"] == 2
+        assert orchestrator.get_metrics()["parallelism_in_use"] == 0
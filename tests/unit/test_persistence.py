@@ -0,0 +1,167 @@
+# tests/unit/test_persistence.py
+import asyncio
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+from genesis_core.config.orchestrator_config import OrchestratorConfig
+from genesis_core.orchestrator.core_orchestrator import CoreOrchestrator
+from genesis_core.state.persistence import StatePersistence
+from genesis_core.state.project_state import ProjectState
+from genesis_core.state.workflow_state import WorkflowState
+
+
+def _states(config, workflow_id="wf-1"):
+    project = ProjectState(
+        name=config.name,
+        template=config.template,
+        config=config,
+        output_path="/tmp/out",
+        created_at=datetime.utcnow()
+    )
+    workflow = WorkflowState(
+        workflow_id=workflow_id,
+        definition=None,
+        project_state=project,
+        status="running",
+        started_at=project.created_at
+    )
+    return project, workflow
+
+
+class TestStatePersistence:
+    """Test suite for write-behind state persistence"""
+
+    @pytest.mark.asyncio
+    async def test_coalesces_updates_until_flush(self, tmp_path, sample_project_config):
+        """Test repeated workflow updates collapse into one row"""
+        persistence = StatePersistence(
+            f"sqlite:///{tmp_path / 'state.db'}", batch_size=1000, flush_interval=60
+        )
+        await persistence.start()
+        project, workflow = _states(sample_project_config)
+
+        persistence.record_project("wf-1", project)
+        persistence.record_workflow("wf-1", workflow)
+        persistence.record_task("wf-1", "analyze_architecture", "started")
+        workflow.status = "completed"
+        persistence.record_workflow("wf-1", workflow)
+
+        assert persistence.pending == 3
+        assert await persistence.load_workflow("wf-1") is None
+
+        assert await persistence.flush() == 3
+        stored = await persistence.load_workflow("wf-1")
+        await persistence.stop()
+
+        assert stored["workflow"]["status"] == "completed"
+        assert stored["project"]["config"]["name"] == "test-project"
+        assert stored["task_transitions"][0]["task_id"] == "analyze_architecture"
+        assert persistence.stats()["coalesced"] == 1
+
+    @pytest.mark.asyncio
+    async def test_size_trigger_flushes_in_background(self, tmp_path, sample_project_config):
+        """Test reaching batch_size wakes the flusher without waiting for the interval"""
+        persistence = StatePersistence(
+            f"sqlite:///{tmp_path / 'state.db'}", batch_size=5, flush_interval=60
+        )
+        await persistence.start()
+
+        for index in range(5):
+            persistence.record_task("wf-1", f"task-{index}", "completed")
+        for _ in range(100):
+            if persistence.stats()["flushes"]:
+                break
+            await asyncio.sleep(0.01)
+        stats = persistence.stats()
+        await persistence.stop()
+
+        assert stats["flushes"] == 1
+        assert stats["rows_written"] == 5
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_pending_rows(self, tmp_path, sample_project_config):
+        """Test stop() writes everything still buffered"""
+        url = f"sqlite:///{tmp_path / 'state.db'}"
+        persistence = StatePersistence(url, batch_size=1000, flush_interval=60)
+        await persistence.start()
+        project, workflow = _states(sample_project_config)
+        persistence.record_workflow("wf-1", workflow)
+        await persistence.stop()
+
+        reader = StatePersistence(url)
+        stored = await reader.load_workflow("wf-1")
+
+        assert stored["workflow"]["status"] == "running"
+
+
+class TestOrchestratorPersistence:
+    """Test suite for orchestrator state persistence"""
+
+    @pytest.mark.asyncio
+    async def test_failed_flushes_keep_a_bounded_backlog(self, tmp_path, sample_project_config):
+        """Test an unreachable database drops the oldest transitions beyond the cap"""
+        persistence = StatePersistence(
+            f"sqlite:///{tmp_path / 'state.db'}",
+            batch_size=1000, flush_interval=60, max_pending=4,
+        )
+        await persistence.start()
+        project, workflow = _states(sample_project_config)
+        write_batch = persistence._write_batch
+
+        def unreachable(*batch):
+            raise ConnectionError("database is down")
+
+        persistence._write_batch = unreachable
+        persistence.record_project("wf-1", project)
+        persistence.record_workflow("wf-1", workflow)
+        for index in range(10):
+            persistence.record_task("wf-1", f"task-{index}", "started")
+
+        assert await persistence.flush() == 0
+        assert persistence.pending == 4
+        assert persistence.stats()["dropped_rows"] == 8
+
+        persistence._write_batch = write_batch
+        assert await persistence.flush() == 4
+        stored = await persistence.load_workflow("wf-1")
+        await persistence.stop()
+
+        assert stored["workflow"]["status"] == "running"
+        assert [row["task_id"] for row in stored["task_transitions"]] == ["task-8", "task-9"]
+
+    @pytest.mark.asyncio
+    async def test_generation_state_is_persisted(self, tmp_path, sample_generation_request):
+        """Test project, workflow and task transitions reach the database"""
+        orchestrator = CoreOrchestrator(OrchestratorConfig(
+            persistence_url=f"sqlite:///{tmp_path / 'state.db'}",
+            persistence_flush_interval=60
+        ))
+        orchestrator.mcp_protocol = AsyncMock()
+        orchestrator.mcp_orchestrator = AsyncMock()
+        orchestrator.agent_registry = AsyncMock()
+        orchestrator.agent_registry.list_agents.return_value = [
+            "architect_agent", "backend_agent", "frontend_agent", "devops_agent"
+        ]
+
+        mock_result = AsyncMock()
+        mock_result.success = True
+        mock_result.generated_files = []
+        mock_result.metadata = {}
+
+        async def execute_workflow(workflow_id, workflow_def):
+            event = {"workflow_id": workflow_id, "task_id": "generate_backend"}
+            await orchestrator._handle_task_started(event)
+            await orchestrator._handle_task_completed(event)
+            return mock_result
+
+        orchestrator.mcp_orchestrator.execute_workflow.side_effect = execute_workflow
+
+        await orchestrator.start()
+        result = await orchestrator.execute_project_generation(sample_generation_request)
+        await orchestrator.stop()
+
+        stored = await orchestrator.persistence.load_workflow(result.workflow_id)
+        assert stored["workflow"]["status"] == "completed"
+        assert stored["project"]["name"] == "test-project"
+        assert [t["status"] for t in stored["task_transitions"]] == ["started", "completed"]
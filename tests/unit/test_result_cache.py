@@ -0,0 +1,73 @@
+# tests/unit/test_result_cache.py
+import pytest
+
+from genesis_core.orchestrator.result_cache import ArchitectureCache, canonical_hash
+
+
+class TestArchitectureCache:
+    """Test suite for the architecture result cache"""
+
+    def test_canonical_hash_ignores_key_order(self):
+        """Test hash is stable regardless of dict ordering"""
+        first = {"name": "app", "stack": {"backend": "fastapi", "cache": "redis"}}
+        second = {"stack": {"cache": "redis", "backend": "fastapi"}, "name": "app"}
+
+        assert canonical_hash(first) == canonical_hash(second)
+        assert canonical_hash(first) != canonical_hash({**first, "name": "other"})
+
+    @pytest.mark.asyncio
+    async def test_memory_hit_and_miss_counters(self):
+        """Test hits and misses are counted"""
+        cache = ArchitectureCache(max_entries=4)
+
+        assert await cache.lookup("key") is None
+        await cache.store("key", analysis={"a": 1}, design={"d": 1})
+        entry = await cache.lookup("key")
+
+        assert entry.design == {"d": 1}
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """Test least recently used entry is evicted first"""
+        cache = ArchitectureCache(max_entries=2)
+        await cache.store("a", analysis=1, design=1)
+        await cache.store("b", analysis=2, design=2)
+        await cache.lookup("a")
+        await cache.store("c", analysis=3, design=3)
+
+        assert await cache.lookup("b") is None
+        assert await cache.lookup("a") is not None
+        assert cache.stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiration(self):
+        """Test expired entries are not returned"""
+        cache = ArchitectureCache(ttl=60)
+        entry = await cache.store("key", analysis=1, design=1)
+        entry.created_at -= 120
+
+        assert await cache.lookup("key") is None
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_new_instance(self, tmp_path):
+        """Test entries written to disk are found by a fresh cache"""
+        first = ArchitectureCache(directory=str(tmp_path))
+        await first.store("key", analysis={"a": 1}, design={"d": 1})
+
+        second = ArchitectureCache(directory=str(tmp_path))
+        entry = await second.lookup("key")
+
+        assert entry.analysis == {"a": 1}
+        assert second.stats()["disk_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disk_size_eviction(self, tmp_path):
+        """Test disk tier keeps at most max_disk_entries files"""
+        cache = ArchitectureCache(directory=str(tmp_path), max_disk_entries=2)
+        for key in ("a", "b", "c"):
+            await cache.store(key, analysis=key, design=key)
+
+        assert len(list(tmp_path.glob("*.json"))) == 2
@@ -0,0 +1,157 @@
+# tests/unit/test_retention.py
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+from genesis_core.config.orchestrator_config import OrchestratorConfig
+from genesis_core.orchestrator.core_orchestrator import CoreOrchestrator
+from genesis_core.orchestrator.retention import ArchivedWorkflow, WorkflowRetention
+from genesis_core.state.project_state import ProjectState
+from genesis_core.state.workflow_state import WorkflowState
+
+
+def _make_states(sample_project_config, workflow_id, created_at):
+    project_state = ProjectState(
+        name=sample_project_config.name,
+        template=sample_project_config.template,
+        config=sample_project_config,
+        output_path="/tmp/out",
+        created_at=created_at
+    )
+    workflow_state = WorkflowState(
+        workflow_id=workflow_id,
+        definition=None,
+        project_state=project_state,
+        status="completed",
+        started_at=created_at
+    )
+    return workflow_state, project_state
+
+
+class TestWorkflowRetention:
+    """Test suite for bounded workflow retention"""
+
+    def _populate(self, sample_project_config, count, created_at=None):
+        workflow_states, project_states = {}, {}
+        for index in range(count):
+            workflow_id = f"wf-{index}"
+            workflow_state, project_state = _make_states(
+                sample_project_config, workflow_id, created_at or datetime.utcnow()
+            )
+            workflow_states[workflow_id] = workflow_state
+            project_states[workflow_id] = project_state
+        return workflow_states, project_states
+
+    def test_cap_demotes_oldest_finished(self, sample_project_config):
+        """Test live entries beyond the cap are archived oldest first"""
+        retention = WorkflowRetention(max_live=2)
+        workflow_states, project_states = self._populate(sample_project_config, 4)
+
+        demoted = retention.enforce(workflow_states, project_states, active=set())
+
+        assert demoted == 2
+        assert list(workflow_states) == ["wf-2", "wf-3"]
+        assert retention.get("wf-0").workflow_status()["status"] == "completed"
+        assert retention.get("wf-1").project_status()["name"] == "test-project"
+
+    def test_active_workflows_are_never_demoted(self, sample_project_config):
+        """Test running workflows stay live even when over the cap"""
+        retention = WorkflowRetention(max_live=1)
+        workflow_states, project_states = self._populate(sample_project_config, 3)
+
+        retention.enforce(workflow_states, project_states, active={"wf-0"})
+
+        assert "wf-0" in workflow_states
+        assert retention.get("wf-0") is None
+
+    def test_age_demotes_finished_entries(self, sample_project_config):
+        """Test entries older than max_age are archived"""
+        retention = WorkflowRetention(max_live=100, max_age=60)
+        old = datetime.utcnow() - timedelta(minutes=5)
+        workflow_states, project_states = self._populate(sample_project_config, 2, old)
+
+        retention.enforce(workflow_states, project_states, active=set())
+
+        assert not workflow_states
+        assert len(retention) == 2
+
+    def test_archive_overflow_spills_to_disk(self, sample_project_config, tmp_path):
+        """Test archive overflow is spilled and still answerable"""
+        retention = WorkflowRetention(
+            max_live=0, max_archived=1, spill_path=str(tmp_path / "spill.jsonl")
+        )
+        workflow_states, project_states = self._populate(sample_project_config, 3)
+
+        retention.enforce(workflow_states, project_states, active=set())
+
+        assert len(retention) == 3
+        record = retention.get("wf-0")
+        assert isinstance(record, ArchivedWorkflow)
+        assert record.components == ("backend", "frontend")
+        assert retention.stats()["spilled"] == 2
+
+    def test_archive_overflow_evicts_without_spill(self, sample_project_config):
+        """Test archive overflow is dropped when no spill path is set"""
+        retention = WorkflowRetention(max_live=0, max_archived=1)
+        workflow_states, project_states = self._populate(sample_project_config, 3)
+
+        retention.enforce(workflow_states, project_states, active=set())
+
+        assert retention.get("wf-0") is None
+        assert retention.get("wf-2") is not None
+
+    def test_spill_index_is_capped_and_compacted(self, sample_project_config, tmp_path):
+        """Test spilled entries beyond the cap are dropped and the file compacted"""
+        spill_path = tmp_path / "spill.jsonl"
+        retention = WorkflowRetention(
+            max_live=0, max_archived=0, spill_path=str(spill_path), max_spilled=2
+        )
+        workflow_states, project_states = self._populate(sample_project_config, 6)
+
+        retention.enforce(workflow_states, project_states, active=set())
+
+        assert len(retention) == 2
+        assert retention.get("wf-3") is None
+        assert retention.get("wf-5").workflow_status()["workflow_id"] == "wf-5"
+        assert retention.get("wf-4").workflow_status()["workflow_id"] == "wf-4"
+        assert len(spill_path.read_text().splitlines()) <= 4
+        assert retention.stats()["compactions"] >= 1
+
+    def test_stale_spill_file_is_reset(self, tmp_path):
+        """Test a spill file left by a previous process is emptied on creation"""
+        spill_path = tmp_path / "spill.jsonl"
+        spill_path.write_text('["wf-old"]\n')
+
+        retention = WorkflowRetention(spill_path=str(spill_path))
+
+        assert spill_path.read_text() == ""
+        assert len(retention) == 0
+
+
+class TestOrchestratorRetention:
+    """Test suite for retention in an idle orchestrator"""
+
+    @pytest.mark.asyncio
+    async def test_idle_orchestrator_archives_by_age(self, sample_generation_request):
+        """Test max_age applies even when no other workflow finishes"""
+        orchestrator = CoreOrchestrator(OrchestratorConfig(retention_interval=0.01))
+        orchestrator.mcp_protocol = AsyncMock()
+        orchestrator.mcp_orchestrator = AsyncMock()
+        orchestrator.agent_registry = Mock()
+        orchestrator.agent_registry.list_agents.return_value = [
+            "architect_agent", "backend_agent", "frontend_agent", "devops_agent"
+        ]
+        orchestrator.mcp_orchestrator.execute_workflow.return_value = AsyncMock(
+            success=True, generated_files=[], metadata={}
+        )
+        await orchestrator.start()
+        result = await orchestrator.execute_project_generation(sample_generation_request)
+        assert result.workflow_id in orchestrator.project_states
+
+        orchestrator.retention.max_age = 0.01
+        await asyncio.sleep(0.05)
+        await orchestrator.stop()
+
+        assert result.workflow_id not in orchestrator.project_states
+        assert orchestrator.get_workflow_status(result.workflow_id)["archived"] is True
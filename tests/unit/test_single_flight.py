@@ -0,0 +1,113 @@
+# tests/unit/test_single_flight.py
+import asyncio
+import pytest
+from dataclasses import replace
+from unittest.mock import AsyncMock
+
+from genesis_core.orchestrator.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test suite for in-flight call coalescing"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """Test duplicates attach to the running call and get the same object"""
+        flight = SingleFlight()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return object()
+
+        results = await asyncio.gather(*(flight.run("key", work) for _ in range(5)))
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert flight.stats()["coalesced"] == 4
+        assert flight.coalescing_rate == 0.8
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_are_shared(self):
+        """Test every waiter sees the leader's exception"""
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.run("key", fail), flight.run("key", fail), return_exceptions=True
+        )
+
+        assert [str(result) for result in results] == ["boom", "boom"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_only_when_last_waiter_leaves(self):
+        """Test one caller giving up does not cancel work others wait for"""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "done"
+
+        leader = asyncio.ensure_future(flight.run("key", work))
+        follower = asyncio.ensure_future(flight.run("key", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await follower == "done"
+
+        # Sin nadie esperando, la ejecución compartida se cancela
+        release.clear()
+        orphan = asyncio.ensure_future(flight.run("other", work))
+        await asyncio.sleep(0)
+        shared = flight._flights["other"].task
+        orphan.cancel()
+        await asyncio.gather(orphan, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert shared.cancelled()
+        assert len(flight) == 0
+
+
+class TestOrchestratorCoalescing:
+    """Test suite for coalescing identical generation requests"""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_run_one_workflow(self, orchestrator, sample_generation_request):
+        """Test duplicate submissions share one workflow and result"""
+        orchestrator.agent_registry.list_agents.return_value = [
+            "architect_agent", "backend_agent", "frontend_agent", "devops_agent"
+        ]
+
+        async def execute_workflow(workflow_id, workflow_def):
+            await asyncio.sleep(0.01)
+            return AsyncMock(success=True, generated_files=["main.py"], metadata={})
+
+        orchestrator.mcp_orchestrator.execute_workflow.side_effect = execute_workflow
+        other_path = replace(sample_generation_request, output_path="/tmp/other")
+        other_callback = replace(sample_generation_request, callback_url="http://hooks/other")
+
+        results = await asyncio.gather(
+            orchestrator.execute_project_generation(sample_generation_request),
+            orchestrator.execute_project_generation(replace(sample_generation_request)),
+            orchestrator.execute_project_generation(other_path),
+            orchestrator.execute_project_generation(other_callback),
+        )
+
+        assert results[0] == results[1]
+        results[0].generated_files.append("mutated.py")
+        results[0].metadata["mutated"] = True
+        assert results[1].generated_files == ["main.py"]
+        assert "mutated" not in results[1].metadata
+        assert len({result.workflow_id for result in results}) == 3
+        assert orchestrator.mcp_orchestrator.execute_workflow.call_count == 3
+        metrics = orchestrator.get_metrics()
+        assert metrics["single_flight_coalesced"] == 1
+        assert metrics["workflows_executed"] == 3
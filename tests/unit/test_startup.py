@@ -0,0 +1,57 @@
+# tests/unit/test_startup.py
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from genesis_core.orchestrator.core_orchestrator import CoreOrchestrator
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def _run(*args):
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+    return subprocess.run(
+        [sys.executable, *args], cwd=ROOT, env=env, capture_output=True, text=True
+    )
+
+
+class TestStartup:
+    """Test suite for the lazy-import startup path"""
+
+    def test_construction_does_not_import_mcpturbo(self):
+        """Test CoreOrchestrator() leaves MCPturbo and the state backends unloaded"""
+        probe = (
+            "import json, sys\n"
+            "from genesis_core.orchestrator.core_orchestrator import CoreOrchestrator\n"
+            "imported = set(sys.modules)\n"
+            "CoreOrchestrator()\n"
+            "print(json.dumps([sorted(imported), sorted(sys.modules)]))\n"
+        )
+        completed = _run("-c", probe)
+        assert completed.returncode == 0, completed.stderr
+        imported, constructed = (
+            {name.split(".")[0] for name in names} for names in json.loads(completed.stdout)
+        )
+
+        assert not imported & {"mcpturbo", "pydantic", "sqlalchemy", "redis"}
+        assert not constructed & {"mcpturbo", "sqlalchemy", "redis"}
+
+    def test_mcpturbo_is_wired_lazily(self):
+        """Test MCPturbo attributes resolve on first use and keep assigned values"""
+        orchestrator = CoreOrchestrator()
+        assert "_mcp_protocol" not in orchestrator.__dict__
+
+        replacement = object()
+        orchestrator.agent_registry = replacement
+
+        assert orchestrator.agent_registry is replacement
+        assert orchestrator.mcp_protocol is orchestrator.mcp_protocol
+
+    def test_import_within_startup_budget(self):
+        """Test the startup benchmark's budget holds"""
+        completed = _run("-m", "benchmarks.startup", "--check", "--runs", "3")
+
+        assert completed.returncode == 0, completed.stdout + completed.stderr
@@ -0,0 +1,109 @@
+# tests/unit/test_tracing.py
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from genesis_core.orchestrator.tracing import WorkflowTrace
+
+
+def _trace():
+    tasks = [
+        SimpleNamespace(id="design_architecture", agent_id="architect_agent", dependencies=[]),
+        SimpleNamespace(id="generate_backend", agent_id="backend_agent",
+                        dependencies=["design_architecture"]),
+        SimpleNamespace(id="generate_frontend", agent_id="frontend_agent",
+                        dependencies=["design_architecture"]),
+        SimpleNamespace(id="setup_devops", agent_id="devops_agent",
+                        dependencies=["generate_backend", "generate_frontend"]),
+    ]
+    trace = WorkflowTrace.from_definition(SimpleNamespace(id="wf-1", tasks=tasks))
+    trace.started_at = 0.0
+    trace.start("design_architecture", 0.0)
+    trace.end("design_architecture", 2.0)
+    trace.start("generate_backend", 2.0)
+    trace.start("generate_frontend", 3.0)
+    trace.end("generate_frontend", 4.0)
+    trace.end("generate_backend", 7.0)
+    trace.start("setup_devops", 7.5)
+    trace.end("setup_devops", 8.0)
+    trace.finish(8.0)
+    return trace
+
+
+class TestWorkflowTrace:
+    """Test suite for per-task spans and critical path analysis"""
+
+    def test_critical_path_and_slack(self):
+        """Test the longest chain is reported with per-task slack"""
+        report = _trace().critical_path()
+
+        assert [step["task_id"] for step in report["path"]] == [
+            "design_architecture", "generate_backend", "setup_devops"
+        ]
+        assert report["duration"] == 8.0
+        assert report["queued_on_path"] == pytest.approx(0.5)
+        assert report["slack"]["generate_backend"] == pytest.approx(0.5)
+        assert report["slack"]["generate_frontend"] == pytest.approx(3.5)
+        assert report["slack"]["setup_devops"] == 0.0
+
+    def test_queue_time_inferred_from_dependencies(self):
+        """Test enqueue defaults to the end of the last dependency"""
+        trace = _trace()
+
+        assert trace.spans["generate_frontend"].queued == pytest.approx(1.0)
+        assert trace.spans["design_architecture"].queued == 0.0
+
+    def test_chrome_trace_export(self):
+        """Test Chrome trace events are JSON serializable complete events"""
+        events = _trace().to_chrome_trace()["traceEvents"]
+        json.dumps(events)
+
+        tasks = [event for event in events if event.get("cat") == "task"]
+        queued = [event for event in events if event.get("cat") == "queue"]
+        assert len(tasks) == 4
+        assert {event["name"] for event in queued} == {
+            "generate_frontend (queued)", "setup_devops (queued)"
+        }
+        backend = next(event for event in tasks if event["name"] == "generate_backend")
+        assert backend["ts"] == 2e6 and backend["dur"] == 5e6
+
+    def test_otlp_export(self):
+        """Test OTLP JSON has a root span and one child per task"""
+        spans = _trace().to_otlp()["resourceSpans"][0]["scopeSpans"][0]["spans"]
+
+        assert len(spans) == 5
+        assert all(len(span["traceId"]) == 32 for span in spans)
+        assert {span.get("parentSpanId") for span in spans[1:]} == {spans[0]["spanId"]}
+
+
+class TestOrchestratorTracing:
+    """Test suite for orchestrator trace capture"""
+
+    @pytest.mark.asyncio
+    async def test_trace_recorded_from_task_events(self, orchestrator, sample_generation_request):
+        """Test task broadcasts feed the workflow trace"""
+        mock_result = AsyncMock()
+        mock_result.success = True
+        mock_result.generated_files = []
+        mock_result.metadata = {}
+
+        async def execute_workflow(workflow_id, workflow_def):
+            for task in workflow_def.tasks:
+                event = {"workflow_id": workflow_id, "task_id": task.id}
+                await orchestrator._handle_task_started(event)
+                await orchestrator._handle_task_completed(event)
+            return mock_result
+
+        orchestrator.mcp_orchestrator.execute_workflow.side_effect = execute_workflow
+        orchestrator.agent_registry.list_agents.return_value = [
+            "architect_agent", "backend_agent", "frontend_agent", "devops_agent"
+        ]
+
+        result = await orchestrator.execute_project_generation(sample_generation_request)
+        report = orchestrator.get_critical_path(result.workflow_id)
+
+        assert report["path"][0]["task_id"] == "analyze_architecture"
+        assert report["path"][-1]["task_id"] == "setup_devops"
+        assert orchestrator.get_workflow_trace(result.workflow_id)["traceEvents"]
+        assert orchestrator.get_critical_path("missing") is None
@@ -0,0 +1,87 @@
+# tests/unit/test_validation.py
+import io
+import json
+import pytest
+from pydantic import ValidationError
+
+from genesis_core.config.validation import ConfigValidator
+
+
+VALID = {"name": "shop", "components": ["backend"], "features": ["billing"]}
+
+
+class TestConfigValidator:
+    """Test suite for cached and bulk ProjectConfig validation"""
+
+    def test_cache_is_keyed_by_canonical_json(self):
+        """Test key order does not defeat the cache"""
+        validator = ConfigValidator()
+        first = validator.validate(VALID)
+        second = validator.validate(dict(reversed(list(VALID.items()))))
+
+        assert second == first
+        assert validator.stats()["hits"] == 1
+        assert first.name == "shop"
+
+    def test_cache_hits_are_isolated_from_caller_mutations(self):
+        """Test mutating a returned config does not leak into later hits"""
+        validator = ConfigValidator()
+        first = validator.validate(VALID)
+        first.name = "mutated"
+        first.components.append("frontend")
+
+        second = validator.validate(VALID)
+
+        assert second.name == "shop"
+        assert [str(getattr(c, "value", c)) for c in second.components] == ["backend"]
+
+    def test_invalid_configs_are_cached_with_same_errors(self):
+        """Test repeated invalid configs raise the model's own messages"""
+        validator = ConfigValidator()
+        for _ in range(2):
+            with pytest.raises(ValidationError) as exc_info:
+                validator.validate({"name": "bad name!"})
+            assert "Name must be alphanumeric" in str(exc_info.value)
+
+        assert validator.stats() == {
+            "validated": 2, "hits": 1, "misses": 1, "invalid": 2, "size": 1
+        }
+
+    def test_cache_is_bounded(self):
+        """Test least recently used entries are evicted"""
+        validator = ConfigValidator(max_entries=2)
+        for name in ("a", "b", "c"):
+            validator.validate({"name": name})
+
+        assert validator.stats()["size"] == 2
+        validator.validate({"name": "a"})
+        assert validator.stats()["hits"] == 0
+
+    def test_validate_many_reports_each_item(self):
+        """Test bulk validation keeps going past invalid items"""
+        validator = ConfigValidator()
+        outcomes = list(validator.validate_many([VALID, {"name": "x", "components": []}]))
+
+        assert [outcome.valid for outcome in outcomes] == [True, False]
+        assert outcomes[1].index == 1
+        assert "At least one component is required" in outcomes[1].format()
+
+    def test_validate_jsonl_reports_line_numbers(self, tmp_path):
+        """Test JSONL errors point at the offending line"""
+        path = tmp_path / "configs.jsonl"
+        path.write_text("\n".join([
+            json.dumps(VALID),
+            "",
+            '{"name": "broken"',
+            json.dumps({"name": "api", "components": ["backend"], "stack": {"backend": None}}),
+        ]) + "\n")
+        validator = ConfigValidator()
+
+        outcomes = list(validator.validate_jsonl(str(path)))
+        from_lines = list(validator.validate_jsonl(io.StringIO(path.read_text())))
+
+        assert [(o.index, o.valid) for o in outcomes] == [(1, True), (3, False), (4, False)]
+        assert outcomes[1].errors[0]["type"] == "json_invalid"
+        assert "4: stack: " in outcomes[2].format()
+        assert "Backend stack required" in outcomes[2].format()
+        assert [o.valid for o in from_lines] == [o.valid for o in outcomes]
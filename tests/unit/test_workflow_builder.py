@@ -0,0 +1,98 @@
+# tests/unit/test_workflow_builder.py
+from genesis_core.orchestrator.workflow_builder import compile_workflow, workflow_key
+
+
+class TestWorkflowBuilder:
+    """Test suite for precompiled workflow templates"""
+
+    def test_compilation_is_cached_per_component_set(self, sample_project_config):
+        """Test the same (template, components) reuses the compiled DAG"""
+        template, components = workflow_key(sample_project_config)
+
+        first = compile_workflow(template, components)
+        second = compile_workflow(template, frozenset(reversed(sorted(components))))
+
+        assert first is second
+
+    def test_levels_and_topological_order(self):
+        """Test compiled DAG stores its level structure"""
+        compiled = compile_workflow("saas-basic", frozenset({"backend", "frontend"}))
+
+        assert compiled.levels == (
+            ("analyze_architecture",),
+            ("design_architecture",),
+            ("generate_backend", "generate_frontend"),
+            ("setup_devops",),
+        )
+        assert compiled.topological_order[0] == "analyze_architecture"
+        assert compiled.dependents("design_architecture") == (
+            "generate_backend", "generate_frontend", "setup_devops"
+        )
+
+    def test_depths_only_count_pending_dependencies(self):
+        """Test depths restart at zero for tasks whose dependencies are excluded"""
+        compiled = compile_workflow("saas-basic", frozenset({"backend", "frontend"}))
+
+        pending = ["generate_backend", "generate_frontend", "setup_devops"]
+
+        assert compiled.depths() == {
+            task_id: depth for depth, level in enumerate(compiled.levels) for task_id in level
+        }
+        assert compiled.depths(pending) == {
+            "generate_backend": 0, "generate_frontend": 0, "setup_devops": 1
+        }
+        assert compiled.depths(reversed(pending)) is compiled.depths(pending)
+
+    def test_bind_fills_request_params(self, sample_project_config):
+        """Test binding produces MCPturbo tasks with request params"""
+        compiled = compile_workflow(*workflow_key(sample_project_config))
+        config_dict = sample_project_config.to_dict()
+
+        workflow = compiled.bind(config_dict, "/tmp/out", "wf-1")
+        tasks = {task.id: task for task in workflow.tasks}
+
+        assert workflow.id == "wf-1"
+        assert tasks["analyze_architecture"].params["config"] == config_dict
+        assert tasks["generate_backend"].params == {
+            "architecture": "{{design_architecture.result}}",
+            "output_path": "/tmp/out/backend"
+        }
+        assert tasks["setup_devops"].dependencies == [
+            "design_architecture", "generate_backend", "generate_frontend"
+        ]
+
+    def test_bind_does_not_share_mutable_params(self, sample_project_config):
+        """Test each binding gets fresh params and dependency lists"""
+        compiled = compile_workflow(*workflow_key(sample_project_config))
+
+        first = compiled.bind({}, "/a", "wf-1")
+        first.tasks[-1].dependencies.append("extra")
+        first.tasks[-1].params["output_path"] = "mutated"
+        second = compiled.bind({}, "/b", "wf-2")
+
+        assert "extra" not in second.tasks[-1].dependencies
+        assert second.tasks[-1].params["output_path"] == "/b"
+
+    def test_bind_with_seeded_results_skips_tasks(self):
+        """Test seeded tasks are omitted and their results injected"""
+        compiled = compile_workflow("saas-basic", frozenset({"backend"}))
+
+        workflow = compiled.bind(
+            {}, "/tmp/out", "wf-1",
+            seeded_results={"analyze_architecture": "req", "design_architecture": "arch"}
+        )
+        tasks = {task.id: task for task in workflow.tasks}
+
+        assert set(tasks) == {"generate_backend", "setup_devops"}
+        assert tasks["generate_backend"].params["architecture"] == "arch"
+        assert tasks["generate_backend"].dependencies == []
+        assert tasks["setup_devops"].dependencies == ["generate_backend"]
+
+    def test_width_is_max_antichain(self):
+        """Test DAG width counts tasks that can run simultaneously"""
+        full = compile_workflow("saas-basic", frozenset({"backend", "frontend"}))
+        backend_only = compile_workflow("saas-basic", frozenset({"backend"}))
+
+        assert full.width() == 2
+        assert backend_only.width() == 1
+        assert full.agent_demand()["architect_agent"] == 1